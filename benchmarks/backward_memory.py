@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""Measures the peak memory consumption of backprop on the ImageNet models.
+
+For each model in ``examples/imagenet``, this script runs a forward pass
+followed by a backward pass on CPU and reports the peak amount of memory
+allocated during the iteration, with and without ``release_retained=True``.
+Allocations are traced by :mod:`tracemalloc`, which also tracks the buffers
+of NumPy arrays. The parameter arrays themselves are not included, while
+their gradients are.
+
+Example::
+
+    $ python benchmarks/backward_memory.py --batchsize 2
+
+"""
+from __future__ import print_function
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+import numpy
+
+import chainer
+
+
+_imagenet_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'imagenet')
+
+_models = [
+    ('alex', 'Alex'),
+    ('nin', 'NIN'),
+    ('googlenet', 'GoogLeNet'),
+    ('googlenetbn', 'GoogLeNetBN'),
+    ('resnet50', 'ResNet50'),
+]
+
+
+def measure(model, x, t, release_retained):
+    model.cleargrads()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        loss = model(x, t)
+        loss.backward(release_retained=release_retained)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure peak memory consumption of backprop')
+    parser.add_argument('--batchsize', '-B', type=int, default=2,
+                        help='Minibatch size')
+    parser.add_argument('--models', nargs='*',
+                        default=[name for name, _ in _models],
+                        help='Names of models to measure')
+    args = parser.parse_args()
+
+    sys.path.insert(0, _imagenet_dir)
+    chainer.config.type_check = False
+
+    print('{:<12} {:>14} {:>14} {:>10}'.format(
+        'model', 'default (MB)', 'release (MB)', 'reduction'))
+    for module_name, class_name in _models:
+        if module_name not in args.models:
+            continue
+        module = __import__(module_name)
+        model = getattr(module, class_name)()
+        x = numpy.random.uniform(
+            -1, 1, (args.batchsize, 3, model.insize, model.insize)
+        ).astype(numpy.float32)
+        t = numpy.random.randint(
+            0, 1000, size=(args.batchsize,)).astype(numpy.int32)
+
+        measure(model, x, t, False)  # initialize parameters
+        default = measure(model, x, t, False)
+        release = measure(model, x, t, True)
+        print('{:<12} {:>14.1f} {:>14.1f} {:>9.1f}%'.format(
+            module_name, default / 2 ** 20, release / 2 ** 20,
+            100 * (1 - float(release) / default)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""Micro-benchmark of the per-operation overhead of FunctionNode.apply.
+
+The benchmark applies a trivial function node to small arrays so that the
+measured time is dominated by the framework overhead rather than by the
+computation itself. Each configuration is measured with the full
+``apply`` path (type checking enabled, as in the default configuration) and
+with the fast path that is taken when no function hooks are registered and
+the debug mode, type checking and static graph optimizations are disabled.
+
+Example::
+
+    $ python benchmarks/function_node_apply.py --n-ops 100000
+
+"""
+from __future__ import print_function
+import argparse
+import timeit
+
+import numpy
+
+import chainer
+
+
+class Identity(chainer.FunctionNode):
+
+    def forward(self, inputs):
+        return inputs
+
+    def backward(self, indexes, grad_outputs):
+        return grad_outputs
+
+
+def measure(n_ops, n_repeat, n_inputs, type_check, enable_backprop):
+    xs = [chainer.Variable(numpy.zeros((1,), dtype=numpy.float32))
+          for _ in range(n_inputs)]
+
+    def run():
+        for _ in range(n_ops):
+            Identity().apply(xs)
+
+    with chainer.using_config('type_check', type_check), \
+            chainer.using_config('enable_backprop', enable_backprop):
+        run()  # warm-up
+        times = timeit.repeat(run, number=1, repeat=n_repeat)
+    return min(times) / n_ops
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the overhead of FunctionNode.apply')
+    parser.add_argument('--n-ops', type=int, default=20000,
+                        help='Number of function applications per repeat')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of repeats (the best one is reported)')
+    parser.add_argument('--n-inputs', type=int, default=2,
+                        help='Number of inputs of each function node')
+    args = parser.parse_args()
+
+    print('{:<16} {:>14} {:>14} {:>8}'.format(
+        'backprop', 'full (us/op)', 'fast (us/op)', 'speedup'))
+    for enable_backprop in (True, False):
+        full = measure(args.n_ops, args.repeat, args.n_inputs, True,
+                       enable_backprop)
+        fast = measure(args.n_ops, args.repeat, args.n_inputs, False,
+                       enable_backprop)
+        print('{:<16} {:>14.2f} {:>14.2f} {:>7.2f}x'.format(
+            str(enable_backprop), full * 1e6, fast * 1e6, full / fast))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""Measures steady-state training iterations of static graph models on CPU.
+
+For the models in ``examples/static_graph_optimizations``, this script runs
+a few training iterations to record the static schedule and then reports
+the average time of the following iterations, in which the schedule is
+replayed, together with the peak amount of memory allocated during one of
+them on top of the memory held before it. Allocations are traced by
+:mod:`tracemalloc`, which also tracks the buffers of NumPy arrays. For
+comparison, the same numbers are reported for the define-by-run code of the
+models, i.e. without the ``@static_graph`` decorator.
+
+Example::
+
+    $ python benchmarks/static_graph_replay.py --batchsize 8
+
+"""
+from __future__ import print_function
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy
+
+import chainer
+import chainer.links as L
+
+
+_examples_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'examples',
+    'static_graph_optimizations')
+
+
+def _vgg():
+    sys.path.insert(0, os.path.join(_examples_dir, 'cifar'))
+    import models.VGG
+    return models.VGG.VGG(10), (3, 32, 32), 10
+
+
+def _mlp():
+    sys.path.insert(0, os.path.join(_examples_dir, 'mnist'))
+    import train_mnist
+    return train_mnist.MLP(1000, 10), (784,), 10
+
+
+_models = [
+    ('vgg', _vgg),
+    ('mlp', _mlp),
+]
+
+
+def _define_by_run(predictor):
+    # Replace the decorated ``__call__`` with the original one.
+    cls = type(predictor)
+    predictor.__class__ = type(
+        cls.__name__, (cls,), {'__call__': cls.__call__.__wrapped__})
+
+
+def measure(create, static, batchsize, warmup, iterations):
+    predictor, in_shape, n_class = create()
+    if not static:
+        _define_by_run(predictor)
+    model = L.Classifier(predictor)
+    optimizer = chainer.optimizers.MomentumSGD()
+    optimizer.setup(model)
+    x = numpy.random.uniform(
+        -1, 1, (batchsize,) + in_shape).astype(numpy.float32)
+    t = numpy.random.randint(0, n_class, size=(batchsize,)).astype(
+        numpy.int32)
+
+    for _ in range(warmup):
+        optimizer.update(model, x, t)
+
+    gc.collect()
+    start = time.time()
+    for _ in range(iterations):
+        optimizer.update(model, x, t)
+    elapsed = (time.time() - start) / iterations
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        optimizer.update(model, x, t)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak - base
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure steady-state iterations of static graphs')
+    parser.add_argument('--batchsize', '-B', type=int, default=8,
+                        help='Minibatch size')
+    parser.add_argument('--warmup', type=int, default=3,
+                        help='Number of iterations before measurement')
+    parser.add_argument('--iterations', '-n', type=int, default=10,
+                        help='Number of iterations to measure')
+    parser.add_argument('--models', nargs='*',
+                        default=[name for name, _ in _models],
+                        help='Names of models to measure')
+    args = parser.parse_args()
+
+    chainer.config.type_check = False
+
+    print('{:<8} {:<14} {:>12} {:>16}'.format(
+        'model', 'mode', 'time (ms)', 'allocated (MB)'))
+    for name, create in _models:
+        if name not in args.models:
+            continue
+        for mode, static in (('static', True), ('define-by-run', False)):
+            elapsed, allocated = measure(
+                create, static, args.batchsize, args.warmup, args.iterations)
+            print('{:<8} {:<14} {:>12.1f} {:>16.2f}'.format(
+                name, mode, elapsed * 1000, allocated / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -26,6 +26,7 @@ from chainer import training  # NOQA
 from chainer._runtime_info import print_runtime_info  # NOQA
 from chainer.backends.cuda import should_use_cudnn  # NOQA
 from chainer.backends.cuda import should_use_cudnn_tensor_core  # NOQA
+from chainer.checkpointing import checkpoint  # NOQA
 from chainer.configuration import config  # NOQA
 from chainer.configuration import global_config  # NOQA
 from chainer.configuration import using_config  # NOQA
@@ -150,6 +151,8 @@ def is_arrays_compatible(arrays):
 global_config.debug = bool(int(os.environ.get('CHAINER_DEBUG', '0')))
 global_config.cudnn_deterministic = False
 global_config.enable_backprop = True
+global_config.graph_free = False
+global_config.in_recomputing = False
 global_config.keep_graph_on_report = bool(int(
     os.environ.get('CHAINER_KEEP_GRAPH_ON_REPORT', '0')))
 global_config.train = True
@@ -1,3 +1,5 @@
+import heapq
+
 import six
 
 import chainer
@@ -31,12 +33,20 @@ class GradTable(object):
     Args:
         load_if_new (bool): read ``grad_var`` of node when the node has not
             been added.
+        accumulate_inplace (bool): accumulate gradients into a buffer
+            allocated by the table in place. It must be ``False`` if the
+            computational graph of the accumulation is required, i.e., when
+            double backprop is enabled.
 
     """
 
-    def __init__(self, load_if_new=False):
+    def __init__(self, load_if_new=False, accumulate_inplace=False):
         self.grads = {}
         self._load_if_new = load_if_new
+        self._accumulate_inplace = accumulate_inplace
+        # Gradient variables allocated by this table keyed by their ids. They
+        # are not referenced from anywhere else until they are popped.
+        self._buffers = {}
 
     def __setitem__(self, node, grad):
         assert node is not None
@@ -59,19 +69,104 @@ class GradTable(object):
             return None
         grads = self.grads
         if node in grads:
-            return _reduce(grads.pop(node))
+            grad = self.reduce(grads.pop(node))
+            if self._buffers:
+                self._buffers.pop(id(grad), None)
+            return grad
         if self._load_if_new:
             return node.grad_var
         else:
             return None
 
+    def reduce(self, grad_list):
+        """Sums up the gradients in a list and stores the sum in the list.
+
+        If in-place accumulation is enabled, the gradients are summed up into
+        a buffer owned by the table, which is allocated only once per list.
+        It is not used while a static schedule is being recorded, because the
+        accumulation has to be included in the schedule as a function call.
+
+        """
+        if (len(grad_list) < 2 or not self._accumulate_inplace or
+                chainer.config.schedule_func is not None):
+            return _reduce(grad_list)
+
+        buf = grad_list[0]
+        arrays = [g.array for g in grad_list]
+        xp = chainer.backend.get_array_module(*arrays)
+        acc = arrays[0]
+        for a in arrays:
+            if (type(a) is not xp.ndarray or a.shape != acc.shape or
+                    a.dtype != acc.dtype):
+                # Let F.add raise an error or handle other array types.
+                self._buffers.pop(id(buf), None)
+                return _reduce(grad_list)
+
+        if id(buf) not in self._buffers:
+            acc = acc.copy()
+            buf = chainer.Variable(acc)
+            self._buffers[id(buf)] = buf
+        for a in arrays[1:]:
+            acc += a
+        grad_list[:] = [buf]
+        return buf
+
     def assert_no_grads(self):
         for gx in self.grads.values():
             assert gx == []
 
 
+class RetainedDataReleaser(object):
+
+    """Releases arrays retained for backprop as early as possible.
+
+    Function nodes are processed in the descending order of their ranks in the
+    backprop process. Every function node consuming a variable node has a rank
+    not smaller than that of the variable node, and its creator, which may
+    retain it as an output, has a rank smaller by one. Once a function node
+    with an even lower rank is processed, no function node of the ongoing
+    backprop reads the array retained by the variable node anymore.
+
+    After :meth:`add` is called for a function node whose backward
+    computation has finished, its retained output arrays are released
+    immediately, and the arrays retained by its input and output variable
+    nodes are released by :meth:`release` once all the function nodes that
+    may consume them have been processed. Shapes and dtypes of the variable
+    nodes are kept.
+
+    """
+
+    def __init__(self):
+        self._pending = []
+        self._count = 0
+
+    def _push(self, node):
+        if node is not None and node._data is not None:
+            # Negate since heapq is min-heap
+            heapq.heappush(self._pending, (-node.rank, self._count, node))
+            self._count += 1
+
+    def add(self, func):
+        if func._input_indexes_to_retain is not None:
+            inputs = func.inputs
+            for index in func._input_indexes_to_retain:
+                self._push(inputs[index])
+        if func._output_indexes_to_retain is not None:
+            outputs = func.outputs
+            for index in func._output_indexes_to_retain:
+                self._push(outputs[index]())
+        func._retained_output_data = None
+
+    def release(self, rank=-2):
+        pending = self._pending
+        while pending and -pending[0][0] > rank + 1:
+            node = heapq.heappop(pending)[2]
+            node._data = None
+
+
 def backprop_step(
-        func, target_input_indexes, grad_outputs, grad_inputs):
+        func, target_input_indexes, grad_outputs, grad_inputs,
+        grad_table=None):
     """Accumulates gradients of a FunctionNode
 
     This routine is used by :meth:`chainer.Variable.backward` and
@@ -85,6 +180,9 @@ def backprop_step(
             variables. If the gradient w.r.t. an output variable is not
             given, the corresponding element is ``None``.
         grad_inputs (dict): References of radients w.r.t. the input variables.
+        grad_table (GradTable): Gradient table holding ``grad_inputs``. If it
+            is given, the gradients are accumulated by
+            :meth:`GradTable.reduce`.
 
     """
     is_debug = chainer.is_debug()
@@ -172,5 +270,6 @@ def backprop_step(
                     .format(func.label))
 
     if not func.lazy_grad_sum:
+        reduce = _reduce if grad_table is None else grad_table.reduce
         for gx in grad_inputs.values():
-            _reduce(gx)
+            reduce(gx)
@@ -0,0 +1,133 @@
+import functools
+
+from chainer import configuration
+from chainer.functions.util import forget
+from chainer import link
+from chainer import sequential
+
+
+def _expand(layer):
+    if isinstance(layer, sequential.Sequential):
+        return [f for child in layer for f in _expand(child)]
+    functions = getattr(layer, 'functions', None)
+    if isinstance(layer, link.Link) and functions is not None:
+        return [f for funcs in functions.values() for child in funcs
+                for f in _expand(child)]
+    return [layer]
+
+
+def _get_layers(link_or_callable):
+    if isinstance(link_or_callable, (list, tuple)):
+        layers = link_or_callable
+    elif isinstance(link_or_callable, sequential.Sequential):
+        layers = list(link_or_callable)
+    elif isinstance(link_or_callable, link.ChainList):
+        layers = list(link_or_callable)
+    elif (isinstance(link_or_callable, link.Link) and
+            getattr(link_or_callable, 'functions', None) is not None):
+        layers = [f for funcs in link_or_callable.functions.values()
+                  for f in funcs]
+    elif callable(link_or_callable):
+        layers = [link_or_callable]
+    else:
+        raise TypeError(
+            'link_or_callable must be a callable or a list of callables, '
+            'but {} is given'.format(type(link_or_callable)))
+
+    for layer in layers:
+        if not callable(layer):
+            raise TypeError('{} is not callable'.format(type(layer)))
+    return [f for layer in layers for f in _expand(layer)]
+
+
+def _run_layers(layers, *x):
+    for layer in layers:
+        if isinstance(x, tuple):
+            x = layer(*x)
+        else:
+            x = layer(x)
+    return x
+
+
+def checkpoint(link_or_callable, segments=1):
+    """Returns a function that runs layers with gradient checkpointing.
+
+    Gradient checkpointing reduces the memory consumption of the backward
+    propagation at the cost of an additional forward computation. The layers
+    given by ``link_or_callable`` are split into ``segments`` contiguous
+    segments. In the forward propagation, only the inputs and the outputs of
+    the segments are kept, and the intermediate activations inside each
+    segment are recomputed in the backward propagation using
+    :func:`chainer.functions.forget`. The last segment is computed in the
+    usual way since its activations are used right away in the backward
+    propagation. Splitting ``N`` layers into about ``sqrt(N)`` segments makes
+    the memory consumption grow as ``O(sqrt(N))``.
+
+    The layers are applied in the same way as :class:`~chainer.Sequential`,
+    i.e., if a layer returns a tuple, its elements are passed to the next
+    layer as separate arguments. The following objects are accepted as
+    ``link_or_callable``.
+
+    - :class:`~chainer.Sequential`: its layers are used.
+    - :class:`~chainer.ChainList`: its child links are applied in order.
+    - A link having the ``functions`` attribute of an ordered dictionary of
+      lists of callables, such as the models in
+      :mod:`chainer.links.model.vision`: all the callables are applied in
+      order and the output of the last one is returned (e.g., the
+      probabilities for :class:`~chainer.links.ResNet50Layers`).
+    - A list or a tuple of callables.
+    - Any other callable, which is treated as a single layer.
+
+    Layers that are :class:`~chainer.Sequential` or links having the
+    ``functions`` attribute (e.g., the building blocks of ResNets) are
+    further split into their own layers.
+
+    The random numbers drawn from NumPy's and CuPy's random number generators
+    (e.g., in :func:`~chainer.functions.dropout`) are reproduced in the
+    recomputation. See :func:`chainer.functions.forget` for the details and
+    limitations.
+
+    .. admonition:: Example
+
+       >>> model = chainer.Sequential(
+       ...     L.Linear(3, 4), F.relu, L.Linear(4, 4), F.relu,
+       ...     L.Linear(4, 2))
+       >>> x = np.ones((1, 3), np.float32)
+       >>> y = chainer.checkpoint(model, segments=2)(x)
+       >>> y.shape
+       (1, 2)
+
+    Args:
+        link_or_callable: Layers to run. See above for the accepted objects.
+        segments (int): Number of segments.
+
+    Returns:
+        callable: A function that takes the input variables of the first
+        layer and returns the output of the last layer. If backprop is
+        disabled when it is called, the layers are simply applied without
+        checkpointing.
+
+    """
+    if segments < 1:
+        raise ValueError('segments must be positive: {}'.format(segments))
+    layers = _get_layers(link_or_callable)
+    if not layers:
+        raise ValueError('no layers to run')
+
+    n_layers = len(layers)
+    segments = min(segments, n_layers)
+    bounds = [n_layers * i // segments for i in range(segments + 1)]
+    funcs = [functools.partial(_run_layers, layers[begin:end])
+             for begin, end in zip(bounds[:-1], bounds[1:])]
+
+    def run(*xs):
+        if not configuration.config.enable_backprop:
+            return _run_layers(layers, *xs)
+
+        for func in funcs[:-1]:
+            xs = forget.forget(func, *xs)
+            if not isinstance(xs, tuple):
+                xs = xs,
+        return funcs[-1](*xs)
+
+    return run
@@ -1,8 +1,21 @@
 import contextlib
+import itertools
 import sys
 import threading
 
 
+# Counter bumped on every configuration change. Code that derives a decision
+# from several configuration entries can cache it together with
+# ``_version`` and recompute it only when the value changes.
+_version_counter = itertools.count(1)
+_version = 0
+
+
+def _bump_version():
+    global _version
+    _version = next(_version_counter)
+
+
 class GlobalConfig(object):
 
     """The plain object that represents the global configuration of Chainer."""
@@ -21,6 +34,14 @@ class GlobalConfig(object):
         keys = sorted(self.__dict__)
         _print_attrs(self, keys, file)
 
+    def __delattr__(self, name):
+        super(GlobalConfig, self).__delattr__(name)
+        _bump_version()
+
+    def __setattr__(self, name, value):
+        super(GlobalConfig, self).__setattr__(name, value)
+        _bump_version()
+
 
 class LocalConfig(object):
 
@@ -39,6 +60,7 @@ class LocalConfig(object):
 
     def __delattr__(self, name):
         delattr(self._local, name)
+        _bump_version()
 
     def __getattr__(self, name):
         if hasattr(self._local, name):
@@ -47,6 +69,7 @@ class LocalConfig(object):
 
     def __setattr__(self, name, value):
         setattr(self._local, name, value)
+        _bump_version()
 
     def show(self, file=sys.stdout):
         """show(file=sys.stdout)
@@ -1,8 +1,10 @@
 # import classes and functions
 from chainer.dataset.convert import concat_examples  # NOQA
 from chainer.dataset.convert import ConcatWithAsyncTransfer  # NOQA
+from chainer.dataset.convert import ConcatWithBufferPool  # NOQA
 from chainer.dataset.convert import to_device  # NOQA
 from chainer.dataset.dataset_mixin import DatasetMixin  # NOQA
+from chainer.dataset.dataset_mixin import get_examples  # NOQA
 from chainer.dataset.download import cache_or_load_file  # NOQA
 from chainer.dataset.download import cached_download  # NOQA
 from chainer.dataset.download import get_dataset_directory  # NOQA
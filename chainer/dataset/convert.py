@@ -164,12 +164,17 @@ def _concat_arrays(arrays, padding):
         return xp.concatenate([array[None] for array in arrays])
 
 
-def _concat_arrays_with_padding(arrays, padding):
+def _get_padded_shape(arrays):
+    # Returns the minimum shape that all arrays can be substituted to.
     shape = numpy.array(arrays[0].shape, dtype=int)
     for array in arrays[1:]:
         if numpy.any(shape != array.shape):
             numpy.maximum(shape, array.shape, shape)
-    shape = tuple(numpy.insert(shape, 0, len(arrays)))
+    return tuple(int(dim) for dim in shape)
+
+
+def _concat_arrays_with_padding(arrays, padding):
+    shape = (len(arrays),) + _get_padded_shape(arrays)
 
     xp = backend.get_array_module(arrays[0])
     with cuda.get_device_from_array(arrays[0]):
@@ -182,6 +187,165 @@ def _concat_arrays_with_padding(arrays, padding):
     return result
 
 
+class ConcatWithBufferPool(object):
+
+    """Converter that concatenates examples into arrays reused across calls.
+
+    This converter returns the same arrays as
+    :func:`~chainer.dataset.concat_examples`, but the arrays are taken from a
+    pool instead of being allocated in every call. For each field, the shape
+    and dtype of the output are computed once per batch, and the examples are
+    copied into the output by slice assignment. With ``padding``, the output
+    is filled with the padding value first only if the examples differ in
+    shape.
+
+    The pool keeps the ``n_buffers`` arrays most recently returned for each
+    field and device, and an array is reused if it has the shape and dtype of
+    the batch. When the batch is sent to a GPU, it is first concatenated into
+    a pooled array in host memory, which is page-locked if ``pinned`` is
+    ``True``, and then copied into a pooled GPU array.
+
+    An instance of this class is mainly intended to be used as a converter
+    function of an updater like below.
+
+    .. doctest::
+
+        from chainer.dataset import convert
+        ...
+        updater = chainer.training.updaters.StandardUpdater(
+                       ...,
+                       converter=convert.ConcatWithBufferPool(),
+                       ...)
+
+    .. note::
+
+       The arrays returned by a call are overwritten by the ``n_buffers``-th
+       call after it. Copy them if they are needed for longer.
+
+    Args:
+        n_buffers (int): Number of arrays kept for each field and device.
+        pinned (bool): If ``True``, the batches sent to a GPU are
+            concatenated in page-locked host memory.
+
+    """
+
+    def __init__(self, n_buffers=2, pinned=True):
+        self.n_buffers = n_buffers
+        self.pinned = pinned
+        self._pool = collections.defaultdict(collections.deque)
+
+    def __call__(self, batch, device=None, padding=None):
+        """Concatenates a list of examples into array(s).
+
+        See also :func:`chainer.dataset.concat_examples`.
+
+        Args:
+            batch (list): A list of examples.
+            device (int): Device ID to which each array is sent.
+            padding: Scalar value for extra elements.
+
+        Returns:
+            Array, a tuple of arrays, or a dictionary of arrays.
+            The type depends on the type of each example in the batch.
+        """
+        if len(batch) == 0:
+            raise ValueError('batch is empty')
+        first_elem = batch[0]
+
+        if isinstance(first_elem, tuple):
+            if not isinstance(padding, tuple):
+                padding = [padding] * len(first_elem)
+            return tuple(
+                self._concat(i, [example[i] for example in batch],
+                             padding[i], device)
+                for i in six.moves.range(len(first_elem)))
+
+        elif isinstance(first_elem, dict):
+            if not isinstance(padding, dict):
+                padding = {key: padding for key in first_elem}
+            return {key: self._concat(key, [example[key] for example in batch],
+                                      padding[key], device)
+                    for key in first_elem}
+
+        else:
+            return self._concat(None, batch, padding, device)
+
+    def _concat(self, key, arrays, padding, device):
+        if not isinstance(arrays[0], numpy.ndarray) and\
+           not isinstance(arrays[0], cuda.ndarray):
+            # The examples of built-in types are converted at once, and
+            # need no padding.
+            arrays = numpy.asarray(arrays)
+
+        if isinstance(arrays, numpy.ndarray):
+            shape = arrays.shape
+            dtype = arrays.dtype
+        else:
+            dtype = numpy.result_type(*[array.dtype for array in arrays])
+            if padding is None:
+                shape = arrays[0].shape
+                for array in arrays:
+                    if array.shape != shape:
+                        raise ValueError(
+                            'shape mismatch: {} and {}'.format(
+                                shape, array.shape))
+            else:
+                shape = _get_padded_shape(arrays)
+            shape = (len(arrays),) + shape
+
+        if isinstance(arrays, numpy.ndarray) or\
+           isinstance(arrays[0], numpy.ndarray):
+            to_gpu = device is not None and device >= 0
+            result = self._get_array(
+                (key, -1), shape, dtype, to_gpu and self.pinned)
+            self._copy(arrays, result, padding)
+            if to_gpu:
+                host_result = result
+                with cuda.get_device_from_id(device):
+                    result = self._get_array((key, device), shape, dtype)
+                    result.set(host_result)
+            return result
+
+        with cuda.get_device_from_array(arrays[0]):
+            result = self._get_array(
+                (key, arrays[0].device.id), shape, dtype)
+            self._copy(arrays, result, padding)
+        return to_device(device, result)
+
+    def _get_array(self, pool_key, shape, dtype, pinned=False):
+        # Takes the oldest array of the pool if all `n_buffers` arrays are
+        # allocated, and allocates a new one if it does not match.
+        arrays = self._pool[pool_key]
+        array = None
+        if len(arrays) >= self.n_buffers:
+            array = arrays.popleft()
+            if array.shape != shape or array.dtype != dtype:
+                array = None
+        if array is None:
+            device_id = pool_key[1]
+            if device_id >= 0:
+                array = cuda.cupy.empty(shape, dtype)
+            elif pinned:
+                size = int(numpy.prod(shape))
+                mem = cuda.cupy.cuda.alloc_pinned_memory(
+                    size * numpy.dtype(dtype).itemsize)
+                array = numpy.frombuffer(mem, dtype, size).reshape(shape)
+            else:
+                array = numpy.empty(shape, dtype)
+        arrays.append(array)
+        return array
+
+    def _copy(self, arrays, result, padding):
+        if isinstance(arrays, numpy.ndarray):
+            result[...] = arrays
+            return
+        if padding is not None and any(
+                array.shape != result.shape[1:] for array in arrays):
+            result.fill(padding)
+        for i, array in enumerate(arrays):
+            result[(i,) + tuple(slice(dim) for dim in array.shape)] = array
+
+
 class ConcatWithAsyncTransfer(object):
 
     """Interface to concatenate data and transfer them to GPU asynchronously.
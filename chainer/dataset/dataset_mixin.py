@@ -11,6 +11,10 @@ class DatasetMixin(object):
     combines the results into a list. This mixin makes it easy to implement a
     new dataset that does not support efficient slicing.
 
+    A dataset that reads multiple examples faster at once can override
+    :meth:`get_examples`, which is used for the indexing with a slice or
+    indices, and by the iterators to read each batch.
+
     Dataset implementation using DatasetMixin still has to provide the
     :meth:`__len__` operator explicitly.
 
@@ -20,9 +24,10 @@ class DatasetMixin(object):
         """Returns an example or a sequence of examples.
 
         It implements the standard Python indexing and one-dimensional integer
-        array indexing. It uses the :meth:`get_example` method by default, but
-        it may be overridden by the implementation to, for example, improve the
-        slicing performance.
+        array indexing. It uses the :meth:`get_example` method for an integer
+        index, and the :meth:`get_examples` method otherwise. The latter may be
+        overridden by the implementation to, for example, improve the slicing
+        performance.
 
         Args:
             index (int, slice, list or numpy.ndarray): An index of an example
@@ -59,10 +64,10 @@ class DatasetMixin(object):
         """
         if isinstance(index, slice):
             current, stop, step = index.indices(len(self))
-            return [self.get_example(i) for i in
-                    six.moves.range(current, stop, step)]
+            return self.get_examples(
+                list(six.moves.range(current, stop, step)))
         elif isinstance(index, list) or isinstance(index, numpy.ndarray):
-            return [self.get_example(i) for i in index]
+            return self.get_examples(index)
         else:
             return self.get_example(index)
 
@@ -84,3 +89,44 @@ class DatasetMixin(object):
 
         """
         raise NotImplementedError
+
+    def get_examples(self, indices):
+        """Returns the examples of given indices.
+
+        The default implementation calls :meth:`get_example` for each index.
+        Implementations may override it to read the examples at once.
+
+        Args:
+            indices (list or numpy.ndarray): One-dimensional integer indices
+                of the examples.
+
+        Returns:
+            list: The examples in the order of ``indices``.
+
+        """
+        return [self.get_example(i) for i in indices]
+
+
+def get_examples(dataset, indices):
+    """Returns the examples of given indices from any dataset.
+
+    This function uses :meth:`DatasetMixin.get_examples` if the dataset
+    provides it, and reads an array dataset with one indexing. Otherwise, the
+    examples are read one by one with ``dataset[i]``. The iterators use this
+    function to read each batch.
+
+    Args:
+        dataset: Dataset to read the examples from.
+        indices (list or numpy.ndarray): One-dimensional integer indices of
+            the examples.
+
+    Returns:
+        list: The examples in the order of ``indices``.
+
+    """
+    if isinstance(dataset, numpy.ndarray):
+        return list(dataset[numpy.asarray(indices, dtype=numpy.intp)])
+    read = getattr(dataset, 'get_examples', None)
+    if read is not None:
+        return read(indices)
+    return [dataset[i] for i in indices]
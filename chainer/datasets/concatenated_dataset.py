@@ -1,3 +1,6 @@
+import numpy
+import six
+
 from chainer.dataset import dataset_mixin
 
 
@@ -30,3 +33,23 @@ class ConcatenatedDataset(dataset_mixin.DatasetMixin):
                 return dataset[i]
             i -= len(dataset)
         raise IndexError
+
+    def get_examples(self, indices):
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+        lengths = [len(dataset) for dataset in self._datasets]
+        ends = numpy.cumsum(lengths)
+        n = sum(lengths)
+        if indices.size and (indices.min() < 0 or indices.max() >= n):
+            raise IndexError
+        # The examples are read from each dataset at once.
+        which = numpy.searchsorted(ends, indices, side='right')
+        examples = [None] * len(indices)
+        for k, dataset in enumerate(self._datasets):
+            positions = numpy.flatnonzero(which == k)
+            if len(positions) == 0:
+                continue
+            batch = dataset_mixin.get_examples(
+                dataset, indices[positions] - (ends[k] - lengths[k]))
+            for position, example in six.moves.zip(positions, batch):
+                examples[position] = example
+        return examples
@@ -1,5 +1,7 @@
 import six
 
+from chainer.dataset import dataset_mixin
+
 
 class DictDataset(object):
 
@@ -39,3 +41,22 @@ class DictDataset(object):
 
     def __len__(self):
         return self._length
+
+    def get_examples(self, indices):
+        """Returns the examples of given indices.
+
+        The examples of each underlying dataset are read at once, e.g., with
+        one indexing if it is an array.
+
+        Args:
+            indices (list or numpy.ndarray): One-dimensional integer indices
+                of the examples.
+
+        Returns:
+            list: The dictionaries of examples in the order of ``indices``.
+
+        """
+        batches = {key: dataset_mixin.get_examples(dataset, indices)
+                   for key, dataset in six.iteritems(self._datasets)}
+        return [{key: batch[i] for key, batch in six.iteritems(batches)}
+                for i in six.moves.range(len(indices))]
@@ -0,0 +1,322 @@
+import json
+import os
+
+import numpy
+import six
+
+from chainer.dataset import dataset_mixin
+
+
+_META_FILE = 'meta.json'
+_VERSION = 1
+
+
+def _column_path(path, i, kind):
+    return os.path.join(path, 'column{}.{}'.format(i, kind))
+
+
+class MemmapDatasetWriter(object):
+
+    """Writer class that makes MemmapDataset.
+
+    To make :class:`MemmapDataset`, a user needs to write the examples with
+    :class:`MemmapDatasetWriter`. Each example must be an array, a tuple of
+    arrays or a dictionary of arrays, and all examples must have the same
+    structure. Scalars are written as arrays of zero dimensions. The dtype of
+    each field is determined by the first example, and the values of the
+    other examples are cast to it.
+
+    The writer makes a directory that contains one file of raw data for each
+    field. If all examples have the same shape in a field, the field is
+    stored with a fixed stride. Otherwise, the offsets and the shapes of the
+    examples are also stored. The format of the dataset is written when the
+    writer is closed.
+
+    Args:
+        path (str): Path to a directory to make. It must not exist, or be
+            empty.
+
+    .. seealso: chainer.datasets.MemmapDataset
+
+    """
+
+    def __init__(self, path):
+        if not os.path.exists(path):
+            os.makedirs(path)
+        elif os.listdir(path):
+            raise ValueError('directory is not empty: {}'.format(path))
+        self._path = path
+        self._kind = None
+        self._keys = None
+        self._dtypes = None
+        self._shapes = None
+        self._files = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, x):
+        if isinstance(x, tuple):
+            kind, keys, values = 'tuple', None, x
+        elif isinstance(x, dict):
+            kind = 'dict'
+            keys = sorted(x)
+            values = [x[key] for key in keys]
+        else:
+            kind, keys, values = 'array', None, (x,)
+
+        if self._files is None:
+            self._kind = kind
+            self._keys = keys
+            self._dtypes = [numpy.asarray(value).dtype for value in values]
+            for dtype in self._dtypes:
+                if dtype.hasobject:
+                    raise ValueError('objects cannot be written to '
+                                     'MemmapDataset')
+            self._shapes = [[] for _ in values]
+            self._files = [open(_column_path(self._path, i, 'bin'), 'wb')
+                           for i in six.moves.range(len(values))]
+        elif kind != self._kind or keys != self._keys or\
+                len(values) != len(self._files):
+            raise ValueError('the structure of the example differs from the '
+                             'first one')
+
+        for value, dtype, shapes, f in six.moves.zip(
+                values, self._dtypes, self._shapes, self._files):
+            value = numpy.asarray(value, dtype)
+            f.write(value.tobytes())
+            shapes.append(value.shape)
+
+    def flush(self):
+        if self._files is not None:
+            for f in self._files:
+                f.flush()
+
+    def close(self):
+        """Closes the files and writes the format of the dataset."""
+        if self._closed:
+            return
+        self._closed = True
+        columns = []
+        if self._files is not None:
+            for i, f in enumerate(self._files):
+                f.close()
+                shapes = self._shapes[i]
+                column = {'dtype': self._dtypes[i].str}
+                if all(shape == shapes[0] for shape in shapes):
+                    column['shape'] = list(shapes[0])
+                else:
+                    # Offsets of the examples in elements, and their shapes.
+                    shapes = numpy.array(shapes, dtype=numpy.int64)
+                    sizes = shapes.prod(axis=1)
+                    offsets = numpy.zeros(len(sizes) + 1, dtype=numpy.int64)
+                    numpy.cumsum(sizes, out=offsets[1:])
+                    offsets.tofile(_column_path(self._path, i, 'offsets'))
+                    shapes.tofile(_column_path(self._path, i, 'shapes'))
+                    column['shape'] = None
+                    column['ndim'] = shapes.shape[1]
+                columns.append(column)
+        meta = {
+            'version': _VERSION,
+            'length': len(self._shapes[0]) if self._shapes else 0,
+            'kind': self._kind or 'tuple',
+            'keys': self._keys,
+            'columns': columns,
+        }
+        with open(os.path.join(self._path, _META_FILE), 'w') as f:
+            json.dump(meta, f)
+
+
+class MemmapDataset(dataset_mixin.DatasetMixin):
+
+    """Dataset of arrays stored in memory-mapped files.
+
+    This dataset reads a directory made by :class:`MemmapDatasetWriter`.
+    Each field of the examples is mapped to memory with :class:`numpy.memmap`
+    instead of being read, so that a dataset larger than the memory can be
+    used, and the examples read repeatedly are served from the page cache of
+    the OS.
+
+    An example is returned in the same structure as it was written, i.e.,
+    an array, a tuple of arrays or a dictionary of arrays. The arrays of a
+    single example are read-only views of the files. Indexing with a slice
+    or an array of indices returns a list of examples as other datasets,
+    while the arrays are read with one fancy indexing for each field of
+    fixed shape. The iterators read the batches in the same way through
+    :meth:`get_examples`. :meth:`get_batch` returns the arrays of the examples
+    stacked for each field instead.
+
+    The dataset can be passed to worker processes, e.g., of
+    :class:`~chainer.iterators.MultiprocessIterator`. The files are mapped
+    again in each process instead of the data being copied.
+
+    .. testsetup::
+
+        import shutil
+        import tempfile
+        path_to_data = tempfile.mkdtemp()
+        shutil.rmtree(path_to_data)
+
+    >>> with chainer.datasets.MemmapDatasetWriter(path_to_data) as w:
+    ...     w.write((numpy.array([1, 2], 'f'), 0))
+    ...     w.write((numpy.array([3, 4], 'f'), 1))
+    ...
+    >>> dataset = chainer.datasets.MemmapDataset(path_to_data)
+    >>> x, t = dataset[1]
+    >>> print(x, t)
+    [3. 4.] 1
+    >>> x, t = dataset.get_batch([1, 0])
+    >>> print(x.shape, t)
+    (2, 2) [1 0]
+
+    .. testcleanup::
+
+        shutil.rmtree(path_to_data)
+
+    Args:
+        path (str): Path to a directory made by
+            :class:`MemmapDatasetWriter`.
+
+    """
+
+    def __init__(self, path):
+        with open(os.path.join(path, _META_FILE)) as f:
+            meta = json.load(f)
+        if meta['version'] != _VERSION:
+            raise ValueError(
+                'unsupported version of MemmapDataset: {}'.format(
+                    meta['version']))
+        self._path = path
+        self._meta = meta
+        self._length = meta['length']
+        self._kind = meta['kind']
+        self._keys = meta['keys']
+        self._open()
+
+    def _open(self):
+        n = self._length
+        self._columns = []
+        for i, column in enumerate(self._meta['columns']):
+            dtype = numpy.dtype(column['dtype'])
+            if column['shape'] is not None:
+                shape = (n,) + tuple(column['shape'])
+                data = self._map(_column_path(self._path, i, 'bin'),
+                                 dtype, shape)
+                self._columns.append((data, None, None))
+            else:
+                offsets = self._map(_column_path(self._path, i, 'offsets'),
+                                    numpy.int64, (n + 1,))
+                shapes = self._map(_column_path(self._path, i, 'shapes'),
+                                   numpy.int64, (n, column['ndim']))
+                data = self._map(_column_path(self._path, i, 'bin'),
+                                 dtype, (int(offsets[-1]),))
+                self._columns.append((data, offsets, shapes))
+
+    @staticmethod
+    def _map(path, dtype, shape):
+        if numpy.prod(shape) == 0:
+            # An empty file cannot be mapped.
+            return numpy.empty(shape, dtype)
+        # The arrays taken from a memmap are of the subclass, even if they
+        # are copies; a plain view is used instead.
+        return numpy.asarray(numpy.memmap(path, dtype, 'r', shape=shape))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_columns']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            index = numpy.arange(*index.indices(len(self)))
+        elif not isinstance(index, (list, numpy.ndarray)):
+            return self.get_example(index)
+        return self.get_examples(index)
+
+    def get_example(self, i):
+        if i < -self._length or i >= self._length:
+            raise IndexError('index {} is out of bounds for dataset of '
+                             'size {}'.format(i, self._length))
+        if i < 0:
+            i += self._length
+        values = []
+        for data, offsets, shapes in self._columns:
+            if offsets is None:
+                values.append(data[i])
+            else:
+                values.append(data[offsets[i]:offsets[i + 1]].reshape(
+                    tuple(shapes[i])))
+        return self._pack(values)
+
+    def get_examples(self, indices):
+        """Returns the examples of given indices.
+
+        Each field of fixed shape is read with one fancy indexing.
+
+        Args:
+            indices (list or numpy.ndarray): One-dimensional integer indices
+                of the examples.
+
+        Returns:
+            list: The examples in the order of ``indices``.
+
+        """
+        batch = self._get_fields(indices)
+        return [self._pack([field[i] for field in batch])
+                for i in six.moves.range(len(indices))]
+
+    def get_batch(self, indices):
+        """Returns the arrays of examples stacked for each field.
+
+        Each field of fixed shape is read with one fancy indexing, and is
+        returned as an array whose first axis corresponds to ``indices``.
+        The arrays of a field of variable shapes cannot be stacked, and are
+        returned as a list.
+
+        Args:
+            indices (slice, list or numpy.ndarray): Indices of the examples.
+
+        Returns:
+            An array, a list of arrays, or a tuple or a dictionary of them,
+            in the same structure as the examples.
+
+        """
+        if isinstance(indices, slice):
+            indices = numpy.arange(*indices.indices(len(self)))
+        return self._pack(self._get_fields(indices))
+
+    def _get_fields(self, indices):
+        n = self._length
+        indices = numpy.asarray(indices, dtype=numpy.int64)
+        if indices.size and (indices.min() < -n or indices.max() >= n):
+            raise IndexError('indices are out of bounds for dataset of '
+                             'size {}'.format(n))
+        indices = numpy.where(indices < 0, indices + n, indices)
+        fields = []
+        for data, offsets, shapes in self._columns:
+            if offsets is None:
+                fields.append(data[indices])
+            else:
+                fields.append([
+                    data[offsets[i]:offsets[i + 1]].reshape(tuple(shapes[i]))
+                    for i in indices])
+        return fields
+
+    def _pack(self, values):
+        if self._kind == 'tuple':
+            return tuple(values)
+        elif self._kind == 'dict':
+            return dict(six.moves.zip(self._keys, values))
+        else:
+            return values[0]
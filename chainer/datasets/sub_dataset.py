@@ -75,6 +75,20 @@ class SubDataset(dataset_mixin.DatasetMixin):
             index = self._order[index]
         return self._dataset[index]
 
+    def get_examples(self, indices):
+        n = self._size
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+        if indices.size and (indices.min() < -n or indices.max() >= n):
+            raise IndexError('dataset index out of range')
+        indices = numpy.where(
+            indices >= 0, self._start + indices, self._finish + indices)
+        if self._order is not None:
+            if isinstance(self._order, numpy.ndarray):
+                indices = self._order[indices]
+            else:
+                indices = [self._order[index] for index in indices]
+        return dataset_mixin.get_examples(self._dataset, indices)
+
 
 def split_dataset(dataset, split_at, order=None):
     """Splits a dataset into two subsets.
@@ -1,12 +1,24 @@
+import codecs
+import hashlib
 import io
+import locale
+import os
 import sys
+import tempfile
 import threading
 
+import numpy
 import six
 
 from chainer.dataset import dataset_mixin
 
 
+# Encodings in which the byte offsets of lines are the positions returned by
+# ``tell`` of a text file, and a newline byte is always a newline.
+_SCANNABLE_ENCODINGS = ('ascii', 'iso8859-1', 'utf-8', 'utf-8-sig')
+_SCAN_CHUNK_SIZE = 16 * 1024 * 1024
+
+
 class TextDataset(dataset_mixin.DatasetMixin):
 
     """Dataset of a line-oriented text file.
@@ -22,6 +34,15 @@ class TextDataset(dataset_mixin.DatasetMixin):
         that case you are responsible to guarantee that files are not
         modified after the cache has built.
 
+    The cache of each file is built by searching the file for newline bytes
+    if its encoding is ASCII, Latin-1 or UTF-8, and by reading each line
+    otherwise. If ``index_dir`` is given, the cache is saved to a file in the
+    directory, and is memory-mapped when a dataset of the same file is
+    constructed or unpickled later, e.g., in worker processes of
+    :class:`~chainer.iterators.MultiprocessIterator`. The saved cache is
+    identified by the path, the size and the modification time of the text
+    file, so that it is built again if the file is modified.
+
     Args:
         paths (str or list of str):
             Path to the text file(s).
@@ -54,12 +75,15 @@ class TextDataset(dataset_mixin.DatasetMixin):
             the number of files. Arguments are lines loaded from each file.
             The filter function must return True to accept the line, or
             return False to skip the line.
+        index_dir (str):
+            Directory to save the cache of line boundaries to. If it is
+            ``None``, the cache is not saved.
 
     """
 
     def __init__(
             self, paths, encoding=None, errors=None, newline=None,
-            filter_func=None):
+            filter_func=None, index_dir=None):
         if isinstance(paths, six.string_types):
             paths = [paths]
         elif len(paths) == 0:
@@ -81,33 +105,31 @@ class TextDataset(dataset_mixin.DatasetMixin):
         self._encoding = encoding
         self._errors = errors
         self._newline = newline
+        self._index_dir = index_dir
         self._fps = None
 
         self._open()
 
         # Line number is 0-origin.
-        # `lines` is a list of line numbers not filtered; if no filter_func is
-        # given, it is range(linenum)).
-        # `bounds` is a list of cursor positions of line boundaries for each
-        # file, i.e. i-th line of k-th file starts at `bounds[k][i]`.
-        linenum = 0
-        lines = []
-        bounds = tuple([[0] for _ in self._fps])
-        while True:
-            data = [fp.readline() for fp in self._fps]
-            if not all(data):  # any of files reached EOF
-                if any(data):  # not all files reached EOF
-                    raise ValueError(
-                        'number of lines in files does not match')
-                break
-            for i, fp in enumerate(self._fps):
-                bounds[i].append(fp.tell())
-            if filter_func is not None and filter_func(*data):
-                lines.append(linenum)
-            linenum += 1
+        # `lines` is an array of line numbers not filtered; if no filter_func
+        # is given, it is range(linenum)).
+        # `bounds` is a tuple of arrays of cursor positions of line boundaries
+        # for each file, i.e. i-th line of k-th file starts at `bounds[k][i]`.
+        bounds = tuple([self._load_bounds(k)
+                        for k in six.moves.range(len(paths))])
+        linenum = len(bounds[0]) - 1
+        if any(len(b) - 1 != linenum for b in bounds):
+            raise ValueError('number of lines in files does not match')
 
         if filter_func is None:
             lines = six.moves.range(linenum)
+        else:
+            for fp in self._fps:
+                fp.seek(0)
+            lines = numpy.array(
+                [i for i in six.moves.range(linenum)
+                 if filter_func(*[fp.readline() for fp in self._fps])],
+                dtype=numpy.int64)
 
         self._bounds = bounds
         self._lines = lines
@@ -117,12 +139,76 @@ class TextDataset(dataset_mixin.DatasetMixin):
         state = self.__dict__.copy()
         del state['_fps']
         del state['_lock']
+        if all(isinstance(b, numpy.memmap) for b in self._bounds):
+            # The saved cache is mapped again instead of being copied.
+            del state['_bounds']
         return state
 
     def __setstate__(self, state):
         self.__dict__ = state
         self._open()
         self._lock = threading.Lock()
+        if '_bounds' not in state:
+            self._bounds = tuple([self._load_bounds(k)
+                                  for k in six.moves.range(len(self._fps))])
+
+    def _load_bounds(self, k):
+        # Returns the line boundaries of the k-th file, from the saved cache
+        # if any.
+        if self._index_dir is None:
+            return self._build_bounds(k)
+
+        path = self._paths[k]
+        stat = os.stat(path)
+        key = repr((os.path.abspath(path), stat.st_size, stat.st_mtime,
+                    self._encoding[k], self._errors[k], self._newline[k]))
+        index_path = os.path.join(
+            self._index_dir,
+            hashlib.sha1(key.encode('utf-8')).hexdigest() + '.npy')
+        try:
+            return numpy.load(index_path, mmap_mode='r')
+        except (IOError, OSError, ValueError):
+            pass
+
+        bounds = self._build_bounds(k)
+        if not isinstance(bounds, numpy.ndarray):
+            return bounds
+        try:
+            if not os.path.isdir(self._index_dir):
+                os.makedirs(self._index_dir)
+            # Write to a temporary file first so that other processes never
+            # read an incomplete cache.
+            fd, temp_path = tempfile.mkstemp(dir=self._index_dir)
+            with os.fdopen(fd, 'wb') as f:
+                numpy.save(f, bounds)
+            os.rename(temp_path, index_path)
+        except (IOError, OSError):
+            return bounds
+        return numpy.load(index_path, mmap_mode='r')
+
+    def _build_bounds(self, k):
+        encoding = self._encoding[k] or locale.getpreferredencoding(False)
+        newline = self._newline[k]
+        encoding = codecs.lookup(encoding).name
+        if encoding in _SCANNABLE_ENCODINGS and\
+                newline in (None, '', '\n', '\r\n'):
+            # The decoder of utf-8-sig skips the BOM at the beginning.
+            bom = codecs.BOM_UTF8 if encoding == 'utf-8-sig' else b''
+            bounds = _scan_bounds(self._paths[k], newline, bom)
+            if bounds is not None:
+                return bounds
+
+        fp = self._fps[k]
+        fp.seek(0)
+        bounds = [0]
+        while fp.readline():
+            bounds.append(fp.tell())
+        try:
+            return numpy.array(bounds, dtype=numpy.int64)
+        except OverflowError:
+            # A position can include the state of the decoder in the upper
+            # bits, in which case the positions are kept as a list.
+            return bounds
 
     def __len__(self):
         return len(self._lines)
@@ -163,10 +249,52 @@ class TextDataset(dataset_mixin.DatasetMixin):
         self._lock.acquire()
         try:
             for k, fp in enumerate(self._fps):
-                fp.seek(self._bounds[k][linenum])
+                fp.seek(int(self._bounds[k][linenum]))
             lines = [fp.readline() for fp in self._fps]
             if len(lines) == 1:
                 return lines[0]
             return tuple(lines)
         finally:
             self._lock.release()
+
+
+def _scan_bounds(path, newline, bom=b''):
+    # Returns the line boundaries of a file by searching it for newline
+    # bytes, or None if the file has a line separated by a sole carriage
+    # return, which cannot be found in this way. A leading ``bom`` is not
+    # part of the first line, though the first line still starts at 0.
+    bounds = [numpy.zeros(1, dtype=numpy.int64)]
+    position = 0
+    previous = 0
+    buf = numpy.empty(_SCAN_CHUNK_SIZE, dtype=numpy.uint8)
+    with io.open(path, 'rb') as f:
+        if bom:
+            if f.read(len(bom)) == bom:
+                position = len(bom)
+            else:
+                f.seek(0)
+        start = position
+        while True:
+            n = f.readinto(memoryview(buf))
+            if not n:
+                break
+            chunk = buf[:n]
+            # The previous byte of each byte in the chunk.
+            prev = numpy.empty(n, dtype=numpy.uint8)
+            prev[0] = previous
+            prev[1:] = chunk[:-1]
+            lf = chunk == 10
+            if newline == '\r\n':
+                lf &= prev == 13
+            elif newline != '\n' and numpy.any((prev == 13) & ~lf):
+                return None
+            bounds.append(numpy.flatnonzero(lf) + (position + 1))
+            position += n
+            previous = chunk[-1]
+    if previous == 13 and newline not in ('\n', '\r\n'):
+        return None
+    bounds = numpy.concatenate(bounds)
+    if bounds[-1] != position and position != start:
+        # The last line has no newline.
+        bounds = numpy.append(bounds, position)
+    return bounds
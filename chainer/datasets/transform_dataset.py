@@ -30,6 +30,13 @@ class TransformDataset(dataset_mixin.DatasetMixin):
     ...     return img, label
     >>> dataset = TransformDataset(dataset, transform)
 
+    If ``batched`` is ``True``, :obj:`transform` takes a list of
+    :obj:`in_data` and returns a list of the transformed data instead, so
+    that it can transform the examples of a batch at once. It is called with
+    all examples read by :meth:`get_examples`, e.g., the examples of each
+    batch read by an iterator, and with a list of one example by
+    :meth:`get_example`.
+
     Args:
         dataset: The underlying dataset. The index of this dataset corresponds
             to the index of the base dataset. This object needs to support
@@ -37,16 +44,27 @@ class TransformDataset(dataset_mixin.DatasetMixin):
             above.
         transform (callable): A function that is called to transform values
             returned by the underlying dataset's :meth:`__getitem__`.
+        batched (bool): If ``True``, :obj:`transform` transforms a list of
+            values.
 
     """
 
-    def __init__(self, dataset, transform):
+    def __init__(self, dataset, transform, batched=False):
         self._dataset = dataset
         self._transform = transform
+        self._batched = batched
 
     def __len__(self):
         return len(self._dataset)
 
     def get_example(self, i):
         in_data = self._dataset[i]
+        if self._batched:
+            return self._transform([in_data])[0]
         return self._transform(in_data)
+
+    def get_examples(self, indices):
+        in_data = dataset_mixin.get_examples(self._dataset, indices)
+        if self._batched:
+            return list(self._transform(in_data))
+        return [self._transform(x) for x in in_data]
@@ -1,5 +1,7 @@
 import six
 
+from chainer.dataset import dataset_mixin
+
 
 class TupleDataset(object):
 
@@ -49,3 +51,21 @@ class TupleDataset(object):
 
     def __len__(self):
         return self._length
+
+    def get_examples(self, indices):
+        """Returns the examples of given indices.
+
+        The examples of each underlying dataset are read at once, e.g., with
+        one indexing if it is an array.
+
+        Args:
+            indices (list or numpy.ndarray): One-dimensional integer indices
+                of the examples.
+
+        Returns:
+            list: The tuples of examples in the order of ``indices``.
+
+        """
+        batches = [dataset_mixin.get_examples(dataset, indices)
+                   for dataset in self._datasets]
+        return list(six.moves.zip(*batches))
@@ -126,6 +126,11 @@ class FunctionAdapter(function_node.FunctionNode):
     def _impl_name(self):
         return self._function.__class__.__name__
 
+    @property
+    def _supports_static_optimizations(self):
+        return getattr(
+            self._function, '_supports_static_optimizations', False)
+
     def check_type_forward(self, in_types):
         self._function.check_type_forward(in_types)
 
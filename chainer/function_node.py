@@ -1,5 +1,6 @@
 import collections
 import heapq
+import threading
 import traceback
 import weakref
 
@@ -17,6 +18,30 @@ from chainer.utils import type_check
 from chainer import variable
 
 
+_thread_local = threading.local()
+
+
+def _get_apply_mode():
+    # Returns a tuple of two flags derived from the current configuration.
+    # The first one tells if FunctionNode.apply can skip the debug,
+    # type-check and static-graph handling, and the second one tells if the
+    # graph-free mode is enabled. The flags are cached per thread and
+    # recomputed only when the configuration changes.
+    version = configuration._version
+    try:
+        if _thread_local.apply_mode_version == version:
+            return _thread_local.apply_mode
+    except AttributeError:
+        pass
+    config = configuration.config
+    fast_path = not (config.debug or config.type_check or
+                     config.schedule_func is not None)
+    mode = fast_path, bool(config.graph_free)
+    _thread_local.apply_mode = mode
+    _thread_local.apply_mode_version = version
+    return mode
+
+
 class FunctionNode(object):
 
     """Function node of the computational graph.
@@ -222,11 +247,87 @@ Use apply() method instead.\
         Returns:
             A tuple of output :class:`~chainer.Variable` objects.
 
+        .. note::
+
+           If ``chainer.config.graph_free`` is ``True``, input arrays are not
+           wrapped with :class:`~chainer.Variable` and the output variables
+           are created without variable nodes, i.e., no computational graph
+           is built at all. The variable node of an output is only created
+           on demand, e.g., when its :attr:`~chainer.Variable.node` or
+           :attr:`~chainer.Variable.name` is accessed.
+
         """
+        fast_path, graph_free = _get_apply_mode()
+        if graph_free:
+            in_data = tuple([
+                x.data if isinstance(x, variable.Variable) else x
+                for x in inputs])
+            outputs = self._forward(in_data, fast_path)
+            return tuple([variable._create_graph_free_variable(y)
+                          for y in outputs])
+
         input_vars = [chainer.as_variable(x) for x in inputs]
         in_data = tuple([x.data for x in input_vars])
         requires_grad = any([x.requires_grad for x in input_vars])
 
+        outputs = self._forward(in_data, fast_path)
+
+        ret = tuple([variable.Variable(y, requires_grad=requires_grad)
+                     for y in outputs])
+
+        if configuration.config.enable_backprop:
+            # Topological ordering
+            self.rank = max([x.rank for x in input_vars]) if input_vars else 0
+            # Add backward edges
+            for y in ret:
+                y.creator_node = self
+            self.inputs = tuple([x.node for x in input_vars])
+            # Add forward edges (must be weak references)
+            self.outputs = tuple([weakref.ref(y.node) for y in ret])
+
+            if self._input_indexes_to_retain is not None:
+                for index in self._input_indexes_to_retain:
+                    input_vars[index].retain_data()
+
+            if self._output_indexes_to_retain is not None:
+                retained_data = []
+                for index in self._output_indexes_to_retain:
+                    ret[index].retain_data()
+                    retained_data.append(outputs[index])
+                self._retained_output_data = tuple(retained_data)
+
+            self.lazy_grad_sum = configuration.config.lazy_grad_sum
+
+        return ret
+
+    def _forward(self, in_data, fast_path):
+        if (fast_path and not self._n_local_function_hooks and
+                not chainer.get_function_hooks() and
+                all([type(x) is numpy.ndarray for x in in_data])):
+            return self._forward_fast(in_data)
+        return self._forward_with_checks(in_data)
+
+    def _forward_fast(self, in_data):
+        # Forward computation used when no function hooks are registered,
+        # the debug mode, type checking and static graph optimizations are
+        # disabled, and all the inputs are NumPy arrays. Device selection and
+        # the input array type check are unnecessary in this case.
+        self._input_indexes_to_retain = None
+        self._output_indexes_to_retain = None
+        outputs = self.forward(in_data)
+
+        if not isinstance(outputs, tuple):
+            raise TypeError(
+                'forward output must be a tuple ({})\n'
+                'Actual: {}'.format(self.label, type(outputs)))
+
+        for y in outputs:
+            if type(y) is not numpy.ndarray:
+                self._check_output_arrays(outputs)
+                break
+        return outputs
+
+    def _forward_with_checks(self, in_data):
         # Check for input array types
         if not chainer.is_arrays_compatible(in_data):
             raise TypeError(
@@ -268,13 +369,7 @@ Use apply() method instead.\
                 'forward output must be a tuple ({})\n'
                 'Actual: {}'.format(self.label, type(outputs)))
 
-        if not chainer.is_arrays_compatible(outputs):
-            raise TypeError(
-                'incompatible array types are mixed in the forward output '
-                '({}).\n'
-                'Actual: {}'.format(
-                    self.label,
-                    ', '.join(str(type(x)) for x in outputs)))
+        self._check_output_arrays(outputs)
 
         for hook in hooks:
             hook.forward_postprocess(self, in_data)
@@ -287,33 +382,16 @@ Use apply() method instead.\
                        '{}'.format(self.label))
                 raise RuntimeError(msg)
 
-        ret = tuple([variable.Variable(y, requires_grad=requires_grad)
-                     for y in outputs])
-
-        if configuration.config.enable_backprop:
-            # Topological ordering
-            self.rank = max([x.rank for x in input_vars]) if input_vars else 0
-            # Add backward edges
-            for y in ret:
-                y.creator_node = self
-            self.inputs = tuple([x.node for x in input_vars])
-            # Add forward edges (must be weak references)
-            self.outputs = tuple([weakref.ref(y.node) for y in ret])
-
-            if self._input_indexes_to_retain is not None:
-                for index in self._input_indexes_to_retain:
-                    input_vars[index].retain_data()
-
-            if self._output_indexes_to_retain is not None:
-                retained_data = []
-                for index in self._output_indexes_to_retain:
-                    ret[index].retain_data()
-                    retained_data.append(outputs[index])
-                self._retained_output_data = tuple(retained_data)
+        return outputs
 
-            self.lazy_grad_sum = configuration.config.lazy_grad_sum
-
-        return ret
+    def _check_output_arrays(self, outputs):
+        if not chainer.is_arrays_compatible(outputs):
+            raise TypeError(
+                'incompatible array types are mixed in the forward output '
+                '({}).\n'
+                'Actual: {}'.format(
+                    self.label,
+                    ', '.join(str(type(x)) for x in outputs)))
 
     def _check_data_type_forward(self, in_data):
         in_type = type_check.get_light_types(in_data)
@@ -830,7 +908,8 @@ def grad(outputs, inputs, grad_outputs=None, grad_inputs=None, set_grad=False,
     # 3. Backpropagation: the backpropagation is executed along the
     #    (sub-)subgraph. It uses the topological order of the subgraph which is
     #    induced by the reversed order of function applications ("rank").
-    grads = _backprop_utils.GradTable()
+    grads = _backprop_utils.GradTable(
+        accumulate_inplace=not enable_double_backprop)
 
     # Initialize the gradient mapping.
     if grad_outputs is None:
@@ -926,7 +1005,8 @@ def _backprop(outputs, inputs, grad_required, retain_grad, grads, loss_scale):
             for hook in hooks:
                 hook.backward_preprocess(func, in_data, out_grad_data)
 
-            _backprop_utils.backprop_step(func, input_indexes, gys, x_grads)
+            _backprop_utils.backprop_step(
+                func, input_indexes, gys, x_grads, grads)
 
             # Call post-backward hooks
             for hook in hooks:
@@ -4,7 +4,7 @@ import chainer
 from chainer.backends import cuda
 from chainer.backends import intel64
 from chainer import function_node
-from chainer import utils
+from chainer.graph_optimizations import static_code
 from chainer.utils import type_check
 
 
@@ -23,11 +23,30 @@ class ReLU(function_node.FunctionNode):
 
     _use_cudnn = False
     _use_ideep = False
+    _supports_static_optimizations = True
 
     def check_type_forward(self, in_types):
         type_check.argname(in_types, ('x',))
         type_check.expect(in_types[0].dtype.kind == 'f')
 
+    @static_code
+    def static_relu(self, xp, inputs, outputs):
+        x, = inputs
+        y, = outputs
+        xp.maximum(x, 0, out=y)
+
+    @static_code
+    def static_relu_ideep(self, inputs):
+        x, = inputs
+        y = intel64.ideep.relu.Forward(intel64.ideep.array(x))
+        return y,
+
+    @static_code
+    def static_relu_cudnn(self, inputs):
+        x, = inputs
+        y = cudnn.activation_forward(x, _mode)
+        return y,
+
     def forward_cpu(self, inputs):
         if (intel64.should_use_ideep('>=auto')
                 and intel64.inputs_all_ready(inputs)):
@@ -37,15 +56,16 @@ class ReLU(function_node.FunctionNode):
 
         x, = inputs
         self.retain_outputs((0,))
-        return utils.force_array(numpy.maximum(x, 0, dtype=x.dtype)),
+        # The output is written into a preallocated array so that a static
+        # schedule can reuse it in every iteration.
+        y = numpy.empty_like(x)
+        self.static_relu(numpy, inputs=[x], outputs=[y])
+        return y,
 
     def forward_ideep(self, inputs):
-        x, = inputs
         self.retain_inputs((0,))
         self.retain_outputs((0,))
-
-        y = intel64.ideep.relu.Forward(intel64.ideep.array(x))
-        return y,
+        return self.static_relu_ideep(inputs=list(inputs))
 
     def forward_gpu(self, inputs):
         x, = inputs
@@ -54,9 +74,10 @@ class ReLU(function_node.FunctionNode):
             # So, we retain it for backward computation.
             self.retain_inputs((0,))
             self._use_cudnn = True
-            y = cudnn.activation_forward(x, _mode)
-        else:
-            y = cuda.cupy.maximum(x, 0)
+            self.retain_outputs((0,))
+            return self.static_relu_cudnn(inputs=[x])
+        y = cuda.cupy.empty_like(x)
+        self.static_relu(cuda.cupy, inputs=[x], outputs=[y])
         self.retain_outputs((0,))
         return y,
 
@@ -91,16 +112,36 @@ class ReLUGrad2(function_node.FunctionNode):
     we do not backpropagate errors toward b for computational efficiency.
     """
 
+    _supports_static_optimizations = True
+
     def __init__(self, b):
         super(ReLUGrad2, self).__init__()
         self.b = b.data
 
+    @static_code
+    def static_relu_grad2_cpu(self, inputs, outputs):
+        b, gy = inputs
+        gx, = outputs
+        # Write the mask into gx first to avoid a temporary boolean array.
+        numpy.greater(b, 0, out=gx)
+        gx *= gy
+
+    @static_code
+    def static_relu_grad2_gpu(self, inputs, outputs):
+        b, gy = inputs
+        gx, = outputs
+        _relu_grad2_kernel(b, gy, gx)
+
     def forward_cpu(self, inputs):
-        y = (self.b > 0) * inputs[0]
-        return utils.force_array(y, dtype=y.dtype),
+        gy, = inputs
+        gx = numpy.empty_like(gy)
+        self.static_relu_grad2_cpu(inputs=[self.b, gy], outputs=[gx])
+        return gx,
 
     def forward_gpu(self, inputs):
-        gx = _relu_grad2_kernel(self.b, inputs[0])
+        gy, = inputs
+        gx = cuda.cupy.empty_like(gy)
+        self.static_relu_grad2_gpu(inputs=[self.b, gy], outputs=[gx])
         return gx,
 
     def backward(self, indexes, gy):
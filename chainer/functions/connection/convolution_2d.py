@@ -8,6 +8,7 @@ from chainer.backends import intel64
 from chainer import configuration
 from chainer import function_node
 import chainer.functions
+from chainer.graph_optimizations import static_code
 from chainer.utils import argument
 from chainer.utils import conv
 from chainer.utils import type_check
@@ -25,6 +26,7 @@ def _pair(x):
 class Convolution2DFunction(function_node.FunctionNode):
 
     _use_ideep = False
+    _supports_static_optimizations = True
 
     def __init__(self, stride=1, pad=0, cover_all=False, **kwargs):
         dilate, groups = argument.parse_kwargs(
@@ -80,21 +82,54 @@ class Convolution2DFunction(function_node.FunctionNode):
             raise RuntimeError('Width in the output should be positive.')
         return out_h, out_w
 
-    def forward_cpu(self, inputs):
-        self.retain_inputs((0, 1))  # retain only x and W
+    @static_code
+    def static_conv2d_cpu(self, inputs, outputs):
+        x, W = inputs[:2]
+        col, y = outputs
+        n, out_c, out_h, out_w = y.shape
+        kh, kw = W.shape[2:]
+        conv.im2col_cpu(
+            x, kh, kw, self.sy, self.sx, self.ph, self.pw,
+            cover_all=self.cover_all, dy=self.dy, dx=self.dx, out=col)
+        # (oC, K) x (N, K, oH * oW) -> (N, oC, oH * oW), so that y is written
+        # in NCHW order without transposing the columns.
+        numpy.matmul(W.reshape(out_c, -1),
+                     col.reshape(n, -1, out_h * out_w),
+                     out=y.reshape(n, out_c, out_h * out_w))
+        if len(inputs) == 3:
+            y += inputs[2].reshape(out_c, 1, 1)
+
+    @static_code
+    def static_conv2d_cpu_generic(self, inputs):
         if len(inputs) == 2:
             (x, W), b = inputs, None
         else:
             x, W, b = inputs
+        if self.groups > 1:
+            return self._forward_grouped_convolution(x, W, b)
+        else:
+            return self._forward_cpu_core(x, W, b)
+
+    def forward_cpu(self, inputs):
+        self.retain_inputs((0, 1))  # retain only x and W
+        x, W = inputs[:2]
 
         if (intel64.should_use_ideep('>=auto')
                 and intel64.inputs_all_ready(inputs)):
             self._use_ideep = True
 
-        if self.groups > 1:
-            return self._forward_grouped_convolution(x, W, b)
-        else:
-            return self._forward_cpu_core(x, W, b)
+        if self.groups > 1 or self._use_ideep or x.dtype != W.dtype:
+            return self.static_conv2d_cpu_generic(inputs=list(inputs))
+
+        # The columns and the output are preallocated so that a static
+        # schedule can reuse them in every iteration.
+        out_c, _, kh, kw = W.shape
+        n, c = x.shape[:2]
+        out_h, out_w = self._get_out_size(inputs)
+        col = numpy.empty((n, c, kh, kw, out_h, out_w), dtype=x.dtype)
+        y = numpy.empty((n, out_c, out_h, out_w), dtype=x.dtype)
+        self.static_conv2d_cpu(inputs=list(inputs), outputs=[col, y])
+        return y,
 
     def _forward_cpu_core(self, x, W, b):
         if self._use_ideep:
@@ -135,6 +170,10 @@ class Convolution2DFunction(function_node.FunctionNode):
 
     def forward_gpu(self, inputs):
         self.retain_inputs((0, 1))  # retain only x and W
+        return self.static_conv2d_gpu(inputs=list(inputs))
+
+    @static_code
+    def static_conv2d_gpu(self, inputs):
         if len(inputs) == 2:
             (x, W), b = inputs, None
         else:
@@ -256,6 +295,8 @@ class Convolution2DFunction(function_node.FunctionNode):
 
 class Convolution2DGradW(function_node.FunctionNode):
 
+    _supports_static_optimizations = True
+
     def __init__(self, conv2d):
         W_node = conv2d.inputs[1]
         self.kh, self.kw = W_node.shape[2:]
@@ -270,15 +311,50 @@ class Convolution2DGradW(function_node.FunctionNode):
         self.groups = conv2d.groups
         self._use_ideep = conv2d._use_ideep
 
-    def forward_cpu(self, inputs):
-        self.retain_inputs((0, 1))
+    @static_code
+    def static_conv2d_grad_w_cpu(self, inputs, outputs):
+        x, gy = inputs
+        col, gy_t, gW = outputs
+        out_c, _, out_h, out_w = gy_t.shape
+        # The columns are written in (C, kH, kW, N, oH, oW) order and gy is
+        # transposed to (oC, N, oH, oW), so that gW is computed by a single
+        # matrix product reducing over the batch and the output positions.
+        conv.im2col_cpu(
+            x, self.kh, self.kw, self.sy, self.sx, self.ph, self.pw,
+            dy=self.dy, dx=self.dx, out_h=out_h, out_w=out_w,
+            out=col.transpose(3, 0, 1, 2, 4, 5))
+        gy_t[...] = gy.transpose(1, 0, 2, 3)
+        numpy.dot(gy_t.reshape(out_c, -1), col.reshape(gW[0].size, -1).T,
+                  out=gW.reshape(out_c, -1))
+
+    @static_code
+    def static_conv2d_grad_w_cpu_generic(self, inputs):
         x, gy = inputs
-
         if self.groups > 1:
             return self._forward_grouped_convolution(x, gy)
         else:
             return self._forward_cpu_core(x, gy)
 
+    def forward_cpu(self, inputs):
+        self.retain_inputs((0, 1))
+        x, gy = inputs
+
+        if (self.groups > 1 or self._use_ideep
+                or not x.dtype == gy.dtype == self.W_dtype):
+            return self.static_conv2d_grad_w_cpu_generic(inputs=list(inputs))
+
+        # The columns, the transposed gy and gW are preallocated so that a
+        # static schedule can reuse them in every iteration.
+        n, c = x.shape[:2]
+        _, out_c, out_h, out_w = gy.shape
+        col = numpy.empty((c, self.kh, self.kw, n, out_h, out_w),
+                          dtype=x.dtype)
+        gy_t = numpy.empty((out_c, n, out_h, out_w), dtype=gy.dtype)
+        gW = numpy.empty((out_c, c, self.kh, self.kw), dtype=self.W_dtype)
+        self.static_conv2d_grad_w_cpu(
+            inputs=list(inputs), outputs=[col, gy_t, gW])
+        return gW,
+
     def _forward_cpu_core(self, x, gy):
         if self._use_ideep:
             return self._forward_ideep(x, gy)
@@ -321,6 +397,10 @@ class Convolution2DGradW(function_node.FunctionNode):
 
     def forward_gpu(self, inputs):
         self.retain_inputs((0, 1))
+        return self.static_conv2d_grad_w_gpu(inputs=list(inputs))
+
+    @static_code
+    def static_conv2d_grad_w_gpu(self, inputs):
         x, gy = inputs
 
         use_cudnn = (
@@ -9,6 +9,7 @@ from chainer import configuration
 from chainer import function_node
 import chainer.functions
 from chainer.functions.connection import convolution_2d
+from chainer.graph_optimizations import static_code
 from chainer.utils import argument
 from chainer.utils import conv
 from chainer.utils import type_check
@@ -27,6 +28,7 @@ class Deconvolution2DFunction(function_node.FunctionNode):
 
     cover_all = None
     _use_ideep = False
+    _supports_static_optimizations = True
 
     def __init__(self, stride=1, pad=0, outsize=None, **kwargs):
         dilate, groups = argument.parse_kwargs(
@@ -108,6 +110,22 @@ class Deconvolution2DFunction(function_node.FunctionNode):
             if self.outw <= 0:
                 raise RuntimeError('Width in the output must be positive.')
 
+    @static_code
+    def static_deconv2d_cpu(self, inputs, outputs):
+        x, W = inputs[:2]
+        gcol, y = outputs
+        n, in_c, in_h, in_w = x.shape
+        # (K, xC) x (N, xC, xH * xW) -> (N, K, xH * xW), which is the layout
+        # expected by col2im.
+        numpy.matmul(W.reshape(in_c, -1).T,
+                     x.reshape(n, in_c, in_h * in_w),
+                     out=gcol.reshape(n, -1, in_h * in_w))
+        conv.col2im_cpu(
+            gcol, self.sy, self.sx, self.ph, self.pw, self.outh, self.outw,
+            dy=self.dy, dx=self.dx, out=y)
+        if len(inputs) == 3:
+            y += inputs[2].reshape(-1, 1, 1)
+
     def forward_cpu(self, inputs):
         if ((self.dy == 1 and self.dx == 1)
                 and intel64.should_use_ideep('>=auto')
@@ -115,13 +133,28 @@ class Deconvolution2DFunction(function_node.FunctionNode):
             self._use_ideep = True
 
         self.retain_inputs((0, 1))  # only retain x and W
+        x, W = inputs[:2]
+        self._calc_out_size(x, W)
+
+        if self.groups > 1 or self._use_ideep or x.dtype != W.dtype:
+            return self.static_deconv2d_cpu_generic(inputs=list(inputs))
+
+        # The columns and the output are preallocated so that a static
+        # schedule can reuse them in every iteration.
+        _, out_c, kh, kw = W.shape
+        n, _, in_h, in_w = x.shape
+        gcol = numpy.empty((n, out_c, kh, kw, in_h, in_w), dtype=x.dtype)
+        y = numpy.empty((n, out_c, self.outh, self.outw), dtype=x.dtype)
+        self.static_deconv2d_cpu(inputs=list(inputs), outputs=[gcol, y])
+        return y,
+
+    @static_code
+    def static_deconv2d_cpu_generic(self, inputs):
         if len(inputs) == 2:
             (x, W), b = inputs, None
         else:
             x, W, b = inputs
 
-        self._calc_out_size(x, W)
-
         if self.groups > 1:
             # Grouped convolution implementation
             return self._forward_grouped_convolution(x, W, b)
@@ -177,14 +210,18 @@ class Deconvolution2DFunction(function_node.FunctionNode):
 
     def forward_gpu(self, inputs):
         self.retain_inputs((0, 1))  # only retain x and W
+        x, W = inputs[:2]
+        self._calc_out_size(x, W)
+        self._set_cover_all(x, W)
+        return self.static_deconv2d_gpu(inputs=list(inputs))
+
+    @static_code
+    def static_deconv2d_gpu(self, inputs):
         if len(inputs) == 2:
             (x, W), b = inputs, None
         else:
             x, W, b = inputs
 
-        self._calc_out_size(x, W)
-        self._set_cover_all(x, W)
-
         use_cudnn = (
             chainer.should_use_cudnn('>=auto')
             and not self.cover_all
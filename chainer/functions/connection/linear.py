@@ -86,7 +86,7 @@ class LinearFunction(function_node.FunctionNode):
         # required that all output arrays of this forward
         # function be allocated explicitly:
         xp = cuda.get_array_module(x)
-        y = xp.empty((x.shape[0], W.shape[0])).astype(x.dtype)
+        y = xp.empty((x.shape[0], W.shape[0]), dtype=x.dtype)
 
         # This is required because all of the "static_*()" functions
         # use the convention that any output arrays are supplied
@@ -138,6 +138,29 @@ class LinearFunction(function_node.FunctionNode):
 class LinearGradData(function_node.FunctionNode):
 
     _config_use_ideep = None
+    _supports_static_optimizations = True
+
+    @static_code
+    def static_linear_grad_data(self, xp, optimized, inputs, outputs):
+        W, gy = inputs
+        gx = outputs[0]
+        if (isinstance(gy, numpy.ndarray) and
+                not (gy.flags.c_contiguous or gy.flags.f_contiguous) and
+                1 in gy.shape):
+            gy = numpy.ascontiguousarray(gy)
+
+        if optimized:
+            xp.dot(gy, W, out=gx)
+        else:
+            gx[...] = gy.dot(W)
+
+    @static_code
+    def static_linear_grad_data_ideep(self, inputs):
+        W, gy = inputs
+        gx = intel64.ideep.linear.BackwardData(
+            intel64.ideep.array(W),
+            intel64.ideep.array(gy))
+        return gx,
 
     def forward(self, inputs):
         self._config_use_ideep = chainer.config.use_ideep
@@ -150,21 +173,17 @@ class LinearGradData(function_node.FunctionNode):
         self.retain_inputs((0, 1))
         W, gy = inputs
 
-        if (isinstance(gy, numpy.ndarray) and
-                not (gy.flags.c_contiguous or gy.flags.f_contiguous) and
-                1 in gy.shape):
-            gy = numpy.ascontiguousarray(gy)
-
-        gx = gy.dot(W).astype(gy.dtype, copy=False)
+        # The output is allocated here so that a static schedule can reuse
+        # it in every iteration. See LinearFunction.forward().
+        xp = cuda.get_array_module(gy)
+        gx = xp.empty((gy.shape[0], W.shape[1]), dtype=gy.dtype)
+        self.static_linear_grad_data(xp, gy.dtype == W.dtype, inputs=[W, gy],
+                                     outputs=[gx])
         return gx,
 
     def _forward_ideep(self, inputs):
         self.retain_inputs((0, 1))
-        W, gy = inputs
-        gx = intel64.ideep.linear.BackwardData(
-            intel64.ideep.array(W),
-            intel64.ideep.array(gy))
-        return gx,
+        return self.static_linear_grad_data_ideep(inputs=list(inputs))
 
     def backward(self, indexes, grad_outputs):
         W, gy = self.get_retained_inputs()
@@ -184,10 +203,33 @@ class LinearGradData(function_node.FunctionNode):
 class LinearGradWeight(function_node.FunctionNode):
 
     _config_use_ideep = None
+    _supports_static_optimizations = True
 
     def __init__(self, w_dtype):
         self._w_dtype = w_dtype
 
+    @static_code
+    def static_linear_grad_weight(self, xp, optimized, inputs, outputs):
+        x, gy = inputs
+        gW = outputs[0]
+        if (isinstance(gy, numpy.ndarray) and
+                not (gy.flags.c_contiguous or gy.flags.f_contiguous) and
+                1 in gy.shape):
+            gy = numpy.ascontiguousarray(gy)
+
+        if optimized:
+            xp.dot(gy.T, x, out=gW)
+        else:
+            gW[...] = gy.T.dot(x)
+
+    @static_code
+    def static_linear_grad_weight_ideep(self, inputs):
+        x, gy = inputs
+        gW = intel64.ideep.linear.BackwardWeights(
+            intel64.ideep.array(x),
+            intel64.ideep.array(gy))
+        return gW,
+
     def forward(self, inputs):
         self._config_use_ideep = chainer.config.use_ideep
         if (intel64.should_use_ideep('>=auto')
@@ -200,21 +242,16 @@ class LinearGradWeight(function_node.FunctionNode):
         self.retain_inputs((0, 1))
         x, gy = inputs
 
-        if (isinstance(gy, numpy.ndarray) and
-                not (gy.flags.c_contiguous or gy.flags.f_contiguous) and
-                1 in gy.shape):
-            gy = numpy.ascontiguousarray(gy)
-
-        gW = gy.T.dot(x).astype(self._w_dtype, copy=False)
+        xp = cuda.get_array_module(x)
+        gW = xp.empty((gy.shape[1], x.shape[1]), dtype=self._w_dtype)
+        optimized = x.dtype == gy.dtype == self._w_dtype
+        self.static_linear_grad_weight(xp, optimized, inputs=[x, gy],
+                                       outputs=[gW])
         return gW,
 
     def _forward_ideep(self, inputs):
         self.retain_inputs((0, 1))
-        x, gy = inputs
-        gW = intel64.ideep.linear.BackwardWeights(
-            intel64.ideep.array(x),
-            intel64.ideep.array(gy))
-        return gW,
+        return self.static_linear_grad_weight_ideep(inputs=list(inputs))
 
     def backward(self, indexes, grad_outputs):
         x, gy = self.get_retained_inputs()
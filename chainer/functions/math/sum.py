@@ -1,8 +1,7 @@
-import numpy
-
 import chainer
 from chainer import backend
 from chainer import function_node
+from chainer.graph_optimizations import static_code
 from chainer import utils
 from chainer.utils import type_check
 
@@ -11,6 +10,7 @@ class Sum(function_node.FunctionNode):
     """Sum of array elements over a given axis."""
 
     keepdims = False
+    _supports_static_optimizations = True
 
     def __init__(self, axis=None, keepdims=False):
         if axis is None:
@@ -42,11 +42,31 @@ class Sum(function_node.FunctionNode):
                         -axis - 1 < in_types[0].ndim,
                     )
 
+    @static_code
+    def static_sum(self, xp, inputs, outputs):
+        x, = inputs
+        y, = outputs
+        xp.sum(x, axis=self.axis, keepdims=self.keepdims, out=y)
+
     def forward(self, inputs):
         x, = inputs
-        ret = x.sum(axis=self.axis, keepdims=self.keepdims)
-        if backend.get_array_module(x) is numpy:
-            ret = numpy.asarray(ret)
+        ndim = x.ndim
+        if self.axis is None:
+            axes = set(range(ndim))
+        else:
+            axes = set(axis if axis >= 0 else axis + ndim
+                       for axis in self.axis)
+        if self.keepdims:
+            shape = tuple(1 if i in axes else s
+                          for i, s in enumerate(x.shape))
+        else:
+            shape = tuple(s for i, s in enumerate(x.shape) if i not in axes)
+
+        # The output is allocated here so that a static schedule can reuse
+        # it in every iteration.
+        xp = backend.get_array_module(x)
+        ret = xp.empty(shape, dtype=x.dtype)
+        self.static_sum(xp, inputs=[x], outputs=[ret])
         return ret,
 
     def backward(self, indexes, grad_outputs):
@@ -1,10 +1,12 @@
 import numpy
 
 import chainer
+from chainer import backend
 from chainer.backends import cuda
 from chainer.backends import intel64
 from chainer import configuration
 from chainer import function_node
+from chainer.graph_optimizations import static_code
 from chainer.utils import argument
 from chainer.utils import type_check
 
@@ -16,6 +18,7 @@ class Dropout(function_node.FunctionNode):
 
     """Dropout regularization."""
     _use_cudnn = False
+    _supports_static_optimizations = True
 
     def __init__(self, dropout_ratio, mask=None):
         if not 0.0 <= dropout_ratio < 1.0:
@@ -27,25 +30,68 @@ class Dropout(function_node.FunctionNode):
         type_check.argname(in_types, ('x',))
         type_check.expect(in_types[0].dtype.kind == 'f')
 
+    @static_code
+    def static_dropout_cpu(self, inputs, outputs):
+        x, = inputs
+        mask, y = outputs
+        # The mask is drawn again in every iteration of a static schedule.
+        numpy.greater_equal(
+            numpy.random.rand(*x.shape), self.dropout_ratio, out=mask)
+        mask *= x.dtype.type(1. / (1 - self.dropout_ratio))
+        numpy.multiply(x, mask, out=y)
+
+    @static_code
+    def static_dropout_gpu(self, inputs, outputs):
+        x, = inputs
+        mask, y = outputs
+        rand = cuda.cupy.random.rand(*x.shape, dtype=numpy.float32)
+        scale = x.dtype.type(1. / (1 - self.dropout_ratio))
+        cuda.elementwise(
+            'T x, R r, T scale, T ratio', 'T mask, T y',
+            '''
+            mask = (r >= ratio) * scale;
+            y = x * mask;
+            ''',
+            'dropout_fwd',
+        )(x, rand, scale, self.dropout_ratio, mask, y)
+
+    @static_code
+    def static_dropout_with_mask(self, xp, inputs, outputs):
+        x, mask = inputs
+        y, = outputs
+        xp.multiply(x, mask, out=y)
+
+    @static_code
+    def static_dropout_ideep(self, inputs):
+        mask, y = intel64.ideep.dropout.Forward(
+            intel64.ideep.array(inputs[0]),
+            self.dropout_ratio)
+        return mask, y
+
     def forward_cpu(self, x):
         if (intel64.should_use_ideep('>=auto')
                 and intel64.inputs_all_ready(x)
                 and self.mask is None):
             return self._forward_ideep(x)
 
+        # The mask and the output are preallocated so that a static schedule
+        # can reuse them in every iteration.
+        y = numpy.empty_like(x[0])
         if self.mask is not None:
-            y = x[0] * self.mask
+            self.static_dropout_with_mask(
+                numpy, inputs=[x[0], self.mask], outputs=[y])
         else:
-            scale = x[0].dtype.type(1. / (1 - self.dropout_ratio))
-            flag = numpy.random.rand(*x[0].shape) >= self.dropout_ratio
-            self.mask = scale * flag
-            y = x[0] * self.mask
+            self.mask = numpy.empty_like(x[0])
+            self.static_dropout_cpu(inputs=list(x), outputs=[self.mask, y])
         return y,
 
     def forward_gpu(self, x):
+        # cuDNN keeps the mask in an opaque state, which cannot be passed to
+        # the gradient through a static schedule.
         if (chainer.should_use_cudnn('==always', 5000)
                 and x[0].flags.c_contiguous
-                and self.mask is None):
+                and self.mask is None
+                and configuration.config.schedule_func is None):
             self._use_cudnn = True
 
             handle = cudnn.get_handle()
@@ -60,26 +106,18 @@ class Dropout(function_node.FunctionNode):
                 handle, x[0], self.dropout_ratio)
             return y,
         else:
+            y = cuda.cupy.empty_like(x[0])
             if self.mask is not None:
-                y = x[0] * self.mask
+                self.static_dropout_with_mask(
+                    cuda.cupy, inputs=[x[0], self.mask], outputs=[y])
             else:
-                rand = cuda.cupy.random.rand(*x[0].shape, dtype=numpy.float32)
-                scale = x[0].dtype.type(1. / (1 - self.dropout_ratio))
-                self.mask, y = cuda.elementwise(
-                    'T x, R r, T scale, T ratio', 'T mask, T y',
-                    '''
-                    mask = (r >= ratio) * scale;
-                    y = x * mask;
-                    ''',
-                    'dropout_fwd',
-                )(x[0], rand, scale, self.dropout_ratio)
+                self.mask = cuda.cupy.empty_like(x[0])
+                self.static_dropout_gpu(
+                    inputs=list(x), outputs=[self.mask, y])
             return y,
 
     def _forward_ideep(self, x):
-        mask, y = intel64.ideep.dropout.Forward(
-            intel64.ideep.array(x[0]),
-            self.dropout_ratio)
-        self.mask = mask
+        self.mask, y = self.static_dropout_ideep(inputs=list(x))
         return y,
 
     def backward(self, x, gy):
@@ -92,21 +130,38 @@ class Dropout(function_node.FunctionNode):
 class DropoutGrad(function_node.FunctionNode):
     """Computes the gradient of the Dropout function."""
 
+    _supports_static_optimizations = True
+
     def __init__(self, mask):
         self.mask = mask
 
+    @static_code
+    def static_dropout_grad(self, xp, inputs, outputs):
+        mask, gy = inputs
+        gx, = outputs
+        xp.multiply(gy, mask, out=gx)
+
+    @static_code
+    def static_dropout_grad_ideep(self, inputs):
+        mask, gy = inputs
+        return intel64.ideep.dropout.Backward(
+            intel64.ideep.array(mask),
+            intel64.ideep.array(gy)),
+
     def forward(self, inputs):
         if (intel64.should_use_ideep('>=auto')
                 and intel64.inputs_all_ready(inputs)):
             return self._forward_ideep(inputs)
 
-        y = inputs[0] * self.mask
-        return y,
+        xp = backend.get_array_module(*inputs)
+        gx = xp.empty_like(inputs[0])
+        self.static_dropout_grad(
+            xp, inputs=[self.mask, inputs[0]], outputs=[gx])
+        return gx,
 
     def _forward_ideep(self, inputs):
-        return intel64.ideep.dropout.Backward(
-            intel64.ideep.array(self.mask),
-            intel64.ideep.array(inputs[0])),
+        return self.static_dropout_grad_ideep(
+            inputs=[self.mask, inputs[0]])
 
     def backward(self, indexes, gy):
         return DropoutGrad(self.mask).apply(gy)
@@ -9,6 +9,7 @@ from chainer.backends import intel64
 from chainer import configuration
 from chainer import function
 from chainer import function_node
+from chainer.graph_optimizations import static_code
 from chainer.utils import argument
 from chainer.utils import collections_abc
 from chainer.utils import type_check
@@ -37,6 +38,7 @@ class BatchNormalization(function_node.FunctionNode):
 
     mean = None
     inv_std = None
+    _supports_static_optimizations = True
 
     def __init__(self, eps=2e-5, mean=None, var=None, decay=0.9, axis=None):
         self.running_mean = mean
@@ -88,6 +90,172 @@ class BatchNormalization(function_node.FunctionNode):
                 x_type.shape[_key_axis[i]] == gamma_type.shape[i],
             )
 
+    @static_code
+    def static_bn_ideep(self, inputs):
+        x, gamma, beta = inputs
+        expand_dim = False
+        if x.ndim == 2:
+            expand_dim = True
+            x = x[:, :, None, None]
+
+        y, mean, var, inv_std = (
+            intel64.ideep.batchNormalization.Forward(
+                intel64.ideep.array(x),
+                intel64.ideep.array(gamma),
+                intel64.ideep.array(beta),
+                None,
+                None,
+                self.eps
+            ))
+
+        m = x.size // gamma.size
+        adjust = m / max(m - 1., 1.)
+
+        # Update running_mean
+        if isinstance(self.running_mean, intel64.ideep.mdarray):
+            self.running_mean.inplace_axpby(
+                self.decay, (1 - self.decay), mean)
+        else:
+            self.running_mean *= self.decay
+            self.running_mean += mean * (1 - self.decay)
+
+        # Update running_var
+        if isinstance(self.running_var, intel64.ideep.mdarray):
+            self.running_var.inplace_axpby(
+                self.decay, (1 - self.decay), var * adjust)
+        else:
+            self.running_var *= self.decay
+            self.running_var += var * adjust * (1 - self.decay)
+
+        if expand_dim:
+            y = numpy.squeeze(y, axis=(2, 3))
+        return y, mean, var, inv_std
+
+    @static_code
+    def static_bn_cudnn(self, inputs):
+        x, gamma, beta = inputs
+        x = cuda.cupy.ascontiguousarray(x)
+
+        gamma = cuda.cupy.ascontiguousarray(gamma)
+        beta = cuda.cupy.ascontiguousarray(beta)
+        dtype = x.dtype
+        handle = cudnn.get_handle()
+        x_desc = cudnn.create_tensor_descriptor(
+            _as4darray(x, self.mode))
+        cudnn_mode = self.mode.get_cudnn_mode()
+        derivedBnDesc = cudnn.create_uninitialized_tensor_descriptor()
+        libcudnn.deriveBNTensorDescriptor(derivedBnDesc.value,
+                                          x_desc.value, cudnn_mode)
+        dtype_param = _get_dtype_of_tensor_descriptor(derivedBnDesc)
+        if dtype_param is not dtype:
+            gamma = gamma.astype(dtype_param)
+            beta = beta.astype(dtype_param)
+            running_mean = self.running_mean.astype(dtype_param)
+            running_var = self.running_var.astype(dtype_param)
+        else:
+            running_mean = self.running_mean
+            running_var = self.running_var
+
+        oz_dtype = 'd' if x.dtype == 'd' else 'f'
+        one = numpy.array(1, dtype=oz_dtype).ctypes
+        zero = numpy.array(0, dtype=oz_dtype).ctypes
+        y = cuda.cupy.empty_like(x)
+        # Factor used in the moving average
+        factor = 1 - self.decay
+
+        if self.mean is None:
+            # Output cache to speed up backward pass.
+            self.mean = cuda.cupy.empty_like(gamma)
+            # Output cache to speed up backward pass.
+            self.inv_std = cuda.cupy.empty_like(gamma)
+        # Note: cuDNN computes the mini-batch mean and variance
+        # internally. We can simply (optionally) pass
+        # it the running-average mean and variance arrays.
+        # Note: This API seems to set the inverse of the standard deviation
+        # (instead of variance) to resultSaveInvVariance argument. The
+        # current implementation of our BN depends on this behavior so that
+        # we can reduce the number of reduction kernels.
+        libcudnn.batchNormalizationForwardTraining(
+            handle, cudnn_mode, one.data, zero.data,
+            x_desc.value, x.data.ptr, x_desc.value,
+            y.data.ptr, derivedBnDesc.value, gamma.data.ptr,
+            beta.data.ptr, factor, running_mean.data.ptr,
+            running_var.data.ptr, self.eps,
+            self.mean.data.ptr, self.inv_std.data.ptr)
+
+        # Note: When the CUDNN_BATCHNORM_SPATIAL_PERSISTENT mode is used,
+        # there is a possibility of numerical overflow. You can use
+        # queryRuntimeError() to make sure whether the overflow actually
+        # occured or not during the batch normalization.
+        if (cudnn_mode is libcudnn.CUDNN_BATCHNORM_SPATIAL_PERSISTENT and
+                configuration.config.debug):
+            query_mode = libcudnn.CUDNN_ERRQUERY_BLOCKING
+            rstatus = libcudnn.queryRuntimeError(handle, query_mode)
+            if rstatus is not libcudnn.CUDNN_STATUS_SUCCESS:
+                warnings.warn(
+                    'A numerical overflow might have happend in cuDNN'
+                    'batch normalization (status:{})'.format(rstatus))
+
+        if dtype_param is not dtype:
+            # When data type of prameters is converted, say, from fp16
+            # to fp32, the values of fp32 arrays of running_mean and
+            # running_var updated by batchNormalizationForwardTraining
+            # must be explicitly written back to their original fp16
+            # arrays.
+            running_mean = running_mean.astype(dtype)
+            running_var = running_var.astype(dtype)
+            self.running_mean.data.copy_from(running_mean.data,
+                                             running_mean.nbytes)
+            self.running_var.data.copy_from(running_var.data,
+                                            running_var.nbytes)
+        return y,
+
+    @static_code
+    def static_bn_cpu(self, inputs, outputs):
+        x, gamma, beta = inputs
+        mean, inv_std, var, y = outputs
+        expander = self.expander
+        numpy.mean(x, axis=self.axis, out=mean)
+        # The squared deviations are written into y, so that the variance is
+        # computed without another array of the size of x.
+        numpy.subtract(x, mean[expander], out=y)
+        numpy.square(y, out=y)
+        numpy.mean(y, axis=self.axis, out=var)
+        numpy.add(var, self.eps, out=inv_std)
+        numpy.sqrt(inv_std, out=inv_std)
+        numpy.reciprocal(inv_std, out=inv_std)
+        numpy.subtract(x, mean[expander], out=y)
+        y *= inv_std[expander]
+        y *= gamma[expander]
+        y += beta[expander]
+        # Update running statistics
+        m = x.size // gamma.size
+        adjust = m / max(m - 1., 1.)  # unbiased estimation
+        self.running_mean *= self.decay
+        self.running_mean += (1 - self.decay) * mean
+        self.running_var *= self.decay
+        self.running_var += (1 - self.decay) * adjust * var
+
+    @static_code
+    def static_bn_gpu(self, inputs):
+        x, gamma, beta = inputs
+        expander = self.expander
+        gamma = gamma[expander]
+        beta = beta[expander]
+        mean = x.mean(axis=self.axis)
+        var = x.var(axis=self.axis)
+        inv_std = cuda.cupyx.rsqrt(var + self.eps)
+        y = _apply_bn_fwd(cuda.cupy, x, mean[expander],
+                          inv_std[expander], gamma, beta)
+        # Update running statistics
+        m = x.size // gamma.size
+        adjust = m / max(m - 1., 1.)  # unbiased estimation
+        self.running_mean *= self.decay
+        self.running_mean += (1 - self.decay) * mean
+        self.running_var *= self.decay
+        self.running_var += (1 - self.decay) * adjust * var
+        return y, mean, inv_std
+
     def forward(self, inputs):
         self.retain_inputs((0, 1))
         x, gamma, beta = inputs
@@ -136,141 +304,23 @@ class BatchNormalization(function_node.FunctionNode):
         self.use_ideep = self.mode.can_use_ideep()
 
         if self.use_ideep:
-            # TODO(niboshi): Refactor iDeep part into a separate method
-            expand_dim = False
-            if x.ndim == 2:
-                expand_dim = True
-                x = x[:, :, None, None]
-
-            y, self.mean, self.var, self.inv_std = (
-                intel64.ideep.batchNormalization.Forward(
-                    intel64.ideep.array(x),
-                    intel64.ideep.array(gamma),
-                    intel64.ideep.array(beta),
-                    None,
-                    None,
-                    self.eps
-                ))
-
-            m = x.size // gamma.size
-            adjust = m / max(m - 1., 1.)
-
-            # Update running_mean
-            if isinstance(self.running_mean, intel64.ideep.mdarray):
-                self.running_mean.inplace_axpby(
-                    self.decay, (1 - self.decay), self.mean)
-            else:
-                self.running_mean *= self.decay
-                self.running_mean += self.mean * (1 - self.decay)
-
-            # Update running_var
-            if isinstance(self.running_var, intel64.ideep.mdarray):
-                self.running_var.inplace_axpby(
-                    self.decay, (1 - self.decay), self.var * adjust)
-            else:
-                self.running_var *= self.decay
-                self.running_var += self.var * adjust * (1 - self.decay)
-
-            if expand_dim:
-                y = numpy.squeeze(y, axis=(2, 3))
-
+            y, self.mean, self.var, self.inv_std = self.static_bn_ideep(
+                inputs=[x, gamma, beta])
         elif self.use_cudnn:
-            # TODO(niboshi): Refactor cuDNN part into a separate method
-            x = cuda.cupy.ascontiguousarray(x)
-
-            gamma = cuda.cupy.ascontiguousarray(gamma)
-            beta = cuda.cupy.ascontiguousarray(beta)
-            dtype = x.dtype
-            handle = cudnn.get_handle()
-            x_desc = cudnn.create_tensor_descriptor(
-                _as4darray(x, self.mode))
-            cudnn_mode = self.mode.get_cudnn_mode()
-            derivedBnDesc = cudnn.create_uninitialized_tensor_descriptor()
-            libcudnn.deriveBNTensorDescriptor(derivedBnDesc.value,
-                                              x_desc.value, cudnn_mode)
-            dtype_param = _get_dtype_of_tensor_descriptor(derivedBnDesc)
-            if dtype_param is not dtype:
-                gamma = gamma.astype(dtype_param)
-                beta = beta.astype(dtype_param)
-                running_mean = self.running_mean.astype(dtype_param)
-                running_var = self.running_var.astype(dtype_param)
-            else:
-                running_mean = self.running_mean
-                running_var = self.running_var
-
-            oz_dtype = 'd' if x.dtype == 'd' else 'f'
-            one = numpy.array(1, dtype=oz_dtype).ctypes
-            zero = numpy.array(0, dtype=oz_dtype).ctypes
-            y = cuda.cupy.empty_like(x)
-            # Factor used in the moving average
-            factor = 1 - self.decay
-
-            if self.mean is None:
-                # Output cache to speed up backward pass.
-                self.mean = xp.empty_like(gamma)
-                # Output cache to speed up backward pass.
-                self.inv_std = xp.empty_like(gamma)
-            # Note: cuDNN computes the mini-batch mean and variance
-            # internally. We can simply (optionally) pass
-            # it the running-average mean and variance arrays.
-            # Note: This API seems to set the inverse of the standard deviation
-            # (instead of variance) to resultSaveInvVariance argument. The
-            # current implementation of our BN depends on this behavior so that
-            # we can reduce the number of reduction kernels.
-            libcudnn.batchNormalizationForwardTraining(
-                handle, cudnn_mode, one.data, zero.data,
-                x_desc.value, x.data.ptr, x_desc.value,
-                y.data.ptr, derivedBnDesc.value, gamma.data.ptr,
-                beta.data.ptr, factor, running_mean.data.ptr,
-                running_var.data.ptr, self.eps,
-                self.mean.data.ptr, self.inv_std.data.ptr)
-
-            # Note: When the CUDNN_BATCHNORM_SPATIAL_PERSISTENT mode is used,
-            # there is a possibility of numerical overflow. You can use
-            # queryRuntimeError() to make sure whether the overflow actually
-            # occured or not during the batch normalization.
-            if (cudnn_mode is libcudnn.CUDNN_BATCHNORM_SPATIAL_PERSISTENT and
-                    configuration.config.debug):
-                query_mode = libcudnn.CUDNN_ERRQUERY_BLOCKING
-                rstatus = libcudnn.queryRuntimeError(handle, query_mode)
-                if rstatus is not libcudnn.CUDNN_STATUS_SUCCESS:
-                    warnings.warn(
-                        'A numerical overflow might have happend in cuDNN'
-                        'batch normalization (status:{})'.format(rstatus))
-
-            if dtype_param is not dtype:
-                # When data type of prameters is converted, say, from fp16
-                # to fp32, the values of fp32 arrays of running_mean and
-                # running_var updated by batchNormalizationForwardTraining
-                # must be explicitly written back to their original fp16
-                # arrays.
-                running_mean = running_mean.astype(dtype)
-                running_var = running_var.astype(dtype)
-                self.running_mean.data.copy_from(running_mean.data,
-                                                 running_mean.nbytes)
-                self.running_var.data.copy_from(running_var.data,
-                                                running_var.nbytes)
+            y, = self.static_bn_cudnn(inputs=[x, gamma, beta])
+        elif xp is numpy:
+            # The statistics and the output are preallocated so that a static
+            # schedule can reuse them in every iteration.
+            self.mean = numpy.empty_like(gamma)
+            self.inv_std = numpy.empty_like(gamma)
+            var = numpy.empty_like(gamma)
+            y = numpy.empty_like(x)
+            self.static_bn_cpu(
+                inputs=[x, gamma, beta],
+                outputs=[self.mean, self.inv_std, var, y])
         else:
-            # Generic CPU and GPU implementation
-
-            gamma = gamma[expander]
-            beta = beta[expander]
-            self.mean = x.mean(axis=self.axis)
-            var = x.var(axis=self.axis)
-            if xp is numpy:
-                self.inv_std = numpy.reciprocal(numpy.sqrt(
-                    var + self.eps, dtype=x.dtype))
-            else:
-                self.inv_std = cuda.cupyx.rsqrt(var + self.eps)
-            y = _apply_bn_fwd(xp, x, self.mean[expander],
-                              self.inv_std[expander], gamma, beta)
-            # Update running statistics
-            m = x.size // gamma.size
-            adjust = m / max(m - 1., 1.)  # unbiased estimation
-            self.running_mean *= self.decay
-            self.running_mean += (1 - self.decay) * self.mean
-            self.running_var *= self.decay
-            self.running_var += (1 - self.decay) * adjust * var
+            y, self.mean, self.inv_std = self.static_bn_gpu(
+                inputs=[x, gamma, beta])
 
         return y,
 
@@ -292,6 +342,8 @@ class BatchNormalization(function_node.FunctionNode):
 
 class BatchNormalizationGrad(function.Function):
 
+    _supports_static_optimizations = True
+
     def __init__(self, eps, use_cudnn, mode, expander, axis, mean, var,
                  inv_std, key_axis):
         self.eps = eps
@@ -305,101 +357,145 @@ class BatchNormalizationGrad(function.Function):
         self.inv_std = inv_std
         self.key_axis = key_axis
 
+    @static_code
+    def static_bn_grad_ideep(self, inputs):
+        x, gamma, gy, mean, var = inputs
+        expand_dim = False
+        if x.ndim == 2:
+            expand_dim = True
+            x = x[:, :, None, None]
+            gy = gy[:, :, None, None]
+
+        gx, gW = intel64.ideep.batchNormalization.Backward(
+            intel64.ideep.array(x),
+            intel64.ideep.array(gy),
+            mean,
+            var,
+            intel64.ideep.array(gamma),
+            self.eps)
+
+        ggamma, gbeta = gW[:2]
+
+        if expand_dim:
+            gx = numpy.squeeze(gx, axis=(2, 3))
+        return gx, ggamma, gbeta
+
+    @static_code
+    def static_bn_grad_cudnn(self, inputs):
+        x, gamma, gy, mean, inv_std = inputs
+        x = cuda.cupy.ascontiguousarray(x)
+        gamma = cuda.cupy.ascontiguousarray(gamma)
+        gy = cuda.cupy.ascontiguousarray(gy)
+        dtype = x.dtype
+        handle = cudnn.get_handle()
+        x_desc = cudnn.create_tensor_descriptor(
+            _as4darray(x, self.mode))
+        cudnn_mode = self.mode.get_cudnn_mode()
+        derivedBnDesc = cudnn.create_uninitialized_tensor_descriptor()
+        libcudnn.deriveBNTensorDescriptor(derivedBnDesc.value,
+                                          x_desc.value, cudnn_mode)
+        dtype_param = _get_dtype_of_tensor_descriptor(derivedBnDesc)
+        if dtype_param is not dtype:
+            gamma = gamma.astype(dtype_param)
+        oz_dtype = 'd' if x.dtype == 'd' else 'f'
+        one = numpy.array(1, dtype=oz_dtype).ctypes
+        zero = numpy.array(0, dtype=oz_dtype).ctypes
+        gx = cuda.cupy.empty_like(x)
+        ggamma = cuda.cupy.empty_like(gamma)
+        gbeta = cuda.cupy.empty_like(gamma)
+        libcudnn.batchNormalizationBackward(
+            handle, cudnn_mode, one.data, zero.data,
+            one.data, zero.data, x_desc.value, x.data.ptr,
+            x_desc.value, gy.data.ptr, x_desc.value, gx.data.ptr,
+            derivedBnDesc.value, gamma.data.ptr,
+            ggamma.data.ptr, gbeta.data.ptr,
+            self.eps, mean.data.ptr, inv_std.data.ptr)
+
+        # Note: When the CUDNN_BATCHNORM_SPATIAL_PERSISTENT mode is used,
+        # there is a possibility of numerical overflow. You can use
+        # queryRuntimeError() to make sure whether the overflow actually
+        # occured or not during the batch normalization.
+        if (cudnn_mode is libcudnn.CUDNN_BATCHNORM_SPATIAL_PERSISTENT and
+                configuration.config.debug):
+            query_mode = libcudnn.CUDNN_ERRQUERY_BLOCKING
+            rstatus = libcudnn.queryRuntimeError(handle, query_mode)
+            if rstatus is not libcudnn.CUDNN_STATUS_SUCCESS:
+                warnings.warn(
+                    'A numerical overflow might have happend in cuDNN'
+                    'batch normalization (status:{})'.format(rstatus))
+
+        if dtype_param is not dtype:
+            ggamma = ggamma.astype(dtype)
+            gbeta = gbeta.astype(dtype)
+        return gx, ggamma, gbeta
+
+    @static_code
+    def static_bn_grad_cpu(self, inputs, outputs):
+        x, gamma, gy, mean, inv_std = inputs
+        gx, ggamma, gbeta, x_hat, coeff = outputs
+        expander = self.expander
+        inv_m = gamma.dtype.type(1. / (x.size // gamma.size))
+        numpy.sum(gy, axis=self.axis, out=gbeta)
+        numpy.subtract(x, mean[expander], out=x_hat)
+        x_hat *= inv_std[expander]
+        # gx is used as a temporary array until the last step.
+        numpy.multiply(gy, x_hat, out=gx)
+        numpy.sum(gx, axis=self.axis, out=ggamma)
+        # gx = (gamma * inv_std) * (gy - (x_hat * ggamma + gbeta) * inv_m)
+        numpy.multiply(x_hat, ggamma[expander], out=gx)
+        gx += gbeta[expander]
+        gx *= inv_m
+        numpy.subtract(gy, gx, out=gx)
+        numpy.multiply(gamma, inv_std, out=coeff)
+        gx *= coeff[expander]
+
+    @static_code
+    def static_bn_grad_gpu(self, inputs):
+        x, gamma, gy, mean, inv_std = inputs
+        expander = self.expander
+        inv_m = gamma.dtype.type(1. / (x.size // gamma.size))
+        gbeta = gy.sum(axis=self.axis)
+        x_hat = _x_hat(x, mean[expander], inv_std[expander])
+        ggamma = (gy * x_hat).sum(axis=self.axis)
+        gx = cuda.elementwise(
+            '''
+            T gy, T x_hat, T gamma, T inv_std, T ggamma, T gbeta,
+            T inv_m
+            ''',
+            'T gx',
+            '''
+            gx = (gamma * inv_std) * (
+                gy - (x_hat * ggamma + gbeta) * inv_m)
+            ''', 'bn_bwd')(gy, x_hat, gamma[expander],
+                           inv_std[expander], ggamma[expander],
+                           gbeta[expander], inv_m)
+        return gx, ggamma, gbeta
+
     def forward(self, inputs):
         self.retain_inputs((0, 1, 2))
         x, gamma, gy = inputs
-        expander = self.expander
-        inv_m = gamma.dtype.type(1. / (x.size // gamma.size))
         xp = backend.get_array_module(x)
 
         if self.use_ideep:
-            # TODO(niboshi): Refactor iDeep part into a separate method
-            expand_dim = False
-            if x.ndim == 2:
-                expand_dim = True
-                x = x[:, :, None, None]
-                gy = gy[:, :, None, None]
-
-            gx, gW = intel64.ideep.batchNormalization.Backward(
-                intel64.ideep.array(x),
-                intel64.ideep.array(gy),
-                self.mean,
-                self.var,
-                intel64.ideep.array(gamma),
-                self.eps)
-
-            ggamma, gbeta = gW[:2]
-
-            if expand_dim:
-                gx = numpy.squeeze(gx, axis=(2, 3))
-
+            gx, ggamma, gbeta = self.static_bn_grad_ideep(
+                inputs=[x, gamma, gy, self.mean, self.var])
         elif self.use_cudnn:
-            # TODO(niboshi): Refactor cuDNN part into a separate method
-            x = cuda.cupy.ascontiguousarray(x)
-            gamma = cuda.cupy.ascontiguousarray(gamma)
-            gy = cuda.cupy.ascontiguousarray(gy)
-            dtype = x.dtype
-            handle = cudnn.get_handle()
-            x_desc = cudnn.create_tensor_descriptor(
-                _as4darray(x, self.mode))
-            cudnn_mode = self.mode.get_cudnn_mode()
-            derivedBnDesc = cudnn.create_uninitialized_tensor_descriptor()
-            libcudnn.deriveBNTensorDescriptor(derivedBnDesc.value,
-                                              x_desc.value, cudnn_mode)
-            dtype_param = _get_dtype_of_tensor_descriptor(derivedBnDesc)
-            if dtype_param is not dtype:
-                gamma = gamma.astype(dtype_param)
-            oz_dtype = 'd' if x.dtype == 'd' else 'f'
-            one = numpy.array(1, dtype=oz_dtype).ctypes
-            zero = numpy.array(0, dtype=oz_dtype).ctypes
-            gx = cuda.cupy.empty_like(x)
-            ggamma = cuda.cupy.empty_like(gamma)
-            gbeta = cuda.cupy.empty_like(gamma)
-            libcudnn.batchNormalizationBackward(
-                handle, cudnn_mode, one.data, zero.data,
-                one.data, zero.data, x_desc.value, x.data.ptr,
-                x_desc.value, gy.data.ptr, x_desc.value, gx.data.ptr,
-                derivedBnDesc.value, gamma.data.ptr,
-                ggamma.data.ptr, gbeta.data.ptr,
-                self.eps, self.mean.data.ptr, self.inv_std.data.ptr)
-
-            # Note: When the CUDNN_BATCHNORM_SPATIAL_PERSISTENT mode is used,
-            # there is a possibility of numerical overflow. You can use
-            # queryRuntimeError() to make sure whether the overflow actually
-            # occured or not during the batch normalization.
-            if (cudnn_mode is libcudnn.CUDNN_BATCHNORM_SPATIAL_PERSISTENT and
-                    configuration.config.debug):
-                query_mode = libcudnn.CUDNN_ERRQUERY_BLOCKING
-                rstatus = libcudnn.queryRuntimeError(handle, query_mode)
-                if rstatus is not libcudnn.CUDNN_STATUS_SUCCESS:
-                    warnings.warn(
-                        'A numerical overflow might have happend in cuDNN'
-                        'batch normalization (status:{})'.format(rstatus))
-
-            if dtype_param is not dtype:
-                ggamma = ggamma.astype(dtype)
-                gbeta = gbeta.astype(dtype)
+            gx, ggamma, gbeta = self.static_bn_grad_cudnn(
+                inputs=[x, gamma, gy, self.mean, self.inv_std])
+        elif xp is numpy:
+            # The gradients and the temporary arrays are preallocated so that
+            # a static schedule can reuse them in every iteration.
+            gx = numpy.empty_like(x)
+            ggamma = numpy.empty_like(gamma)
+            gbeta = numpy.empty_like(gamma)
+            x_hat = numpy.empty_like(x)
+            coeff = numpy.empty_like(gamma)
+            self.static_bn_grad_cpu(
+                inputs=[x, gamma, gy, self.mean, self.inv_std],
+                outputs=[gx, ggamma, gbeta, x_hat, coeff])
         else:
-            # CPU and GPU implementation
-            gbeta = gy.sum(axis=self.axis)
-            x_hat = _x_hat(x, self.mean[expander], self.inv_std[expander])
-            ggamma = (gy * x_hat).sum(axis=self.axis)
-            if xp is numpy:
-                gx = (gamma * self.inv_std)[expander] * (
-                    gy - (x_hat * ggamma[expander] + gbeta[expander]) * inv_m)
-            else:
-                gx = cuda.elementwise(
-                    '''
-                    T gy, T x_hat, T gamma, T inv_std, T ggamma, T gbeta,
-                    T inv_m
-                    ''',
-                    'T gx',
-                    '''
-                    gx = (gamma * inv_std) * (
-                        gy - (x_hat * ggamma + gbeta) * inv_m)
-                    ''', 'bn_bwd')(gy, x_hat, gamma[expander],
-                                   self.inv_std[expander], ggamma[expander],
-                                   gbeta[expander], inv_m)
+            gx, ggamma, gbeta = self.static_bn_grad_gpu(
+                inputs=[x, gamma, gy, self.mean, self.inv_std])
         self.retain_outputs((0, 1))
         return gx, ggamma, gbeta
 
@@ -5,6 +5,7 @@ from chainer.backends import cuda
 from chainer.backends import intel64
 from chainer import function_node
 from chainer.functions.pooling import pooling_2d
+from chainer.graph_optimizations import static_code
 from chainer.utils import conv
 
 
@@ -12,32 +13,27 @@ class MaxPooling2D(pooling_2d.Pooling2D):
 
     """Max pooling over a set of 2d planes."""
 
-    def forward_cpu(self, x):
-        if (intel64.should_use_ideep('>=auto')
-                and intel64.inputs_all_ready(x)):
-            return self._forward_ideep(x)
+    _supports_static_optimizations = True
 
-        self._in_shape = x[0].shape
-        self._in_dtype = x[0].dtype
-
-        col = conv.im2col_cpu(
-            x[0], self.kh, self.kw, self.sy, self.sx, self.ph, self.pw,
-            pval=-float('inf'), cover_all=self.cover_all)
+    @static_code
+    def static_max_pooling_2d_cpu(self, inputs, outputs):
+        x, = inputs
+        col, indexes, y = outputs
         n, c, kh, kw, out_h, out_w = col.shape
+        conv.im2col_cpu(
+            x, self.kh, self.kw, self.sy, self.sx, self.ph, self.pw,
+            pval=-float('inf'), cover_all=self.cover_all, out=col)
         col = col.reshape(n, c, kh * kw, out_h, out_w)
 
         # We select maximum twice, since the implementation using numpy.choose
         # hits its bug when kh * kw >= 32.
-        self.indexes = col.argmax(axis=2)
-        y = col.max(axis=2)
-        return y,
-
-    def _forward_ideep(self, x):
-        self._in_shape = x[0].shape
-        self._in_dtype = x[0].dtype
-        self.retain_inputs((0,))
+        numpy.argmax(col, axis=2, out=indexes)
+        numpy.max(col, axis=2, out=y)
 
-        n, c, h, w = x[0].shape
+    @static_code
+    def static_max_pooling_2d_ideep(self, inputs):
+        x, = inputs
+        n, c, h, w = x.shape
         y_h = conv.get_conv_outsize(
             h, self.kh, self.sy, self.ph, self.cover_all)
         assert y_h > 0, 'Height in the output should be positive.'
@@ -54,28 +50,16 @@ class MaxPooling2D(pooling_2d.Pooling2D):
             self.ph, self.pw,
             self.pd, self.pr,
             intel64.ideep.pooling2DParam.pooling_max)
-        y, self.indexes = intel64.ideep.pooling2D.Forward(
-            intel64.ideep.array(x[0]), pp)
-        return y,
-
-    def forward_gpu(self, x):
-        if chainer.should_use_cudnn('>=auto'):
-            self.retain_inputs((0,))
-            return super(MaxPooling2D, self).forward_gpu(x)
-
-        self._in_shape = x[0].shape
-        self._in_dtype = x[0].dtype
-
-        n, c, h, w = x[0].shape
-        y_h = conv.get_conv_outsize(
-            h, self.kh, self.sy, self.ph, self.cover_all)
-        assert y_h > 0, 'Height in the output should be positive.'
-        y_w = conv.get_conv_outsize(
-            w, self.kw, self.sx, self.pw, self.cover_all)
-        assert y_w > 0, 'Width in the output should be positive.'
-        y = cuda.cupy.empty((n, c, y_h, y_w), dtype=x[0].dtype)
-        self.indexes = cuda.cupy.empty((n, c, y_h, y_w), dtype=numpy.int32)
-
+        y, indexes = intel64.ideep.pooling2D.Forward(
+            intel64.ideep.array(x), pp)
+        return y, indexes
+
+    @static_code
+    def static_max_pooling_2d_gpu(self, inputs, outputs):
+        x, = inputs
+        indexes, y = outputs
+        n, c, h, w = x.shape
+        y_h, y_w = y.shape[2:]
         cuda.elementwise(
             'raw T in, int32 h, int32 w, int32 out_h, int32 out_w,'
             'int32 kh, int32 kw, int32 sy, int32 sx, int32 ph, int32 pw',
@@ -108,10 +92,66 @@ class MaxPooling2D(pooling_2d.Pooling2D):
                int argmax_ky = argmax_y + ph - out_y * sy;
                int argmax_kx = argmax_x + pw - out_x * sx;
                indexes = argmax_kx + kw * argmax_ky;
-            ''', 'max_pool_fwd')(x[0].reduced_view(),
+            ''', 'max_pool_fwd')(x.reduced_view(),
                                  h, w, y_h, y_w, self.kh, self.kw,
                                  self.sy, self.sx, self.ph, self.pw,
-                                 y, self.indexes)
+                                 y, indexes)
+
+    @static_code
+    def static_max_pooling_2d_cudnn(self, inputs):
+        return super(MaxPooling2D, self).forward_gpu(inputs)
+
+    def forward_cpu(self, x):
+        if (intel64.should_use_ideep('>=auto')
+                and intel64.inputs_all_ready(x)):
+            return self._forward_ideep(x)
+
+        self._in_shape = x[0].shape
+        self._in_dtype = x[0].dtype
+
+        # The columns, the indexes and the output are preallocated so that a
+        # static schedule can reuse them in every iteration.
+        n, c, h, w = x[0].shape
+        out_h = conv.get_conv_outsize(
+            h, self.kh, self.sy, self.ph, self.cover_all)
+        assert out_h > 0, 'Height in the output should be positive.'
+        out_w = conv.get_conv_outsize(
+            w, self.kw, self.sx, self.pw, self.cover_all)
+        assert out_w > 0, 'Width in the output should be positive.'
+        col = numpy.empty(
+            (n, c, self.kh, self.kw, out_h, out_w), dtype=x[0].dtype)
+        self.indexes = numpy.empty((n, c, out_h, out_w), dtype=numpy.intp)
+        y = numpy.empty((n, c, out_h, out_w), dtype=x[0].dtype)
+        self.static_max_pooling_2d_cpu(
+            inputs=list(x), outputs=[col, self.indexes, y])
+        return y,
+
+    def _forward_ideep(self, x):
+        self._in_shape = x[0].shape
+        self._in_dtype = x[0].dtype
+        self.retain_inputs((0,))
+        y, self.indexes = self.static_max_pooling_2d_ideep(inputs=list(x))
+        return y,
+
+    def forward_gpu(self, x):
+        if chainer.should_use_cudnn('>=auto'):
+            self.retain_inputs((0,))
+            return self.static_max_pooling_2d_cudnn(inputs=list(x))
+
+        self._in_shape = x[0].shape
+        self._in_dtype = x[0].dtype
+
+        n, c, h, w = x[0].shape
+        y_h = conv.get_conv_outsize(
+            h, self.kh, self.sy, self.ph, self.cover_all)
+        assert y_h > 0, 'Height in the output should be positive.'
+        y_w = conv.get_conv_outsize(
+            w, self.kw, self.sx, self.pw, self.cover_all)
+        assert y_w > 0, 'Width in the output should be positive.'
+        y = cuda.cupy.empty((n, c, y_h, y_w), dtype=x[0].dtype)
+        self.indexes = cuda.cupy.empty((n, c, y_h, y_w), dtype=numpy.int32)
+        self.static_max_pooling_2d_gpu(
+            inputs=list(x), outputs=[self.indexes, y])
         return y,
 
     def backward(self, indexes, gy):
@@ -125,6 +165,8 @@ class MaxPooling2D(pooling_2d.Pooling2D):
 
 class MaxPooling2DGrad(function_node.FunctionNode):
 
+    _supports_static_optimizations = True
+
     def __init__(self, mpool2d):
         self.kh = mpool2d.kh
         self.kw = mpool2d.kw
@@ -140,38 +182,31 @@ class MaxPooling2DGrad(function_node.FunctionNode):
             self._in_dtype = mpool2d._in_dtype
         self.mpool2d = mpool2d
 
-    def forward_cpu(self, gy):
-        if (intel64.should_use_ideep('>=auto')
-                and intel64.inputs_all_ready(gy)):
-            return self._forward_ideep(gy)
-
-        n, c, out_h, out_w = gy[0].shape
-        h, w = self._in_shape[2:]
+    @static_code
+    def static_max_pooling_2d_grad_cpu(self, inputs, outputs):
+        indexes, gy = inputs
+        flat_indexes, gcol, gx = outputs
+        n, c, out_h, out_w = gy.shape
+        h, w = gx.shape[2:]
         kh, kw = self.kh, self.kw
 
-        gcol = numpy.zeros(
-            (n * c * out_h * out_w * kh * kw), dtype=self._in_dtype)
-
-        indexes = self.indexes.flatten()
-        indexes += numpy.arange(0, indexes.size * kh * kw, kh * kw)
-
-        gcol[indexes] = gy[0].ravel()
+        # gcol is laid out as (n, c, out_h, out_w, kh * kw), and gy is
+        # scattered to the positions of the maxima.
+        numpy.add(indexes, self._offsets, out=flat_indexes)
+        gcol.fill(0)
+        numpy.put(gcol, flat_indexes, gy)
         gcol = gcol.reshape(n, c, out_h, out_w, kh, kw)
         gcol = numpy.swapaxes(gcol, 2, 4)
         gcol = numpy.swapaxes(gcol, 3, 5)
 
-        gx = conv.col2im_cpu(gcol, self.sy, self.sx, self.ph, self.pw, h, w)
-        return gx,
-
-    def _forward_ideep(self, gy):
-        # FIXME
-        # Here we expect indexes is returned from MKL-DNN
-        # otherwise, there are dtype mismatch for reorder (int64-->uint8)
-        if not isinstance(self.indexes, intel64.ideep.mdarray):
-            return self.forward_cpu(gy)
+        conv.col2im_cpu(
+            gcol, self.sy, self.sx, self.ph, self.pw, h, w, out=gx)
 
+    @static_code
+    def static_max_pooling_2d_grad_ideep(self, inputs):
+        indexes, gy = inputs
         n, c, h, w = self._in_shape
-        y_h, y_w = gy[0].shape[2:]
+        y_h, y_w = gy.shape[2:]
         x, = self.mpool2d.get_retained_inputs()
 
         self.pd = self.sy * (y_h - 1) + self.kh - h - self.ph
@@ -185,21 +220,18 @@ class MaxPooling2DGrad(function_node.FunctionNode):
             self.pd, self.pr,
             intel64.ideep.pooling2DParam.pooling_max)
 
-        self.indexes = intel64.ideep.array(self.indexes)
         gx = intel64.ideep.pooling2D.Backward(
             intel64.ideep.array(x.data),
-            intel64.ideep.array(gy[0]),
-            self.indexes, pp)
+            intel64.ideep.array(gy),
+            intel64.ideep.array(indexes), pp)
         return gx,
 
-    def forward_gpu(self, gy):
-        if self._used_cudnn:
-            x, = self.mpool2d.get_retained_inputs()
-            return self.mpool2d.backward_gpu((x.data,), gy)
-        n, c, h, w = self._in_shape
-        y_h, y_w = gy[0].shape[2:]
-        gx = cuda.cupy.empty(self._in_shape, self._in_dtype)
-
+    @static_code
+    def static_max_pooling_2d_grad_gpu(self, inputs, outputs):
+        indexes, gy = inputs
+        gx, = outputs
+        n, c, h, w = gx.shape
+        y_h, y_w = gy.shape[2:]
         cuda.elementwise(
             'raw T gy, raw S indexes, int32 h, int32 w,'
             'int32 out_h, int32 out_w, int32 kh, int32 kw,'
@@ -227,10 +259,56 @@ class MaxPooling2DGrad(function_node.FunctionNode):
                }
                gx = val;
             ''',
-            'max_pool_bwd')(gy[0].reduced_view(), self.indexes.reduced_view(),
+            'max_pool_bwd')(gy.reduced_view(), indexes.reduced_view(),
                             h, w, y_h, y_w, self.kh, self.kw,
                             self.sy, self.sx, self.ph, self.pw,
                             gx)
+
+    @static_code
+    def static_max_pooling_2d_grad_cudnn(self, inputs):
+        x, gy = inputs
+        return self.mpool2d.backward_gpu((x,), (gy,))
+
+    def forward_cpu(self, gy):
+        if (intel64.should_use_ideep('>=auto')
+                and intel64.inputs_all_ready(gy)):
+            return self._forward_ideep(gy)
+
+        n, c, out_h, out_w = gy[0].shape
+        kh, kw = self.kh, self.kw
+
+        # The offsets of the windows in gcol do not change between
+        # iterations, so they are computed only once.
+        self._offsets = numpy.arange(
+            0, n * c * out_h * out_w * kh * kw, kh * kw).reshape(
+                n, c, out_h, out_w)
+        flat_indexes = numpy.empty_like(self._offsets)
+        gcol = numpy.empty(
+            (n, c, out_h, out_w, kh * kw), dtype=self._in_dtype)
+        gx = numpy.empty(self._in_shape, dtype=self._in_dtype)
+        self.static_max_pooling_2d_grad_cpu(
+            inputs=[self.indexes, gy[0]],
+            outputs=[flat_indexes, gcol, gx])
+        return gx,
+
+    def _forward_ideep(self, gy):
+        # FIXME
+        # Here we expect indexes is returned from MKL-DNN
+        # otherwise, there are dtype mismatch for reorder (int64-->uint8)
+        if not isinstance(self.indexes, intel64.ideep.mdarray):
+            return self.forward_cpu(gy)
+
+        return self.static_max_pooling_2d_grad_ideep(
+            inputs=[self.indexes, gy[0]])
+
+    def forward_gpu(self, gy):
+        if self._used_cudnn:
+            x, = self.mpool2d.get_retained_inputs()
+            return self.static_max_pooling_2d_grad_cudnn(
+                inputs=[x.data, gy[0]])
+        gx = cuda.cupy.empty(self._in_shape, self._in_dtype)
+        self.static_max_pooling_2d_grad_gpu(
+            inputs=[self.indexes, gy[0]], outputs=[gx])
         return gx,
 
     def backward(self, indexes, ggx):
@@ -1,4 +1,9 @@
+import contextlib
+
+import numpy
+
 import chainer
+from chainer import backend
 from chainer import function
 from chainer import function_node
 from chainer import variable
@@ -27,6 +32,68 @@ def _call_func(func, xs):
     return outs
 
 
+class _LazyRandomState(object):
+
+    # Stands for CuPy's generator of the current device in the forward
+    # computation. The private generator of the segment is created and seeded
+    # from the user's generator only when random numbers are actually drawn.
+
+    def __init__(self, owner, user_state):
+        self._owner = owner
+        self._user_state = user_state
+        self._state = None
+
+    def __getattr__(self, name):
+        if self._state is None:
+            seed = int(self._user_state.randint(2 ** 31))
+            self._owner.seed = seed
+            self._state = self._owner.xp.random.RandomState(seed)
+        return getattr(self._state, name)
+
+
+class _RandomState(object):
+
+    # Snapshot of the random number generators used to reproduce the random
+    # numbers drawn in the forward computation on its recomputation. The state
+    # of NumPy's global generator is saved as is. CuPy's generator cannot be
+    # saved, so the segment draws from a private generator instead, which is
+    # seeded again for the recomputation. The user's generators are left
+    # intact if the segment draws no random numbers.
+
+    def __init__(self, xp):
+        self.xp = xp
+        self.numpy_state = numpy.random.get_state()
+        self.seed = None
+
+    @contextlib.contextmanager
+    def record(self):
+        if self.xp is numpy:
+            yield
+            return
+        user_state = self.xp.random.get_random_state()
+        self.xp.random.set_random_state(_LazyRandomState(self, user_state))
+        try:
+            yield
+        finally:
+            self.xp.random.set_random_state(user_state)
+
+    @contextlib.contextmanager
+    def replay(self):
+        numpy_state = numpy.random.get_state()
+        numpy.random.set_state(self.numpy_state)
+        user_state = None
+        if self.seed is not None:
+            user_state = self.xp.random.get_random_state()
+            self.xp.random.set_random_state(
+                self.xp.random.RandomState(self.seed))
+        try:
+            yield
+        finally:
+            numpy.random.set_state(numpy_state)
+            if user_state is not None:
+                self.xp.random.set_random_state(user_state)
+
+
 class Forget(function_node.FunctionNode):
 
     def __init__(self, func):
@@ -36,7 +103,9 @@ class Forget(function_node.FunctionNode):
 
     def forward(self, inputs):
         self.retain_inputs(tuple(range(len(inputs))))
-        with function.no_backprop_mode():
+        self._random_state = _RandomState(backend.get_array_module(*inputs))
+        self._train = chainer.config.train
+        with function.no_backprop_mode(), self._random_state.record():
             xs = [variable.Variable(x) for x in inputs]
             outs = _call_func(self.func, xs)
         return tuple(out.data for out in outs)
@@ -51,7 +120,10 @@ class Forget(function_node.FunctionNode):
         # Create new variables that have no creators
         dummy_inputs = tuple([variable.Variable(inp.array) for inp in inputs])
 
-        with function.force_backprop_mode():
+        with function.force_backprop_mode(), \
+                chainer.using_config('train', self._train), \
+                chainer.using_config('in_recomputing', True), \
+                self._random_state.replay():
             outs = _call_func(self.func, dummy_inputs)
             assert len(outs) == len(grad_outputs)
             if len(outs) > 1:
@@ -106,10 +178,21 @@ def forget(func, *xs):
 
     .. note::
 
-        ``F.forget`` does not support functions which behave differently in
-        multiple calls with the same inputs, such as
-        :meth:`F.dropout() <chainer.functions.dropout>` and
-        :meth:`F.negative_sampling() <chainer.functions.negative_sampling>`.
+        ``F.forget`` reproduces the random numbers drawn from NumPy's global
+        random number generator and CuPy's random number generator on the
+        recalculation, so that functions like
+        :meth:`F.dropout() <chainer.functions.dropout>` behave in the same
+        way as in the forward propagation. The ``train`` configuration is
+        also restored. Note that the state of NumPy's generator is saved as
+        is while the random numbers on GPU are drawn from a private CuPy
+        generator seeded from the current one (only if random numbers are
+        drawn at all), and that other sources of nondeterminism (e.g.,
+        cuDNN's dropout states) are not reproduced. The ``in_recomputing``
+        configuration is set to ``True`` during the recalculation, so that
+        links updating their own states in the forward propagation do not
+        update them twice. :class:`~chainer.links.BatchNormalization` and
+        :class:`~chainer.links.BatchRenormalization` keep their running
+        statistics in this way.
 
     .. note::
 
@@ -1,3 +1,4 @@
+import functools
 import sys
 import weakref
 
@@ -12,6 +13,27 @@ def _is_xp(x):
     return isinstance(x, np.ndarray) or isinstance(x, cuda.ndarray)
 
 
+def _get_retained_arrays(function_node):
+    """Return the arrays retained by a function node."""
+    retained_in_vars = function_node.get_retained_inputs()
+    retained_out_vars = function_node.get_retained_outputs()
+    retained_vars = []
+    if retained_in_vars is not None:
+        retained_vars.extend(retained_in_vars)
+    if retained_out_vars is not None:
+        retained_vars.extend(retained_out_vars)
+    return [var.data for var in retained_vars]
+
+
+def _count_buffers(arrays):
+    """Return the number and the total size in bytes of distinct arrays."""
+    buffers = dict()
+    for ar in arrays:
+        if ar is not None:
+            buffers[id(ar)] = ar.nbytes
+    return len(buffers), sum(buffers.values())
+
+
 class ScheduleInfo(object):
 
     """A callable wrapper for a function in the static schedule.
@@ -59,6 +81,8 @@ class ScheduleInfo(object):
             maybe_func = self.args[0]
             if isinstance(maybe_func, chainer.FunctionNode):
                 self.function_node = maybe_func
+            elif isinstance(maybe_func, chainer.Function):
+                self.function_node = maybe_func.node
         # List of indices in unique_arrays to delete.
         self.delete_hooks = delete_hooks
 
@@ -204,10 +228,14 @@ class ArrayInfo(object):
         # case where the array was statically allocated in the
         # define-by-run code.
         self.static_allocation_index = None
+        self.static_allocation_pass_depth = None
         # If the array needs to be retained (was included in
         # retain_inputs/retain_outputs),
         # this will be set to True later.
         self.retain = False
+        # If the array is a view of another array in the static schedule,
+        # this is the index of that array in `unique_arrays`.
+        self.base_index = None
 
     def was_deleted(self):
         return self.weak_ref() is None
@@ -367,6 +395,8 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
         # output variables, if the index corresponds to an output
         # variable.
         self.unique_ind_to_out_var_ind = dict()
+        # Statistics computed by plan_buffer_sharing().
+        self.buffer_stats = None
 
     def get_unique_index_from_array(self, array):
         """Return the array index if it exists.
@@ -391,6 +421,20 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
             else:
                 return self.array_id_to_unique_index[ar_id]
 
+    def get_base_unique_index(self, array):
+        """Return the index of the array whose buffer `array` is a view of.
+
+        If `array` is a view of an array in `unique_arrays`, return its
+        index. Otherwise, return None.
+        """
+        base = getattr(array, 'base', None)
+        while base is not None:
+            unique_ind = self.get_unique_index_from_array(base)
+            if unique_ind is not None:
+                return unique_ind
+            base = getattr(base, 'base', None)
+        return None
+
     def get_contained_schedule(self):
         # Make and return the backward schedule (relative to
         # this schedule).
@@ -459,22 +503,8 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
             prev_sched_info = self.schedule_info_list[last_sched_info_ind]
             if prev_sched_info.function_node is not None:
                 # get retained inputs/outputs.
-                retained_in_vars = \
-                    prev_sched_info.function_node.get_retained_inputs()
-                retained_out_vars = \
-                    prev_sched_info.function_node.get_retained_outputs()
-                if (retained_in_vars is not None and
-                        retained_out_vars is not None):
-                    retained_vars = retained_in_vars + retained_out_vars
-                elif retained_in_vars is not None:
-                    retained_vars = retained_in_vars
-                elif retained_out_vars is not None:
-                    retained_vars = retained_out_vars
-                else:
-                    retained_vars = None
-                if retained_vars is not None:
-                    for var in retained_vars:
-                        retained_ids.add(id(var.data))
+                for ar in _get_retained_arrays(prev_sched_info.function_node):
+                    retained_ids.add(id(ar))
 
         for keep_id in retained_ids:
             unique_ind = self.array_id_to_unique_index[keep_id]
@@ -513,7 +543,9 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
                         # weak reference
                         # will be stored in the ArrayInfo below.
                         self.unique_arrays.append(None)
-                        self.unique_array_infos.append(ArrayInfo(x))
+                        ar_info = ArrayInfo(x)
+                        ar_info.base_index = self.get_base_unique_index(x)
+                        self.unique_array_infos.append(ar_info)
                         unique_ind = len(self.unique_arrays) - 1
                         self.array_id_to_unique_index[id(x)] = unique_ind
                     inputs_hooks.append((ind, unique_ind))
@@ -534,7 +566,11 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
                         # auto-intializing hooks are added. This will further
                         # reduce memory usage.
                         # self.unique_arrays.append(None)
-                        self.unique_array_infos.append(ArrayInfo(x))
+                        ar_info = ArrayInfo(x)
+                        sched_info_ind = len(self.schedule_info_list)
+                        ar_info.static_allocation_index = sched_info_ind
+                        ar_info.static_allocation_pass_depth = self.pass_depth
+                        self.unique_array_infos.append(ar_info)
                         unique_ind = len(self.unique_arrays) - 1
                         self.array_id_to_unique_index[id(x)] = unique_ind
                     outputs_hooks.append((ind, unique_ind))
@@ -564,6 +600,7 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
                         # would prevent garbage collection.
                         self.unique_arrays.append(None)
                         ar_info = ArrayInfo(item)
+                        ar_info.base_index = self.get_base_unique_index(item)
                         ar_info.dynamically_allocated = True
                         sched_info_ind = len(self.schedule_info_list)
                         ar_info.dynamic_allocation_index = sched_info_ind
@@ -646,8 +683,13 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
                 # This is the corresponding parameter array, which might
                 # have had its reference changed to a different array or set
                 # to None.
-                self.params_list[params_list_index].grad = \
-                    self.unique_arrays[unique_array_index]
+                param = self.params_list[params_list_index]
+                grad = self.unique_arrays[unique_array_index]
+                # Setting 'grad' creates a new gradient variable, so skip
+                # it when the parameter already refers to the scheduled
+                # array (the usual case when replaying the schedule).
+                if param.grad is not grad:
+                    param.grad = grad
 
     def run_param_post_hooks(self):
         """Update parameter attributes after schedule is executed.
@@ -847,6 +889,141 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
         print('end of build_schedule()')
         self.schedule_built = True
 
+    def plan_buffer_sharing(self):
+        """Share buffers among arrays with disjoint lifetimes.
+
+        This computes the live interval of each array in `unique_arrays`
+        over this schedule and all of its contained schedules, and assigns
+        arrays of the same shape, dtype, strides and device whose intervals
+        do not overlap to the same buffer.
+
+        This must be called on the forward schedule after the schedules of
+        all pass depths have been built. Only the arrays that are first
+        written through the `outputs` argument of a schedule function
+        are shared. Parameter arrays, input and output variable arrays,
+        retained arrays and arrays that are dynamically allocated inside
+        the schedule keep their own buffers.
+
+        The resulting statistics are stored in `self.buffer_stats`.
+        """
+        schedules = []
+        sched = self
+        while sched is not None:
+            schedules.append(sched)
+            sched = sched.backward_schedule_func
+
+        # The position of the first function of each pass depth in the
+        # concatenated schedule.
+        offsets = []
+        first_use = {}
+        last_use = {}
+        pinned = set()
+        # The arrays whose buffers may be read without a hook, so that the
+        # buffers of their bases must not be shared either.
+        kept = set()
+        step = 0
+        for sched in schedules:
+            offsets.append(step)
+            for (unique_ind, __) in sched.param_hooks:
+                pinned.add(unique_ind)
+            for (unique_ind, __) in sched.param_post_hooks:
+                pinned.add(unique_ind)
+            for (unique_ind, __) in sched.in_var_hooks:
+                kept.add(unique_ind)
+            for (__, unique_ind) in sched.out_var_hooks:
+                kept.add(unique_ind)
+            pinned.update(sched.dynamically_allocated_unique_index)
+            for sched_info in sched.schedule_info_list:
+                pinned.update(sched_info.delete_hooks)
+                for (__, unique_ind) in (sched_info.inputs_hooks +
+                                         sched_info.outputs_hooks):
+                    first_use.setdefault(unique_ind, step)
+                    last_use[unique_ind] = step
+                step += 1
+            # The arrays retained by the last function of a schedule are
+            # not marked in append_function(), so check them here.
+            if sched.schedule_info_list:
+                function_node = sched.schedule_info_list[-1].function_node
+                if function_node is not None:
+                    for ar in _get_retained_arrays(function_node):
+                        unique_ind = sched.get_unique_index_from_array(ar)
+                        if unique_ind is not None:
+                            kept.add(unique_ind)
+
+        # A view uses the buffer of its base, so the base stays in use as
+        # long as the view does. Views are registered after their bases, so
+        # visiting them in reverse order also handles views of views.
+        for unique_ind in reversed(range(len(self.unique_array_infos))):
+            info = self.unique_array_infos[unique_ind]
+            if info.retain:
+                kept.add(unique_ind)
+            base_ind = info.base_index
+            if base_ind is None:
+                continue
+            if unique_ind in kept or unique_ind not in last_use:
+                kept.add(base_ind)
+            else:
+                first_use[base_ind] = min(
+                    first_use.get(base_ind, first_use[unique_ind]),
+                    first_use[unique_ind])
+                last_use[base_ind] = max(
+                    last_use.get(base_ind, last_use[unique_ind]),
+                    last_use[unique_ind])
+        pinned.update(kept)
+
+        candidates = []
+        for unique_ind, info in enumerate(self.unique_array_infos):
+            ar = self.unique_arrays[unique_ind]
+            if (ar is None or unique_ind in pinned or info.retain or
+                    info.static_allocation_index is None or
+                    unique_ind not in first_use):
+                continue
+            allocation_step = (offsets[info.static_allocation_pass_depth] +
+                               info.static_allocation_index)
+            if first_use[unique_ind] != allocation_step:
+                # The array is read before it is written in the schedule.
+                continue
+            candidates.append(unique_ind)
+
+        # This is called between the forward and the backward pass of the
+        # first iteration.
+        backward_step = offsets[1] if len(offsets) > 1 else step
+        unshared_arrays = list(self.unique_arrays)
+        # Greedy interval partitioning: each slot is a pair of a buffer and
+        # the last step at which it is in use.
+        slots = dict()
+        candidates.sort(key=lambda unique_ind: first_use[unique_ind])
+        for unique_ind in candidates:
+            ar = self.unique_arrays[unique_ind]
+            info = self.unique_array_infos[unique_ind]
+            key = (type(ar), ar.shape, ar.dtype, ar.strides,
+                   getattr(info.device, 'id', info.device))
+            key_slots = slots.setdefault(key, [])
+            for slot in key_slots:
+                if slot[1] < first_use[unique_ind]:
+                    if first_use[unique_ind] < backward_step <= \
+                            last_use[unique_ind]:
+                        # The forward pass of the current iteration has
+                        # already written the array, and the backward pass
+                        # that follows will read it from the new buffer.
+                        slot[0][...] = ar
+                    self.unique_arrays[unique_ind] = slot[0]
+                    slot[1] = last_use[unique_ind]
+                    break
+            else:
+                key_slots.append([ar, last_use[unique_ind]])
+
+        num_arrays, unshared_memory = _count_buffers(unshared_arrays)
+        num_buffers, memory = _count_buffers(self.unique_arrays)
+        self.buffer_stats = {
+            'num_arrays': num_arrays,
+            'num_buffers': num_buffers,
+            'peak_memory_unshared': unshared_memory,
+            'peak_memory': memory,
+        }
+        if self.verbosity_level >= 1:
+            print('Buffer sharing: ', self.buffer_stats)
+
     def forward(self, inputs):
         if self.verbosity_level >= 2:
             print('Calling StaticScheduleFunction.forward()...')
@@ -934,6 +1111,9 @@ class StaticScheduleFunction(chainer.function_node.FunctionNode):
                 print('building backward schedule.')
             self.backward_schedule_func.build_schedule(self.chain,
                                                        new_grad_outputs)
+            if (self.schedule_manager.share_buffers and
+                    not self.enable_double_backprop):
+                self.plan_buffer_sharing()
 
         return self.backward_schedule_func.apply(grad_outputs)
 
@@ -950,14 +1130,19 @@ class ScheduleManager(object):
         usage by clearing the cached schedules whenever the training
         mode changes (that is, whenever `chainer.config.train` changes
         value) or whenever the mini-batch size changes.
+        share_buffers (bool): If `True`, share buffers among the arrays of
+        a schedule whose lifetimes do not overlap once its backward
+        schedule has been built.
 
 
     """
 
-    def __init__(self, minimize_cache_size=True, verbosity_level=0):
+    def __init__(self, minimize_cache_size=True, verbosity_level=0,
+                 share_buffers=True):
         # Maps a key string to a list of schedule functions.
         self.schedules = dict()
         self.minimize_cache_size = minimize_cache_size
+        self.share_buffers = share_buffers
         self.in_use_count = dict()
         self.forward_over = False
         self.prev_train_config = None
@@ -1086,6 +1271,39 @@ class ScheduleManager(object):
                           self.max_in_use_train)
             self.train_count = 0
 
+    @property
+    def buffer_stats(self):
+        """Buffer statistics of the cached schedules.
+
+        It is a dictionary with the following entries summed over all
+        schedules for which the buffers have been planned:
+
+        - ``'num_arrays'``: The number of distinct arrays used in the
+          schedules before buffer sharing.
+        - ``'num_buffers'``: The number of distinct buffers after buffer
+          sharing.
+        - ``'peak_memory_unshared'``: The total size in bytes of the arrays
+          before buffer sharing.
+        - ``'peak_memory'``: The total size in bytes of the buffers after
+          buffer sharing.
+
+        Since a schedule keeps all of its buffers across iterations, the
+        total size of the buffers is also its peak memory usage.
+
+        """
+        stats = {
+            'num_arrays': 0,
+            'num_buffers': 0,
+            'peak_memory_unshared': 0,
+            'peak_memory': 0,
+        }
+        for sched_list in self.schedules.values():
+            for sched in sched_list:
+                if sched.buffer_stats is not None:
+                    for key in stats:
+                        stats[key] += sched.buffer_stats[key]
+        return stats
+
     def __repr__(self):
         out = "ScheduleManager:\n"
         for key_str in self.schedules:
@@ -1246,6 +1464,15 @@ def static_graph(*args, **kwargs):
         enable_double_backprop (bool): If `True`, enable double-backprop.
             The default value is `False` (not enabled).
 
+        share_buffers (bool): If `True`, arrays in the forward and backward
+            schedules that have the same shape and dtype and whose
+            lifetimes do not overlap share the same buffer. This is done
+            once, after the backward schedule has been built, and is
+            skipped when double-backprop is enabled. The resulting
+            statistics are available from
+            ``chain.schedule_manager.buffer_stats``.
+            The default value is `True`.
+
     Returns:
         Wrapped ``__call__()`` method with static chain support.
 
@@ -1257,6 +1484,7 @@ def static_graph(*args, **kwargs):
     minimize_cache_size = False
     verbosity_level = 0
     enable_double_backprop = False
+    share_buffers = True
     zero_args = False
     if len(args) == 1 and not kwargs and callable(args[0]):
         callable_arg = args[0]
@@ -1270,8 +1498,11 @@ def static_graph(*args, **kwargs):
             verbosity_level = kwargs['verbosity_level']
         if 'enable_double_backprop' in kwargs:
             enable_double_backprop = kwargs['enable_double_backprop']
+        if 'share_buffers' in kwargs:
+            share_buffers = kwargs['share_buffers']
 
     def wrap(func):
+        @functools.wraps(func)
         def wrapped_func(*inner_args, **inner_kwargs):
             if verbosity_level >= 2:
                 print('Calling static chain...')
@@ -1302,7 +1533,8 @@ def static_graph(*args, **kwargs):
             if not hasattr(chain, 'schedule_manager'):
                 chain.schedule_manager = ScheduleManager(
                     minimize_cache_size=minimize_cache_size,
-                    verbosity_level=verbosity_level)
+                    verbosity_level=verbosity_level,
+                    share_buffers=share_buffers)
 
             schedule_manager = chain.schedule_manager
             # To prevent "line too long" error
@@ -1,9 +1,12 @@
 # import classes and functions
+from chainer.iterators.asyncio_iterator import AsyncioIterator  # NOQA
 from chainer.iterators.multiprocess_iterator import MultiprocessIterator  # NOQA
 from chainer.iterators.multithread_iterator import MultithreadIterator  # NOQA
 from chainer.iterators.serial_iterator import SerialIterator  # NOQA
+from chainer.iterators.token_budget_iterator import TokenBudgetIterator  # NOQA
 
 from chainer.iterators.dali_iterator import DaliIterator  # NOQA
 
+from chainer.iterators.order_samplers import BucketOrderSampler  # NOQA
 from chainer.iterators.order_samplers import OrderSampler  # NOQA
 from chainer.iterators.order_samplers import ShuffleOrderSampler  # NOQA
@@ -0,0 +1,337 @@
+from __future__ import division
+import collections
+import functools
+import threading
+
+import numpy
+
+from chainer.dataset import iterator
+from chainer.iterators.order_samplers import ShuffleOrderSampler
+from chainer import serializer as serializer_module
+
+try:
+    import asyncio
+    from concurrent import futures
+    _available = True
+except ImportError:
+    _available = False
+
+
+_State = collections.namedtuple('_State', (
+    'current_position', 'epoch', 'is_new_epoch',
+    'previous_epoch_detail', 'order'))
+
+
+class AsyncioIterator(iterator.Iterator):
+
+    """Dataset iterator that reads the examples with :mod:`asyncio`.
+
+    This is an implementation of :class:`~chainer.dataset.Iterator` for
+    datasets whose examples are read from slow storage. The examples are read
+    by an event loop running in a background thread, which keeps up to
+    ``n_in_flight`` reads running at any time. The reads are not synchronized
+    per batch; the examples of the following batches are read as soon as the
+    reads of the current batch leave room for them.
+
+    If the dataset has a coroutine function ``get_example``, it is called
+    with the index of each example, so that any number of examples can be
+    read concurrently without threads. Otherwise, ``dataset[index]`` is
+    called in a thread pool of ``n_in_flight`` threads.
+
+    The examples are returned in the same order as
+    :class:`~chainer.iterators.SerialIterator`, and :meth:`serialize` and
+    :attr:`epoch_detail` have the same semantics as the latter. The examples
+    read in advance are discarded when the iterator is deserialized or reset,
+    so that the training resumes from the same example.
+
+    This iterator saves ``-1`` instead of ``None`` in snapshots since some
+    serializers do not support ``None``.
+
+    .. note::
+
+            This iterator requires Python 3.4 or later.
+
+    Args:
+        dataset: Dataset to iterate.
+        batch_size (int): Number of examples within each batch.
+        repeat (bool): If ``True``, it infinitely loops over the dataset.
+            Otherwise, it stops iteration at the end of the first epoch.
+        shuffle (bool): If ``True``, the order of examples is shuffled at the
+            beginning of each epoch. Otherwise, examples are extracted in the
+            order of indexes. If ``None`` and no ``order_sampler`` is given,
+            the behavior is the same as the case with ``shuffle=True``.
+        n_in_flight (int): Maximum number of examples read concurrently.
+            The examples of at least one batch ahead are requested. If
+            ``None``, twice the batch size is used.
+        order_sampler (callable): A callable that generates the order
+            of the indices to sample in the next epoch when a epoch finishes.
+            This function should take two arguements: the current order
+            and the current position of the iterator.
+            This should return the next order. The size of the order
+            should remain constant.
+            This option cannot be used when ``shuffle`` is not ``None``.
+
+    """
+
+    _loop = None
+    _thread = None
+    _executor = None
+
+    def __init__(self, dataset, batch_size, repeat=True, shuffle=None,
+                 n_in_flight=None, order_sampler=None):
+        if not _available:
+            raise RuntimeError(
+                'AsyncioIterator requires Python 3.4 or later.')
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self._repeat = repeat
+        self._shuffle = shuffle
+        self.n_in_flight = n_in_flight or 2 * batch_size
+
+        if self._shuffle is not None:
+            if order_sampler is not None:
+                raise ValueError('`shuffle` is not `None` and a custom '
+                                 '`order_sampler` is set. Please set '
+                                 '`shuffle` to `None` to use the custom '
+                                 'order sampler.')
+            else:
+                if self._shuffle:
+                    order_sampler = ShuffleOrderSampler()
+        else:
+            if order_sampler is None:
+                order_sampler = ShuffleOrderSampler()
+        self.order_sampler = order_sampler
+
+        get_example = getattr(dataset, 'get_example', None)
+        self._is_async = asyncio.iscoroutinefunction(get_example)
+
+        # Batches requested in advance: pairs of the futures of the examples
+        # and the state of the iterator after the batch.
+        self._batches = collections.deque()
+        self._n_requested = 0
+        # The following attributes are only accessed in the thread of the
+        # event loop: reads that are not started yet, and reads running.
+        self._pending = collections.deque()
+        self._running = set()
+
+        self.reset()
+
+    def __next__(self):
+        if not self._repeat and self.epoch > 0:
+            raise StopIteration
+
+        self._request()
+        if not self._batches:
+            raise StopIteration
+        examples, state = self._batches.popleft()
+        self._n_requested -= len(examples)
+        batch = [example.result() for example in examples]
+
+        (self.current_position, self.epoch, self.is_new_epoch,
+            self._previous_epoch_detail, self._order) = state
+        self._request()
+        return batch
+
+    next = __next__
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.finalize()
+
+    def finalize(self):
+        self._discard()
+        loop = self._loop
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(self._cancel_running)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        # Let the cancelled reads finish.
+        running = [task for task in self._running if not task.done()]
+        if running:
+            loop.run_until_complete(
+                asyncio.gather(*running, return_exceptions=True))
+        loop.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._running = set()
+        self._loop = None
+        self._thread = None
+        self._executor = None
+
+    @property
+    def epoch_detail(self):
+        return self.epoch + self.current_position / self._epoch_size
+
+    @property
+    def previous_epoch_detail(self):
+        if self._previous_epoch_detail < 0:
+            return None
+        return self._previous_epoch_detail
+
+    def serialize(self, serializer):
+        self.current_position = serializer('current_position',
+                                           self.current_position)
+        self.epoch = serializer('epoch', self.epoch)
+        self.is_new_epoch = serializer('is_new_epoch', self.is_new_epoch)
+        if self._order is not None:
+            try:
+                serializer('order', self._order)
+            except KeyError:
+                serializer('_order', self._order)
+        try:
+            self._previous_epoch_detail = serializer(
+                'previous_epoch_detail', self._previous_epoch_detail)
+        except KeyError:
+            # guess previous_epoch_detail for older version
+            self._previous_epoch_detail = self.epoch + \
+                (self.current_position - self.batch_size) / self._epoch_size
+            if self.epoch_detail > 0:
+                self._previous_epoch_detail = max(
+                    self._previous_epoch_detail, 0.)
+            else:
+                self._previous_epoch_detail = -1.
+        if isinstance(serializer, serializer_module.Deserializer):
+            # The examples read in advance may be of another position.
+            self._discard()
+
+    def reset(self):
+        self.current_position = 0
+        self.epoch = 0
+        self.is_new_epoch = False
+
+        # use -1 instead of None internally.
+        self._previous_epoch_detail = -1.
+        if self.order_sampler:
+            self._order = self.order_sampler(
+                numpy.arange(len(self.dataset)), 0)
+        else:
+            self._order = None
+        self._discard()
+
+    @property
+    def _epoch_size(self):
+        if self._order is None:
+            return len(self.dataset)
+        else:
+            return len(self._order)
+
+    @property
+    def repeat(self):
+        return self._repeat
+
+    def _discard(self):
+        # Cancels the batches requested in advance. The reads already running
+        # are left to finish, and their results are ignored.
+        for examples, _ in self._batches:
+            for example in examples:
+                example.cancel()
+        self._batches.clear()
+        self._n_requested = 0
+        self._state = _State(
+            self.current_position, self.epoch, self.is_new_epoch,
+            self._previous_epoch_detail, self._order)
+
+    def _request(self):
+        # Requests batches until at least `n_in_flight` examples or one batch
+        # are requested.
+        while not self._batches or self._n_requested < self.n_in_flight:
+            indices, state = self._proceed(self._state)
+            if indices is None:
+                break
+            examples = [futures.Future() for _ in indices]
+            self._batches.append((examples, state))
+            self._n_requested += len(examples)
+            self._state = state
+            if self._loop is None:
+                self._launch_loop()
+            self._loop.call_soon_threadsafe(
+                self._enqueue, list(zip(indices, examples)))
+
+    def _proceed(self, state):
+        # Returns the indices of the batch following `state` and the state
+        # after the batch, in the same way as SerialIterator.
+        pos, epoch, is_new_epoch, _, order = state
+        if not self._repeat and epoch > 0:
+            return None, state
+
+        N = len(self.dataset) if order is None else len(order)
+        previous_epoch_detail = epoch + pos / N
+        i_end = pos + self.batch_size
+        if order is None:
+            indices = list(range(pos, min(i_end, N)))
+        else:
+            indices = list(order[pos:i_end])
+
+        if i_end >= N:
+            if self._repeat:
+                rest = i_end - N
+                if order is not None:
+                    new_order = self.order_sampler(order, pos)
+                    if len(order) != len(new_order):
+                        raise ValueError('The size of order does not match '
+                                         'the size of the previous order.')
+                    order = new_order
+                if rest > 0:
+                    if order is None:
+                        indices.extend(range(rest))
+                    else:
+                        indices.extend(order[:rest])
+                pos = rest
+            else:
+                pos = 0
+            epoch += 1
+            is_new_epoch = True
+        else:
+            is_new_epoch = False
+            pos = i_end
+
+        return indices, _State(
+            pos, epoch, is_new_epoch, previous_epoch_detail, order)
+
+    def _launch_loop(self):
+        self._loop = asyncio.new_event_loop()
+        if not self._is_async:
+            self._executor = futures.ThreadPoolExecutor(self.n_in_flight)
+        thread = threading.Thread(
+            target=self._loop.run_forever, name='asyncio_iterator')
+        thread.daemon = True
+        thread.start()
+        self._thread = thread
+
+    # The following methods run in the thread of the event loop.
+
+    def _enqueue(self, items):
+        self._pending.extend(items)
+        self._start_reads()
+
+    def _start_reads(self):
+        while self._pending and len(self._running) < self.n_in_flight:
+            index, example = self._pending.popleft()
+            if not example.set_running_or_notify_cancel():
+                continue  # discarded
+            if self._is_async:
+                task = self._loop.create_task(
+                    self.dataset.get_example(index))
+            else:
+                task = self._loop.run_in_executor(
+                    self._executor, self.dataset.__getitem__, index)
+            self._running.add(task)
+            task.add_done_callback(functools.partial(self._done, example))
+
+    def _done(self, example, task):
+        self._running.discard(task)
+        if task.cancelled():
+            example.set_exception(futures.CancelledError())
+        elif task.exception() is not None:
+            example.set_exception(task.exception())
+        else:
+            example.set_result(task.result())
+        self._start_reads()
+
+    def _cancel_running(self):
+        self._pending.clear()
+        for task in self._running:
+            task.cancel()
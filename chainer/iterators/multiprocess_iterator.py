@@ -1,10 +1,15 @@
 from __future__ import division
+import atexit
 import collections
 import datetime
+import mmap
 import multiprocessing
 from multiprocessing import sharedctypes
+import os
+import shutil
 import signal
 import sys
+import tempfile
 import threading
 import warnings
 
@@ -70,9 +75,15 @@ class MultiprocessIterator(iterator.Iterator):
             the behavior is the same as the case with ``shuffle=True``.
         n_processes (int): Number of worker processes. The number of CPUs is
             used by default.
-        n_prefetch (int): Number of prefetch batches.
-        shared_mem (int): The size of using shared memory per data.
-            If ``None``, size is adjusted automatically.
+        n_prefetch (int): Number of prefetch batches. The batches are
+            fetched into a ring of ``n_prefetch + 1`` slots of the shared
+            memory (``n_prefetch + 2`` if ``collate`` is ``True``). While a
+            slot is free, the worker processes go on to the examples of the
+            following batch without waiting for the current one.
+        shared_mem (int): The initial size of the shared memory per example
+            in bytes. The worker processes grow the shared memory on demand,
+            so this only avoids growing it in the first iterations. If
+            ``None``, the shared memory starts empty.
         dataset_timeout (float): :class:`MultiprocessIterator.TimeoutWarning`
             will be issued after this time in seconds elapsed in each dataset
             realization. ``None`` to disable the warning. You can turn this
@@ -93,6 +104,33 @@ class MultiprocessIterator(iterator.Iterator):
             can complete before it will exit and be replaced with a fresh
             worker process, to enable unused resources to be freed. If
             ``None``, worker processes will live as long as the pool.
+        collate (bool): If ``True``, the worker processes write each example
+            directly into per-field batch arrays in shared memory, and the
+            iterator returns these arrays instead of a list of examples. The
+            returned value is an array, a tuple of arrays or a dictionary of
+            arrays, as returned by :func:`~chainer.dataset.concat_examples`.
+            All examples must have the same structure, and each field must
+            have the same shape in all examples. The layout is taken from
+            the first batch, which is returned as newly allocated arrays.
+
+    .. note::
+
+            When ``collate`` is ``True``, the returned arrays are views of
+            the shared memory and they are overwritten after the next call of
+            :meth:`__next__`. Copy them if they are needed longer. Use a
+            converter that accepts batched arrays, e.g.::
+
+                def converter(batch, device):
+                    return tuple(chainer.dataset.to_device(device, x)
+                                 for x in batch)
+
+    .. note::
+
+            :attr:`prefetch_stats` tells whether the worker processes keep up
+            with the consumer. If ``wait_time`` grows and
+            ``queue_occupancy`` stays close to zero, the consumer is starved
+            and more processes may help. If ``queue_occupancy`` stays close
+            to ``n_prefetch``, the workers are faster than the consumer.
 
     """
 
@@ -107,7 +145,7 @@ class MultiprocessIterator(iterator.Iterator):
     def __init__(self, dataset, batch_size, repeat=True, shuffle=None,
                  n_processes=None, n_prefetch=1, shared_mem=None,
                  order_sampler=None, dataset_timeout=30.0,
-                 maxtasksperchild=None):
+                 maxtasksperchild=None, collate=False):
         self.dataset = dataset
         self.batch_size = batch_size
         self.repeat = repeat
@@ -117,6 +155,7 @@ class MultiprocessIterator(iterator.Iterator):
         self.shared_mem = shared_mem
         self.dataset_timeout = dataset_timeout
         self._maxtasksperchild = maxtasksperchild
+        self.collate = collate
 
         if self.shuffle is not None:
             if order_sampler is not None:
@@ -134,28 +173,29 @@ class MultiprocessIterator(iterator.Iterator):
 
         self._reset()
 
-        self._comm = _Communicator(self.n_prefetch, dataset_timeout)
+        # Besides the queued batches, one slot is being filled. In collate
+        # mode, a batch is returned as views of a slot of the shared memory,
+        # so one more slot is held by the caller of __next__.
+        n_slots = self.n_prefetch + (2 if collate else 1)
+        self._comm = _Communicator(self.n_prefetch, dataset_timeout, n_slots)
         self._set_prefetch_state()
 
         self._prefetch_loop = _PrefetchLoop(
             self.dataset, self.batch_size, self.repeat,
             self.n_processes, self.n_prefetch, self.shared_mem,
             self._comm, self.order_sampler,
-            self._interruption_testing, self._maxtasksperchild)
+            self._interruption_testing, self._maxtasksperchild,
+            n_slots, collate)
         # defer launching prefetch thread until creating the worker pool,
         # not to leave a background thread in forked processes.
 
     def __next__(self):
-        measure_mode = False
         if self._prefetch_loop.thread is None:
-            if self._prefetch_loop.measure_required():
-                measure_mode = True
-                batch, prefetch_state = self._prefetch_loop.measure(
-                    self.dataset_timeout)
             self._prefetch_loop.launch_thread()
 
-        if not measure_mode:
-            batch, prefetch_state = self._comm.get()
+        batch, prefetch_state = self._comm.get()
+        if isinstance(batch, _FetchError):
+            raise batch.error
 
         (self.current_position, self.epoch, self.is_new_epoch,
             self._previous_epoch_detail, self._order) = prefetch_state
@@ -192,7 +232,8 @@ class MultiprocessIterator(iterator.Iterator):
         other = MultiprocessIterator(
             self.dataset, self.batch_size, self.repeat, shuffle=None,
             n_processes=self.n_processes, n_prefetch=self.n_prefetch,
-            shared_mem=self.shared_mem, order_sampler=self.order_sampler)
+            shared_mem=self.shared_mem, order_sampler=self.order_sampler,
+            collate=self.collate)
 
         other.current_position = self.current_position
         other.epoch = self.epoch
@@ -207,6 +248,21 @@ class MultiprocessIterator(iterator.Iterator):
     def epoch_detail(self):
         return self.epoch + self.current_position / self._epoch_size
 
+    @property
+    def prefetch_stats(self):
+        """Statistics of the prefetched batches taken by :meth:`__next__`.
+
+        A dictionary with the following entries:
+
+        * ``n_batches``: The number of batches taken from the prefetch queue.
+        * ``n_waits``: The number of times the queue was empty.
+        * ``wait_time``: The total time in seconds waited for batches.
+        * ``queue_occupancy``: The mean number of batches in the queue when
+          a batch is taken.
+
+        """
+        return self._comm.get_stats()
+
     @property
     def previous_epoch_detail(self):
         if self._previous_epoch_detail < 0:
@@ -279,16 +335,25 @@ class _Communicator(object):
     STATUS_RESET = 1
     STATUS_TERMINATE = 2
 
-    def __init__(self, n_prefetch, dataset_timeout):
+    def __init__(self, n_prefetch, dataset_timeout, n_slots):
         self.n_prefetch = n_prefetch
         self.dataset_timeout = dataset_timeout
 
         self._lock = threading.Lock()
         self._not_empty_cond = threading.Condition(self._lock)
         self._not_full_cond = threading.Condition(self._lock)
+        self._slot_cond = threading.Condition(self._lock)
         self._batch_queue = []
         self._status = _Communicator.STATUS_CONTINUE
         self._reset_count = 0
+        # Slots of the shared memory that no batch is using.
+        self._free_slots = list(six.moves.range(n_slots))
+        # The slot of the batch returned last time in collate mode.
+        self._held_slot = None
+        self._n_batches = 0
+        self._n_waits = 0
+        self._wait_time = 0.
+        self._total_occupancy = 0
 
     @property
     def is_terminated(self):
@@ -299,6 +364,10 @@ class _Communicator(object):
     def get(self):
         with self._lock:
             start = datetime.datetime.now()
+            self._n_batches += 1
+            self._total_occupancy += len(self._batch_queue)
+            if len(self._batch_queue) == 0:
+                self._n_waits += 1
             while len(self._batch_queue) == 0:
                 self._not_empty_cond.wait(_response_time)
                 dt = datetime.datetime.now() - start
@@ -306,7 +375,12 @@ class _Communicator(object):
                         and dt > datetime.timedelta(
                             seconds=self.dataset_timeout)):
                     _raise_timeout_warning()
-            batch, prefetch_state = self._batch_queue.pop(0)
+            self._wait_time += (
+                datetime.datetime.now() - start).total_seconds()
+            batch, prefetch_state, slot = self._batch_queue.pop(0)
+            # The batch returned last time is no longer used by the caller.
+            self._release_slot(self._held_slot)
+            self._held_slot = slot
             self._not_full_cond.notify()
             return batch, prefetch_state
 
@@ -315,7 +389,7 @@ class _Communicator(object):
         with self._lock:
             self._status = _Communicator.STATUS_RESET
             self._prefetch_state = prefetch_state
-            self._batch_queue = []
+            self._clear_queue()
             self._not_full_cond.notify()
             self._reset_count += 1
 
@@ -323,10 +397,49 @@ class _Communicator(object):
     def terminate(self):
         with self._lock:
             self._status = _Communicator.STATUS_TERMINATE
-            self._batch_queue = []
+            self._clear_queue()
             self._not_full_cond.notify()
+            self._slot_cond.notify()
             self._reset_count += 1
 
+    # called from iterator
+    def get_stats(self):
+        with self._lock:
+            return {
+                'n_batches': self._n_batches,
+                'n_waits': self._n_waits,
+                'wait_time': self._wait_time,
+                'queue_occupancy':
+                    self._total_occupancy / max(self._n_batches, 1),
+            }
+
+    def _clear_queue(self):
+        for _, _, slot in self._batch_queue:
+            self._release_slot(slot)
+        self._batch_queue = []
+
+    def _release_slot(self, slot):
+        if slot is not None:
+            self._free_slots.append(slot)
+            self._slot_cond.notify()
+
+    # called from thread
+    def acquire_slot(self, blocking=True):
+        # Returns None if no slot is free and `blocking` is False, or if the
+        # iterator is terminated while waiting.
+        with self._lock:
+            while not self._free_slots:
+                if (not blocking or
+                        self._status == _Communicator.STATUS_TERMINATE):
+                    return None
+                self._slot_cond.wait(_response_time)
+            return self._free_slots.pop(0)
+
+    # called from thread
+    def release_slot(self, slot):
+        with self._lock:
+            self._release_slot(slot)
+
     # called from thread
     def check(self):
         with self._lock:
@@ -338,13 +451,15 @@ class _Communicator(object):
             return status, prefetch_state, self._reset_count
 
     # called from thread
-    def put(self, batch, prefetch_state, reset_count):
+    def put(self, batch, prefetch_state, reset_count, slot=None):
         with self._lock:
             if len(self._batch_queue) == self.n_prefetch:
                 self._not_full_cond.wait()
             if reset_count == self._reset_count:
-                self._batch_queue.append((batch, prefetch_state))
+                self._batch_queue.append((batch, prefetch_state, slot))
                 self._not_empty_cond.notify()
+            else:
+                self._release_slot(slot)
 
 
 class _PrefetchLoop(object):
@@ -356,17 +471,23 @@ class _PrefetchLoop(object):
     def __init__(self, dataset, batch_size, repeat,
                  n_processes, n_prefetch, mem_size, comm,
                  order_sampler,
-                 _interruption_testing, maxtasksperchild):
+                 _interruption_testing, maxtasksperchild, n_slots,
+                 collate=False):
         self.dataset = dataset
         self.batch_size = batch_size
         self.repeat = repeat
         self.n_processes = n_processes
-        self.mem_size = mem_size
+        self.mem_size = mem_size or 0
         self._comm = comm
         self.order_sampler = order_sampler
         self.maxtasksperchild = maxtasksperchild
-
-        self._allocate_shared_memory()
+        # The number of batches the shared memory can hold.
+        self.n_slots = n_slots
+        self.collate = collate
+        self.layout = None
+        # The batches submitted to the pool, in the order of submission.
+        self._in_flight = collections.deque()
+        self.shared_memory = None
 
         self._interruption_testing = _interruption_testing
 
@@ -381,63 +502,24 @@ class _PrefetchLoop(object):
         if self._pool is not None:
             self._pool.terminate()
 
+        if self.shared_memory is not None:
+            self.shared_memory.close()
+
         self._thread = None
         self._pool = None
+        self.shared_memory = None
 
     @property
     def thread(self):
         return self._thread
 
-    def measure_required(self):
-        return self.mem_size is None
-
-    def measure(self, dataset_timeout):
-        # dataset_timeout: timeout in seconds or None
-
-        status, prefetch_state, _ = self._comm.check()
-        if status == _Communicator.STATUS_RESET:
-            self.prefetch_state = prefetch_state
-
-        indices = self._proceed()
-        if indices is None:  # stop iteration
-            batch = None
-        else:
-            batch_ret = [None]
-
-            def fetch_batch():
-                batch_ret[0] = [self.dataset[idx] for idx in indices]
-
-            if dataset_timeout is None:
-                # Timeout is not set: fetch synchronously
-                fetch_batch()
-            else:
-                # Timeout is set: fetch asynchronously and watch for timeout
-                thr = threading.Thread(target=fetch_batch)
-                thr.daemon = True
-                thr.start()
-                thr.join(dataset_timeout)
-                if thr.is_alive():
-                    _raise_timeout_warning()
-                thr.join()
-
-            batch = batch_ret[0]
-            self.mem_size = max(map(_measure, batch))
-            self._allocate_shared_memory()
-
-        return batch, self.prefetch_state
-
-    def _allocate_shared_memory(self):
-        if self.measure_required():
-            self.mem_bulk = None
-        else:
-            self.mem_bulk = \
-                sharedctypes.RawArray('b', self.batch_size * self.mem_size)
-
     def launch_thread(self):
+        self.shared_memory = _SharedMemory(
+            self.n_slots, self.batch_size * self.mem_size)
         self._pool = multiprocessing.Pool(
             processes=self.n_processes,
             initializer=_fetch_setup,
-            initargs=(self.dataset, self.mem_size, self.mem_bulk),
+            initargs=(self.dataset, self.shared_memory),
             maxtasksperchild=self.maxtasksperchild)
         if self._interruption_testing:
             pids = self._pool.map(_report_pid, range(self.n_processes))
@@ -462,6 +544,7 @@ class _PrefetchLoop(object):
         finally:
             self._pool.close()
             self._pool.join()
+            self._in_flight.clear()
 
     def _task(self):
         # Do a single task in the prefetch thread.
@@ -473,25 +556,96 @@ class _PrefetchLoop(object):
         elif status == _Communicator.STATUS_TERMINATE:
             return False  # stop loop
 
-        indices = self._proceed()
+        # Submit batches as long as slots are free, so that the workers go on
+        # to the next batch without waiting for the current one. Batches
+        # submitted before a reset are discarded by the communicator.
+        while len(self._in_flight) < self.n_slots:
+            slot = self._comm.acquire_slot(blocking=not self._in_flight)
+            if slot is None:
+                if self._comm.is_terminated:
+                    return False
+                break
+            try:
+                self._in_flight.append(self._submit(slot, reset_count))
+            except Exception as e:
+                # Pass the error raised by the order sampler to the
+                # iterator in the same way as the errors of the workers.
+                self._comm.release_slot(slot)
+                self._in_flight.append(
+                    ((), _FetchError(e), None, False, self.prefetch_state,
+                     reset_count))
+
+        indices, future, slot, collated, prefetch_state, reset_count = \
+            self._in_flight[0]
         if indices is None:  # stop iteration
             batch = None
+        elif isinstance(future, _FetchError):
+            batch = future
         else:
-            future = self._pool.map_async(_fetch_run, enumerate(indices))
-            while True:
-                try:
-                    data_all = future.get(_response_time)
-                except multiprocessing.TimeoutError:
-                    if self._comm.is_terminated:
-                        return False
+            try:
+                data_all = future.get(_response_time)
+            except multiprocessing.TimeoutError:
+                return True  # check the status and wait again
+            except Exception as e:
+                # Pass the error raised in a worker to the iterator,
+                # which re-raises it from ``__next__``.
+                batch = _FetchError(e)
+                collated = False
+            else:
+                if collated:
+                    batch = self.layout.read(
+                        self.shared_memory, slot, len(indices))
                 else:
-                    break
-
-            batch = [_unpack(data, self.mem_bulk) for data in data_all]
-
-        self._comm.put(batch, self.prefetch_state, reset_count)
+                    batch = self._unpack(data_all)
+            if not collated:
+                # The examples have been copied out of the slot.
+                self._comm.release_slot(slot)
+                slot = None
+        self._in_flight.popleft()
+
+        self._comm.put(batch, prefetch_state, reset_count, slot)
         return True
 
+    def _submit(self, slot, reset_count):
+        # Submits the next batch to the pool to be fetched into `slot`.
+        indices = self._proceed()
+        collated = self.layout is not None
+        if indices is None:  # stop iteration
+            self._comm.release_slot(slot)
+            return None, None, None, False, self.prefetch_state, reset_count
+
+        # Same as the default of Pool.map_async, which fails if it is called
+        # while the workers are replaced due to `maxtasksperchild`.
+        chunksize = -(-len(indices) // (self.n_processes * 4))
+        self.shared_memory.clear(slot)
+        if collated:
+            # The examples are written at fixed offsets of the slot.
+            self.shared_memory.reserve(slot, self.layout.slot_nbytes)
+            future = self._pool.map_async(
+                _fetch_run_collate,
+                [(slot, i, index, self.layout)
+                 for i, index in enumerate(indices)], chunksize)
+        else:
+            future = self._pool.map_async(
+                _fetch_run, [(slot, index) for index in indices], chunksize)
+        return (indices, future, slot, collated, self.prefetch_state,
+                reset_count)
+
+    def _unpack(self, data_all):
+        # Returns the examples copied out of the shared memory, or the
+        # batch arrays in collate mode.
+        try:
+            batch = [_unpack(data, self.shared_memory) for data in data_all]
+            if self.collate:
+                # The batches fetched before the layout is known are
+                # stacked here.
+                if self.layout is None:
+                    self.layout = _BatchLayout(batch[0], self.batch_size)
+                batch = self.layout.stack(batch)
+        except Exception as e:
+            batch = _FetchError(e)
+        return batch
+
     def _proceed(self):
         (pos, epoch, is_new_epoch,
             previous_epoch_detail, order) = self.prefetch_state
@@ -543,126 +697,254 @@ class _PrefetchLoop(object):
 # notice that each process uses different address space.
 # To make static linter happy, we first initialize global variables.
 _fetch_dataset = None
-_fetch_mem_size = None
-_fetch_mem_bulk = None
+_fetch_shared_memory = None
 
 
-def _fetch_setup(dataset, mem_size, mem_bulk):
-    global _fetch_dataset, _fetch_mem_size, _fetch_mem_bulk
+def _fetch_setup(dataset, shared_memory):
+    global _fetch_dataset, _fetch_shared_memory
     signal.signal(signal.SIGINT, signal.SIG_IGN)
     _fetch_dataset = dataset
-    _fetch_mem_size = mem_size
-    _fetch_mem_bulk = mem_bulk
+    _fetch_shared_memory = shared_memory
 
 
 def _fetch_run(inputs):
-    i, index = inputs
-    data = _fetch_dataset[index]
-    if _fetch_mem_bulk is not None:
-        offset = i * _fetch_mem_size
-        limit = offset + _fetch_mem_size
-        data = _pack(data, _fetch_mem_bulk, offset, limit)
-    return data
+    slot, index = inputs
+    return _pack(_fetch_dataset[index], _fetch_shared_memory, slot)
+
+
+def _fetch_run_collate(inputs):
+    slot, i, index, layout = inputs
+    layout.write(_fetch_shared_memory, slot, i, _fetch_dataset[index])
 
 
 def _report_pid(_):  # for testing
     return multiprocessing.current_process().pid
 
 
+# Temporary directories of the shared memory that are not closed yet. They
+# are removed at exit in case the iterators are not finalized.
+_shared_memory_dirs = set()
+
+
+@atexit.register
+def _remove_shared_memory_dirs():
+    for path in list(_shared_memory_dirs):
+        shutil.rmtree(path, ignore_errors=True)
+    _shared_memory_dirs.clear()
+
+
+class _SharedMemory(object):
+
+    """Shared memory that grows on demand.
+
+    Each slot of batches is a file in a temporary directory, which is
+    created in ``/dev/shm`` if available so that the files stay in memory.
+    Any process can reserve a region of a slot; the file is doubled in size
+    when the region does not fit in it. The files are mapped to memory in
+    each process and mapped again when they have grown.
+
+    """
+
+    _alignment = 64
+
+    def __init__(self, n_slots, initial_size):
+        shm_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        self.path = tempfile.mkdtemp(prefix='chainer-', dir=shm_dir)
+        _shared_memory_dirs.add(self.path)
+        for slot in six.moves.range(n_slots):
+            with open(self._slot_path(slot), 'wb') as f:
+                f.truncate(initial_size)
+        # The number of bytes reserved in each slot.
+        self._used = sharedctypes.RawArray('l', n_slots)
+        self._lock = multiprocessing.Lock()
+        self._maps = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_maps'] = {}
+        return state
+
+    def _slot_path(self, slot):
+        return os.path.join(self.path, str(slot))
+
+    def clear(self, slot):
+        # Must not be called while the slot is in use.
+        self._used[slot] = 0
+
+    def reserve(self, slot, nbytes):
+        """Reserves ``nbytes`` bytes in the slot and returns the offset."""
+        with self._lock:
+            offset = self._used[slot]
+            end = offset + nbytes
+            self._used[slot] = -(-end // self._alignment) * self._alignment
+            path = self._slot_path(slot)
+            size = os.path.getsize(path)
+            if size < end:
+                with open(path, 'r+b') as f:
+                    f.truncate(max(end, 2 * size))
+        return offset
+
+    def get_buffer(self, slot, end):
+        """Returns a buffer of the slot that is at least ``end`` bytes."""
+        buf = self._maps.get(slot)
+        if buf is None or len(buf) < end:
+            with open(self._slot_path(slot), 'r+b') as f:
+                size = os.fstat(f.fileno()).st_size
+                buf = mmap.mmap(f.fileno(), size) if size else b''
+            # The previous map is closed when the arrays viewing it are
+            # released.
+            self._maps[slot] = buf
+        return buf
+
+    def close(self):
+        self._maps = {}
+        shutil.rmtree(self.path, ignore_errors=True)
+        _shared_memory_dirs.discard(self.path)
+
+
 class _PackedNdarray(object):
 
-    def __init__(self, array, mem, offset):
+    def __init__(self, array, shared_memory, slot):
         self.shape = array.shape
         self.dtype = array.dtype
         self.nbytes = array.nbytes
         self.size = array.size
-        self.offset = offset
-        total = self.offset + self.nbytes
-        if total > len(mem):
-            raise ValueError(
-                'Shared memory size is too small. expect:{}, actual:{}'.format(
-                    total, len(mem)))
-        target = numpy.frombuffer(mem, self.dtype, self.size, self.offset)
+        self.slot = slot
+        self.offset = shared_memory.reserve(slot, self.nbytes)
+        buf = shared_memory.get_buffer(slot, self.offset + self.nbytes)
+        target = numpy.frombuffer(buf, self.dtype, self.size, self.offset)
         target[...] = array.ravel()
 
-    def unpack(self, mem):
-        ret = numpy.frombuffer(mem, self.dtype, self.size, self.offset)
+    def unpack(self, shared_memory):
+        buf = shared_memory.get_buffer(self.slot, self.offset + self.nbytes)
+        ret = numpy.frombuffer(buf, self.dtype, self.size, self.offset)
         ret = ret.reshape(self.shape).copy()
         return ret
 
 
-def _measure(data):
-    expect = 0
-    t = type(data)
-    if t is tuple or t is list or t is dict:
-        for v in data:
-            if isinstance(v, numpy.ndarray):
-                expect += v.nbytes
-    return expect
+class _FetchError(object):
+
+    """Wraps an error raised while fetching a batch in the worker pool."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+class _BatchLayout(object):
+
+    """Layout of a batch in a slot of the shared memory.
+
+    Each field of the examples is stored in its own contiguous region of
+    ``batch_size`` elements, so that a batch can be read as views without
+    copying. The structure, shapes and dtypes are taken from ``example``.
+
+    """
+
+    _alignment = 64
 
+    def __init__(self, example, batch_size):
+        # The structure follows chainer.dataset.concat_examples.
+        if isinstance(example, tuple):
+            self.kind = 'tuple'
+            items = enumerate(example)
+        elif isinstance(example, dict):
+            self.kind = 'dict'
+            items = six.iteritems(example)
+        else:
+            self.kind = 'array'
+            items = [(None, example)]
 
-def _pack(data, mem, offset, limit):
-    if len(mem) == 0:
-        return data
+        self.batch_size = batch_size
+        self.fields = []
+        offset = 0
+        for key, value in items:
+            value = numpy.asarray(value)
+            self.fields.append((key, value.shape, value.dtype, offset))
+            offset += batch_size * value.nbytes
+            offset = -(-offset // self._alignment) * self._alignment
+        self.slot_nbytes = offset
+
+    def _get(self, example, key, shape):
+        value = numpy.asarray(example if key is None else example[key])
+        if value.shape != shape:
+            raise ValueError(
+                'All examples must have the same shape in collate mode. '
+                'expect:{}, actual:{}'.format(shape, value.shape))
+        return value
+
+    def write(self, shared_memory, slot, i, example):
+        buf = shared_memory.get_buffer(slot, self.slot_nbytes)
+        for key, shape, dtype, offset in self.fields:
+            value = self._get(example, key, shape)
+            size = int(numpy.prod(shape))
+            target = numpy.frombuffer(
+                buf, dtype, size, offset + i * size * dtype.itemsize)
+            target[...] = value.ravel()
+
+    def read(self, shared_memory, slot, n):
+        buf = shared_memory.get_buffer(slot, self.slot_nbytes)
+        arrays = []
+        for key, shape, dtype, offset in self.fields:
+            size = int(numpy.prod(shape))
+            array = numpy.frombuffer(buf, dtype, n * size, offset)
+            arrays.append(array.reshape((n,) + shape))
+        return self._pack(arrays)
+
+    def stack(self, examples):
+        arrays = []
+        for key, shape, dtype, offset in self.fields:
+            arrays.append(numpy.stack(
+                [self._get(example, key, shape) for example in examples]
+            ).astype(dtype, copy=False))
+        return self._pack(arrays)
+
+    def _pack(self, arrays):
+        if self.kind == 'tuple':
+            return tuple(arrays)
+        elif self.kind == 'dict':
+            return {key: array
+                    for (key, _, _, _), array in zip(self.fields, arrays)}
+        else:
+            return arrays[0]
+
+
+def _pack(data, shared_memory, slot):
     t = type(data)
-    over = False
     if t is tuple or t is list:
         ret = []
         for v in data:
             if isinstance(v, numpy.ndarray):
-                if v.nbytes + offset > limit:
-                    over = True
-                else:
-                    v = _PackedNdarray(v, mem, offset)
-                    offset += v.nbytes
+                v = _PackedNdarray(v, shared_memory, slot)
             ret.append(v)
         data = t(ret)
     elif t is dict:
         ret = {}
         for k, v in six.iteritems(data):
             if isinstance(v, numpy.ndarray):
-                if v.nbytes + offset > limit:
-                    over = True
-                else:
-                    v = _PackedNdarray(v, mem, offset)
-                    offset += v.nbytes
+                v = _PackedNdarray(v, shared_memory, slot)
             ret[k] = v
         data = ret
     elif t is numpy.ndarray:
-        if data.nbytes + offset > limit:
-            over = True
-        else:
-            data = _PackedNdarray(data, mem, offset)
-            offset += data.nbytes
-    if over:
-        expect = _measure(data)
-        warnings.warn(
-            'Shared memory size is too small.\n' +
-            'Please set shared_mem option for MultiprocessIterator.\n' +
-            'Expect shared memory size: {} bytes.\n'.format(expect) +
-            'Actual shared memory size: {} bytes.'.format(limit - offset),
-            UserWarning)
+        data = _PackedNdarray(data, shared_memory, slot)
     return data
 
 
-def _unpack(data, mem):
-    if len(mem) == 0:
-        return data
+def _unpack(data, shared_memory):
     t = type(data)
     if t is tuple or t is list:
         ret = []
         for v in data:
             if isinstance(v, _PackedNdarray):
-                v = v.unpack(mem)
+                v = v.unpack(shared_memory)
             ret.append(v)
         data = t(ret)
     elif t is dict:
         ret = {}
         for k, v in six.iteritems(data):
             if isinstance(v, _PackedNdarray):
-                v = v.unpack(mem)
+                v = v.unpack(shared_memory)
             ret[k] = v
         data = ret
     elif t is _PackedNdarray:
-        data = data.unpack(mem)
+        data = data.unpack(shared_memory)
     return data
@@ -4,6 +4,7 @@ from multiprocessing import pool
 import numpy
 import six
 
+from chainer.dataset import dataset_mixin
 from chainer.dataset import iterator
 from chainer.iterators.order_samplers import ShuffleOrderSampler
 
@@ -135,8 +136,8 @@ class MultithreadIterator(iterator.Iterator):
 
     @staticmethod
     def _read(args):
-        dataset, index = args
-        return dataset[index]
+        dataset, indices = args
+        return dataset_mixin.get_examples(dataset, indices)
 
     def _invoke_prefetch(self):
         assert self._next is None
@@ -148,13 +149,13 @@ class MultithreadIterator(iterator.Iterator):
         i = self.current_position
 
         order = self._order
-        args = []
+        indices = []
         dataset = self.dataset
         epoch = self.epoch
         is_new_epoch = False
         for _ in six.moves.range(self.batch_size):
             index = i if order is None else order[i]
-            args.append((dataset, index))
+            indices.append(index)
             i += 1
             if i >= n:
                 epoch += 1
@@ -173,6 +174,10 @@ class MultithreadIterator(iterator.Iterator):
                                          'the size of the previous order.')
                     order = new_order
 
+        # Each thread reads a chunk of the batch at once.
+        chunk_size = -(-len(indices) // self.n_threads)
+        args = [(dataset, indices[j:j + chunk_size])
+                for j in six.moves.range(0, len(indices), chunk_size)]
         self._next = self._pool.map_async(MultithreadIterator._read, args)
         self._next_state = (i, epoch, is_new_epoch, order)
 
@@ -181,7 +186,7 @@ class MultithreadIterator(iterator.Iterator):
         while not next.ready():
             next.wait(0.5)  # To avoid interruption bug in Python2
 
-        batch = [data for data in next.get()]
+        batch = [data for chunk in next.get() for data in chunk]
         self._next = None
 
         (self.current_position, self.epoch,
@@ -1,3 +1,5 @@
+from __future__ import division
+
 import numpy
 
 
@@ -57,3 +59,123 @@ class ShuffleOrderSampler(OrderSampler):
 
     def __call__(self, current_order, current_position):
         return self._random.permutation(len(current_order))
+
+
+class BucketOrderSampler(OrderSampler):
+
+    """Sampler that generates random orders of batches of similar lengths.
+
+    This sampler is intended for datasets of variable-length sequences that
+    are padded to the longest one of each batch. The examples are sorted by
+    their lengths, with ties broken randomly, and divided into buckets of
+    ``batches_per_bucket`` batches. The examples are shuffled within each
+    bucket and split into batches, and the batches are shuffled across
+    buckets. The batches of an epoch therefore consist of examples of similar
+    lengths, while their composition and order change every epoch.
+
+    The lengths are given either as an array, or as a dataset and a function
+    that returns the length of an example, in which case the function is
+    called for all examples at the initialization.
+
+    When the dataset size is not divisible by the batch size, an iterator in
+    the repeat mode fills the last batch of an epoch with the first examples
+    of the next one. This sampler takes the position of the iterator into
+    account so that the other batches of the next epoch are still aligned.
+
+    The fraction of padding elements in the batches of the order generated
+    last is available as :attr:`padding_ratio`, and can be recorded during
+    training as below.
+
+    .. code-block:: python
+
+        sampler = chainer.iterators.BucketOrderSampler(
+            batch_size, dataset=dataset, length_function=lambda x: len(x[0]))
+        train_iter = chainer.iterators.SerialIterator(
+            dataset, batch_size, order_sampler=sampler)
+        ...
+        trainer.extend(extensions.observe_value(
+            'padding_ratio', lambda trainer: sampler.padding_ratio))
+
+    .. note::
+
+       The order is sampled before the beginning of each epoch, so that
+       :attr:`padding_ratio` observed at the end of an epoch is the one of
+       the next epoch.
+
+    Args:
+        batch_size (int): Number of examples within each batch. It should be
+            the same as the batch size of the iterator.
+        lengths (array-like): 1-D array of the lengths of the examples.
+        dataset: Dataset to compute the lengths with ``length_function``.
+            It is used only if ``lengths`` is ``None``.
+        length_function (callable): Function that takes an example and
+            returns its length.
+        batches_per_bucket (int): Number of batches in each bucket. The
+            smaller it is, the less the batches are padded, and the less
+            random their composition is.
+        random_state (numpy.random.RandomState): Pseudo-random number
+            generator.
+
+    Attributes:
+        ~BucketOrderSampler.padding_ratio (float): Fraction of padding
+            elements in the full batches of the order generated last.
+
+    """
+
+    def __init__(self, batch_size, lengths=None, dataset=None,
+                 length_function=None, batches_per_bucket=10,
+                 random_state=None):
+        lengths = _get_lengths(lengths, dataset, length_function)
+        if random_state is None:
+            random_state = numpy.random.random.__self__
+        self.batch_size = batch_size
+        self.batches_per_bucket = batches_per_bucket
+        self.padding_ratio = None
+        self._lengths = lengths
+        self._random = random_state
+
+    def __call__(self, current_order, current_position):
+        n = len(current_order)
+        if n != len(self._lengths):
+            raise ValueError('The size of order does not match the number '
+                             'of lengths.')
+        batch_size = self.batch_size
+        lengths = self._lengths
+        # The first examples complete the last batch of the current epoch.
+        n_head = min(max(current_position + batch_size - n, 0), n)
+        order = self._random.permutation(n)
+        head = order[:n_head]
+        order = order[n_head:]
+
+        # Stable sort of the random permutation breaks ties randomly.
+        order = order[numpy.argsort(lengths[order], kind='mergesort')]
+        bucket_size = batch_size * self.batches_per_bucket
+        for i in range(0, len(order), bucket_size):
+            self._random.shuffle(order[i:i + bucket_size])
+
+        n_batches = len(order) // batch_size
+        n_full = n_batches * batch_size
+        batches = order[:n_full].reshape(n_batches, batch_size)
+        self._random.shuffle(batches)
+
+        if n_batches > 0:
+            batch_lengths = lengths[batches]
+            padded = batch_lengths.max(axis=1).sum() * batch_size
+            if padded > 0:
+                self.padding_ratio = float(
+                    1 - batch_lengths.sum() / padded)
+            else:
+                self.padding_ratio = 0.
+        return numpy.concatenate((head, batches.ravel(), order[n_full:]))
+
+
+def _get_lengths(lengths, dataset, length_function):
+    if lengths is None:
+        if dataset is None or length_function is None:
+            raise ValueError('either `lengths` or `dataset` and '
+                             '`length_function` must be given.')
+        lengths = [length_function(dataset[i]) for i in range(len(dataset))]
+    lengths = numpy.asarray(lengths)
+    if lengths.ndim != 1:
+        raise ValueError('`lengths` must be a 1-D array.')
+    return lengths
@@ -2,6 +2,7 @@ from __future__ import division
 
 import numpy
 
+from chainer.dataset import dataset_mixin
 from chainer.dataset import iterator
 from chainer.iterators.order_samplers import ShuffleOrderSampler
 
@@ -78,7 +79,8 @@ class SerialIterator(iterator.Iterator):
         if self._order is None:
             batch = self.dataset[i:i_end]
         else:
-            batch = [self.dataset[index] for index in self._order[i:i_end]]
+            batch = dataset_mixin.get_examples(
+                self.dataset, self._order[i:i_end])
 
         if i_end >= N:
             if self._repeat:
@@ -93,8 +95,8 @@ class SerialIterator(iterator.Iterator):
                     if self._order is None:
                         batch.extend(self.dataset[:rest])
                     else:
-                        batch.extend([self.dataset[index]
-                                      for index in self._order[:rest]])
+                        batch.extend(dataset_mixin.get_examples(
+                            self.dataset, self._order[:rest]))
                 self.current_position = rest
             else:
                 self.current_position = 0
@@ -0,0 +1,192 @@
+from __future__ import division
+
+import numpy
+
+from chainer.dataset import dataset_mixin
+from chainer.dataset import iterator
+from chainer.iterators.order_samplers import _get_lengths
+from chainer.iterators.order_samplers import ShuffleOrderSampler
+
+
+class TokenBudgetIterator(iterator.Iterator):
+
+    """Dataset iterator that makes batches under a budget of tokens.
+
+    This is an implementation of :class:`~chainer.dataset.Iterator` for
+    datasets of variable-length sequences. Instead of a fixed number of
+    examples, each batch contains as many consecutive examples of the order
+    as fit in ``max_tokens``. If ``padded`` is ``True``, the cost of a batch
+    is the length of its longest example times the number of examples, i.e.,
+    the size of the batch after padding. Otherwise, it is the sum of the
+    lengths. An example longer than the budget makes a batch by itself.
+
+    Unlike :class:`~chainer.iterators.SerialIterator`, the batches do not
+    span two epochs; the last batch of an epoch consists of the remaining
+    examples. :attr:`epoch_detail` is the fraction of the examples of the
+    epoch returned so far. The order is generated in the same way as
+    :class:`~chainer.iterators.SerialIterator`; combining this iterator with
+    :class:`~chainer.iterators.BucketOrderSampler` gives batches of similar
+    lengths, and therefore more examples in each batch.
+
+    This iterator saves ``-1`` instead of ``None`` in snapshots since some
+    serializers do not support ``None``.
+
+    Args:
+        dataset: Dataset to iterate.
+        max_tokens (int): Maximum cost of each batch.
+        lengths (array-like): 1-D array of the lengths of the examples.
+        length_function (callable): Function that takes an example and
+            returns its length. It is called for all examples at the
+            initialization if ``lengths`` is ``None``.
+        repeat (bool): If ``True``, it infinitely loops over the dataset.
+            Otherwise, it stops iteration at the end of the first epoch.
+        shuffle (bool): If ``True``, the order of examples is shuffled at the
+            beginning of each epoch. Otherwise, examples are extracted in the
+            order of indexes. If ``None`` and no ``order_sampler`` is given,
+            the behavior is the same as the case with ``shuffle=True``.
+        order_sampler (callable): A callable that generates the order
+            of the indices to sample in the next epoch when a epoch finishes.
+            This function should take two arguements: the current order
+            and the current position of the iterator.
+            This should return the next order. The size of the order
+            should remain constant.
+            This option cannot be used when ``shuffle`` is not ``None``.
+        padded (bool): If ``True``, the cost of a batch is the number of
+            tokens after padding. Otherwise, it is the number of tokens.
+        max_batch_size (int): Maximum number of examples within each batch.
+            If ``None``, the number is not limited.
+
+    """
+
+    def __init__(self, dataset, max_tokens, lengths=None,
+                 length_function=None, repeat=True, shuffle=None,
+                 order_sampler=None, padded=True, max_batch_size=None):
+        self.dataset = dataset
+        self.max_tokens = max_tokens
+        self.padded = padded
+        self.max_batch_size = max_batch_size
+        self._lengths = _get_lengths(lengths, dataset, length_function)
+        if len(self._lengths) != len(dataset):
+            raise ValueError('The number of lengths does not match the '
+                             'size of the dataset.')
+        self._repeat = repeat
+        self._shuffle = shuffle
+
+        if self._shuffle is not None:
+            if order_sampler is not None:
+                raise ValueError('`shuffle` is not `None` and a custom '
+                                 '`order_sampler` is set. Please set '
+                                 '`shuffle` to `None` to use the custom '
+                                 'order sampler.')
+            else:
+                if self._shuffle:
+                    order_sampler = ShuffleOrderSampler()
+        else:
+            if order_sampler is None:
+                order_sampler = ShuffleOrderSampler()
+        self.order_sampler = order_sampler
+
+        self.reset()
+
+    def __next__(self):
+        if not self._repeat and self.epoch > 0:
+            raise StopIteration
+
+        self._previous_epoch_detail = self.epoch_detail
+
+        i = self.current_position
+        i_end = self._find_end(i)
+        N = self._epoch_size
+
+        if self._order is None:
+            batch = self.dataset[i:i_end]
+        else:
+            batch = dataset_mixin.get_examples(
+                self.dataset, self._order[i:i_end])
+
+        if i_end >= N:
+            if self._repeat and self._order is not None:
+                new_order = self.order_sampler(self._order, i)
+                if len(self._order) != len(new_order):
+                    raise ValueError('The size of order does not match '
+                                     'the size of the previous order.')
+                self._order = new_order
+            self.current_position = 0
+            self.epoch += 1
+            self.is_new_epoch = True
+        else:
+            self.is_new_epoch = False
+            self.current_position = i_end
+
+        return batch
+
+    next = __next__
+
+    @property
+    def epoch_detail(self):
+        return self.epoch + self.current_position / self._epoch_size
+
+    @property
+    def previous_epoch_detail(self):
+        if self._previous_epoch_detail < 0:
+            return None
+        return self._previous_epoch_detail
+
+    def serialize(self, serializer):
+        # The batches are determined by the order and the position, so that
+        # the same batches follow after deserialization.
+        self.current_position = serializer('current_position',
+                                           self.current_position)
+        self.epoch = serializer('epoch', self.epoch)
+        self.is_new_epoch = serializer('is_new_epoch', self.is_new_epoch)
+        if self._order is not None:
+            serializer('order', self._order)
+        self._previous_epoch_detail = serializer(
+            'previous_epoch_detail', self._previous_epoch_detail)
+
+    def reset(self):
+        self.current_position = 0
+        self.epoch = 0
+        self.is_new_epoch = False
+
+        # use -1 instead of None internally.
+        self._previous_epoch_detail = -1.
+        if self.order_sampler:
+            self._order = self.order_sampler(
+                numpy.arange(len(self.dataset)), 0)
+        else:
+            self._order = None
+
+    @property
+    def _epoch_size(self):
+        if self._order is None:
+            return len(self.dataset)
+        else:
+            return len(self._order)
+
+    @property
+    def repeat(self):
+        return self._repeat
+
+    def _find_end(self, i):
+        # Returns the end of the longest batch from `i` within the budget.
+        # The costs of the prefixes are computed for a window of examples,
+        # which is doubled until the budget is exceeded.
+        N = self._epoch_size
+        size = self.max_batch_size or 64
+        while True:
+            end = min(i + size, N)
+            if self._order is None:
+                lengths = self._lengths[i:end]
+            else:
+                lengths = self._lengths[self._order[i:end]]
+            if self.padded:
+                costs = numpy.maximum.accumulate(lengths) * \
+                    numpy.arange(1, len(lengths) + 1)
+            else:
+                costs = numpy.cumsum(lengths)
+            # The costs are non-decreasing.
+            n = int(numpy.searchsorted(costs, self.max_tokens, 'right'))
+            if n < len(costs) or end == N or size == self.max_batch_size:
+                return i + max(n, 1)
+            size *= 2
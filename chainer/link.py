@@ -39,6 +39,185 @@ def _ensure_shape_dtype(value):
         return value
 
 
+def _return_none():
+    return None
+
+
+class ParameterArena(object):
+
+    """Flat buffers holding the data and gradient arrays of parameters.
+
+    A parameter arena allocates the data arrays of all parameters under a link
+    hierarchy as views into one contiguous array, and the gradient arrays as
+    views into another one. The flat arrays can be passed to routines that
+    process all parameters at once (e.g. all-reduce of gradients) without
+    gathering and scattering the arrays of each parameter.
+
+    The parameters are laid out in the order of their paths given by
+    :meth:`Link.namedparams`. All parameters must be initialized and must have
+    the same dtype.
+
+    Operations that replace the arrays of a parameter (e.g. the backward
+    computation, which usually allocates new gradient arrays) detach it from
+    the arena. The detached arrays are copied back into the flat buffers and
+    the views are restored by :meth:`sync`, which is implicitly called when
+    :attr:`data` or :attr:`grad` is accessed.
+
+    Parameter arena is created by :meth:`Link.allocate_arena`; it should not
+    be instantiated directly.
+
+    Args:
+        link (Link): Root link of the parameters.
+
+    """
+
+    def __init__(self, link):
+        params = []
+        for path, param in sorted(link.namedparams()):
+            if param.array is None:
+                raise ValueError(
+                    'parameter \'{}\' is not initialized'.format(path))
+            if param._arena is not None:
+                raise ValueError(
+                    'parameter \'{}\' already belongs to another arena'
+                    .format(path))
+            if not isinstance(param.array, (numpy.ndarray, cuda.ndarray)):
+                raise TypeError(
+                    'parameter \'{}\' has an unsupported array type: {}'
+                    .format(path, type(param.array)))
+            params.append(param)
+        if not params:
+            raise ValueError('link has no parameters')
+        dtypes = set(param.dtype for param in params)
+        if len(dtypes) != 1:
+            raise ValueError(
+                'all parameters in an arena must have the same dtype, but '
+                'got: {}'.format(', '.join(sorted(str(d) for d in dtypes))))
+        devices = set(cuda.get_device_from_array(param.array).id
+                      for param in params)
+        if len(devices) != 1:
+            raise ValueError('all parameters in an arena must be on the same '
+                             'device')
+
+        self._params = params
+        self._indices = {id(param): i for i, param in enumerate(params)}
+        self._offsets = [0]
+        for param in params:
+            self._offsets.append(self._offsets[-1] + param.size)
+
+        first = params[0].array
+        xp = backend.get_array_module(first)
+        with cuda.get_device_from_array(first):
+            data = xp.empty(self._offsets[-1], dtype=first.dtype)
+            grad = xp.zeros_like(data)
+        self._set_buffers(data, grad)
+        for param, data_view, grad_view in six.moves.zip(
+                params, self._data_views, self._grad_views):
+            data_view[...] = param.array
+            if param.grad is not None:
+                backend.copyto(grad_view, param.grad)
+            param.array = data_view
+            param.grad = grad_view
+            param._arena = self
+
+    def __reduce__(self):
+        # Copies of a link do not inherit the arena; the copied parameters
+        # hold independent arrays.
+        return _return_none, ()
+
+    @property
+    def params(self):
+        """List of the parameters in the arena."""
+        return list(self._params)
+
+    @property
+    def data(self):
+        """Flat array containing the data arrays of all parameters."""
+        self.sync()
+        return self._data
+
+    @property
+    def grad(self):
+        """Flat array containing the gradient arrays of all parameters.
+
+        Gradients of the parameters whose gradient arrays are cleared (i.e.
+        ``None``) are filled with zeros.
+
+        """
+        self.sync()
+        return self._grad
+
+    def _set_buffers(self, data, grad):
+        offsets = self._offsets
+        self._data = data
+        self._grad = grad
+        self._data_views = []
+        self._grad_views = []
+        for i, param in enumerate(self._params):
+            begin, end = offsets[i], offsets[i + 1]
+            self._data_views.append(data[begin:end].reshape(param.shape))
+            self._grad_views.append(grad[begin:end].reshape(param.shape))
+
+    def sync(self):
+        """Restores the parameters detached from the arena.
+
+        The data and gradient arrays of the parameters that were replaced after
+        the arena was allocated are copied into the flat buffers, and the
+        parameters are made to refer to the views into the buffers again.
+
+        """
+        for param, data_view, grad_view in six.moves.zip(
+                self._params, self._data_views, self._grad_views):
+            self._restore(param, data_view, grad_view)
+
+    def _restore(self, param, data_view, grad_view):
+        data = param.array
+        if data is not data_view:
+            if data is None or data.shape != data_view.shape:
+                raise RuntimeError(
+                    'the shape of parameter \'{}\' was changed after the '
+                    'arena was allocated'.format(param.name))
+            backend.copyto(data_view, data)
+            param.array = data_view
+        grad = param.grad
+        if grad is not grad_view:
+            if grad is None:
+                grad_view.fill(0)
+            else:
+                backend.copyto(grad_view, grad)
+            param.grad = grad_view
+
+    def _restore_param(self, param):
+        i = self._indices[id(param)]
+        self._restore(param, self._data_views[i], self._grad_views[i])
+
+    def _move(self, to_device):
+        self.sync()
+        data = to_device(self._data)
+        if data is self._data:
+            return
+        with cuda.get_device_from_array(data):
+            self._set_buffers(data, to_device(self._grad))
+        for param, data_view, grad_view in six.moves.zip(
+                self._params, self._data_views, self._grad_views):
+            param.array = data_view
+            param.grad = grad_view
+
+    def to_cpu(self):
+        """Moves the flat buffers to CPU and rebinds the parameters."""
+        self._move(cuda.to_cpu)
+
+    def to_gpu(self, device=None):
+        """Moves the flat buffers to GPU and rebinds the parameters.
+
+        Args:
+            device: Target device specifier. If omitted, the current device is
+                used.
+
+        """
+        self._move(lambda array: cuda.to_gpu(array, device))
+
+
 class Link(object):
 
     """Building block of model definitions.
@@ -132,6 +311,7 @@ class Link(object):
     """
 
     _local_link_hooks = None
+    _arena = None
 
     def __init__(self, **params):
         self._params = set()
@@ -164,6 +344,37 @@ class Link(object):
         return (0 if self._local_link_hooks is None
                 else len(self._local_link_hooks))
 
+    @property
+    def arena(self):
+        """:class:`ParameterArena` allocated by :meth:`allocate_arena`.
+
+        It is ``None`` if no arena has been allocated on this link.
+
+        """
+        return self._arena
+
+    def allocate_arena(self):
+        """Allocates parameters under the link hierarchy in a flat arena.
+
+        This method moves the data and gradient arrays of all parameters under
+        the link hierarchy into contiguous flat buffers, and makes each
+        parameter refer to views into them (see :class:`ParameterArena`). The
+        views are kept by :meth:`to_cpu`, :meth:`to_gpu`, :meth:`copyparams`,
+        :meth:`addgrads` and deserialization. Note that moving any parameter in
+        the arena to another device moves the whole arena.
+
+        All parameters must be initialized and have the same dtype. Parameters
+        registered after the arena is allocated are not included in it.
+
+        Returns:
+            ParameterArena: The arena. If an arena is already allocated on this
+            link, it is returned as is.
+
+        """
+        if self._arena is None:
+            self._arena = ParameterArena(self)
+        return self._arena
+
     @property
     def xp(self):
         """Array module for this link.
@@ -390,6 +601,7 @@ Assign a Parameter object directly to an attribute within a \
             ret = copy.copy(self)
             ret._params = set(self._params)
             ret._persistent = set(self._persistent)
+            ret._arena = None
             ret.name = None
             d = ret.__dict__
             for name in ret._params:
@@ -681,6 +893,10 @@ Assign a Parameter object directly to an attribute within a \
                     numpy.copyto(param.data, data)
                 else:
                     param.data.set(numpy.asarray(data))
+            elif data is not param.data and isinstance(data, numpy.ndarray):
+                # The deserializer returns an array to be used instead of the
+                # current one, e.g., an array mapped to memory.
+                param.data = data
         for name in self._persistent:
             d[name] = serializer(name, d[name])
 
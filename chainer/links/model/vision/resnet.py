@@ -584,6 +584,11 @@ class BuildingBlock(link.Chain):
                 setattr(self, name, bottleneck)
                 self._forward.append(name)
 
+    @property
+    def functions(self):
+        return collections.OrderedDict([
+            (name, [getattr(self, name)]) for name in self._forward])
+
     def forward(self, x):
         for name in self._forward:
             l = getattr(self, name)
@@ -288,6 +288,13 @@ class BatchNormalization(link.Link):
                     self.avg_mean.shape, dtype=x.dtype)
 
         if configuration.config.train:
+            if configuration.config.in_recomputing:
+                # The statistics are updated when the output is computed
+                # for the first time.
+                ret = functions.batch_normalization(
+                    x, gamma, beta, eps=self.eps, axis=self.axis)
+                return ret
+
             if finetune:
                 self.N += 1
                 decay = 1. - 1. / self.N
@@ -54,6 +54,14 @@ class BatchRenormalization(BatchNormalization):
                     self.avg_mean.shape, dtype=x.dtype)
 
         if configuration.config.train:
+            if configuration.config.in_recomputing:
+                # The statistics are updated when the output is computed
+                # for the first time; copies of them are used instead.
+                func = batch_renormalization.BatchRenormalizationFunction(
+                    self.eps, self.avg_mean.copy(), self.avg_var.copy(),
+                    self.decay, self.rmax, self.dmax)
+                return func(x, gamma, beta)
+
             if finetune:
                 self.N += 1
                 decay = 1. - 1. / self.N
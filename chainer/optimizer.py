@@ -13,6 +13,34 @@ from chainer import serializer as serializer_module
 from chainer import variable
 
 
+class ParameterChunk(collections.namedtuple(
+        'ParameterChunk', ('data', 'grad', 'params'))):
+
+    """Set of parameters whose arrays are processed at once by hooks.
+
+    The elements of ``data`` (resp. ``grad``) are the concatenation of the
+    data (resp. gradient) arrays of ``params`` in this order, and updating them
+    in place updates the arrays of the parameters. If the chunk consists of
+    multiple parameters, ``data`` and ``grad`` are one-dimensional flat
+    buffers shared by the parameters (e.g. of a
+    :class:`~chainer.link.ParameterArena`). Otherwise, they are the arrays of
+    the parameter itself.
+
+    Attributes:
+        data: Array containing the data of the parameters.
+        grad: Array containing the gradients of the parameters.
+        params (list of ~chainer.Parameter): Parameters in the chunk.
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def sizes(self):
+        """List of the sizes of the parameters."""
+        return [param.size for param in self.params]
+
+
 class Hyperparameter(object):
 
     """Set of hyperparameter entries of an optimizer.
@@ -107,9 +135,16 @@ class UpdateRule(object):
             :meth:`update` method does not update the parameter.
         hyperparam (Hyperparameter): Hyperparameter of the update rule.
         ~UpdateRule.t (int): Number of updates made by this update rule.
+        fusable (bool): Class attribute indicating that the update is
+            elementwise and that every state array has the same shape and
+            dtype as the parameter. Such update rules can be applied to the
+            concatenation of many parameters at once (see
+            :meth:`GradientMethod.use_fused_update`).
 
     """
 
+    fusable = False
+
     def __init__(self, parent_hyperparam=None):
         self._pre_update_hooks = collections.OrderedDict()
         self._post_update_hooks = collections.OrderedDict()
@@ -341,6 +376,23 @@ class UpdateRule(object):
         self._use_fp32_update = flag
 
 
+def _uses_chunks(hook):
+    # Returns True if the hook has ``call_for_chunks`` and its ``__call__`` is
+    # not overridden by a subclass of the class defining the former, which
+    # would customize the update of each parameter. The methods are looked up
+    # in the class as done for special methods, so that they are not confused
+    # with dynamic attributes.
+    mro = type(hook).__mro__
+    for i, cls in enumerate(mro):
+        if 'call_for_chunks' in vars(cls):
+            if vars(cls)['call_for_chunks'] is None:
+                return False
+            break
+    else:
+        return False
+    return not any('__call__' in vars(sub) for sub in mro[:i])
+
+
 class Optimizer(object):
     """Base class of all numerical optimizers.
 
@@ -364,6 +416,11 @@ class Optimizer(object):
     ``call_for_each_param`` and its value is ``True``, the hook function is
     used as a hook function of all update rules (i.e., it is invoked for every
     parameter by passing the corresponding update rule and the parameter).
+    Such a hook function can also provide a method ``call_for_chunks``. In
+    that case, the optimizer calls this method only once by passing the
+    optimizer and a list of :class:`ParameterChunk` objects that cover all
+    parameters, so that the hook can process many parameters in a few bulk
+    operations.
 
     Attributes:
         ~Optimizer.target: Target link object.
@@ -553,11 +610,59 @@ class Optimizer(object):
 
     def _call_hook(self, hook):
         if getattr(hook, 'call_for_each_param', False):
+            if _uses_chunks(hook):
+                hook.call_for_chunks(self, self.get_param_chunks())
+                return
             for param in self.target.params():
                 hook(param.update_rule, param)
         else:
             hook(self)
 
+    def _get_flat_buffers(self):
+        # Yields ``(data, grad, params, data_views, grad_views)`` of the flat
+        # buffers that may hold the arrays of the parameters.
+        seen = set()
+        for param in self.target.params(False):
+            arena = param._arena
+            if arena is not None and arena not in seen:
+                seen.add(arena)
+                arena.sync()
+                yield (arena._data, arena._grad, arena._params,
+                       arena._data_views, arena._grad_views)
+
+    def get_param_chunks(self):
+        """Returns the parameters with gradients as flat chunks.
+
+        Parameters whose arrays are views of the same flat buffer are
+        gathered into one :class:`ParameterChunk`, and each of the other
+        parameters forms a chunk by itself. Parameters without gradients
+        are omitted.
+
+        Returns:
+            list of :class:`ParameterChunk`: Chunks that cover all the
+            parameters with gradients.
+
+        """
+        params = [param for param in self.target.params(False)
+                  if param.grad is not None]
+        param_ids = set(id(param) for param in params)
+        chunks = []
+        chunked_ids = set()
+        for data, grad, flat_params, data_views, grad_views in (
+                self._get_flat_buffers()):
+            ids = [id(param) for param in flat_params]
+            if any(i in chunked_ids or i not in param_ids for i in ids):
+                continue
+            if all(param.array is data_view and param.grad is grad_view
+                   for param, data_view, grad_view in six.moves.zip(
+                       flat_params, data_views, grad_views)):
+                chunks.append(ParameterChunk(data, grad, flat_params))
+                chunked_ids.update(ids)
+        for param in params:
+            if id(param) not in chunked_ids:
+                chunks.append(ParameterChunk(param.array, param.grad, [param]))
+        return chunks
+
     def serialize(self, serializer):
         """Serializes or deserializes the optimizer.
 
@@ -617,9 +722,13 @@ class GradientMethod(Optimizer):
         super(GradientMethod, self).__init__()
         self.hyperparam = Hyperparameter()
         self._use_fp32_update = False
+        self._use_fused_update = False
+        self._fused_groups = None
+        self._use_release_retained = False
 
     def setup(self, link):
         super(GradientMethod, self).setup(link)
+        self._fused_groups = None
         for param in link.params():
             param.update_rule = self.create_update_rule()
             if self._use_fp32_update:
@@ -675,16 +784,24 @@ class GradientMethod(Optimizer):
                 self.target.cleargrads()
             else:
                 self.target.zerograds()
-            loss.backward(loss_scale=self._loss_scale)
+            loss.backward(
+                loss_scale=self._loss_scale,
+                release_retained=self._use_release_retained)
             del loss
 
         self.reallocate_cleared_grads()
 
+        if self._use_fused_update:
+            self._prepare_fused_update()
+
         self.call_hooks('pre')
 
         self.t += 1
-        for param in self.target.params():
-            param.update()
+        if self._use_fused_update:
+            self._fused_update()
+        else:
+            for param in self.target.params():
+                param.update()
 
         self.reallocate_cleared_grads()
 
@@ -734,6 +851,257 @@ class GradientMethod(Optimizer):
             for param in link.params():
                 param.update_rule.use_fp32_update()
 
+    def use_fused_update(self, flag=True):
+        """Enables fused update of parameters sharing the same update rule.
+
+        When it is enabled, parameters whose update rules are
+        :attr:`~UpdateRule.fusable` and share the same type, hyperparameters,
+        dtype and device are grouped together. The data, gradient and state
+        arrays of the parameters in each group are moved into contiguous flat
+        buffers (the arrays held by each parameter and update rule become views
+        into these buffers), and each group is updated by a single invocation
+        of the update rule. It removes most of the per-parameter overhead of
+        :meth:`update` for models with many small parameters.
+
+        Parameters that cannot be fused (e.g. those whose update rules have
+        their own hook functions, are disabled, or use fp32 update of fp16
+        parameters) are updated one by one as usual. The groups are rebuilt
+        automatically whenever the parameters of the target link are replaced
+        (e.g. by :meth:`~chainer.Link.to_gpu`).
+
+        Args:
+            flag (bool): If ``True``, the fused update is enabled.
+
+        """
+        self._use_fused_update = flag
+        self._fused_groups = None
+
+    def use_release_retained(self, flag=True):
+        """Enables early release of retained arrays in :meth:`update`.
+
+        When it is enabled, :meth:`update` with a loss function calls
+        :meth:`~chainer.Variable.backward` with ``release_retained=True``,
+        so that the arrays retained by function nodes for backward are freed
+        as soon as they are no longer needed in the backward pass. It reduces
+        the peak memory of each update, but the graph of the loss cannot be
+        backpropagated again afterwards. Do not enable it if the loss
+        function keeps variables of the graph for later backward
+        computation.
+
+        Args:
+            flag (bool): If ``True``, the early release is enabled.
+
+        """
+        self._use_release_retained = flag
+
+    def _prepare_fused_update(self):
+        # Builds the groups of parameters and gathers the gradients into the
+        # flat buffers, so that hooks can run on the flat buffers.
+        params = list(self.target.params())
+        groups = self._fused_groups
+        if groups is None or not groups.is_valid(params):
+            groups = self._fused_groups = _FusedUpdateGroups(params)
+        groups.gather_grads()
+        return groups
+
+    def _fused_update(self):
+        self._prepare_fused_update().update()
+
+    def _get_flat_buffers(self):
+        groups = self._fused_groups
+        if self._use_fused_update and groups is not None:
+            for group in groups.groups:
+                yield (group.data, group.grad, group.params,
+                       group.data_views, group.grad_views)
+        for buffers in super(GradientMethod, self)._get_flat_buffers():
+            yield buffers
+
+
+def _hyperparam_key(hyperparam):
+    items = [(k, v) for k, v in six.iteritems(hyperparam.__dict__)
+             if k != '_parent']
+    return id(hyperparam.parent), tuple(sorted(items))
+
+
+def _get_fused_key(param):
+    # Returns the key of the group to which the parameter belongs, or ``None``
+    # if the parameter cannot be updated by the fused update.
+    rule = param.update_rule
+    if rule is None or not rule.fusable or not rule.enabled:
+        return None
+    if rule._pre_update_hooks or rule._post_update_hooks:
+        return None
+    data = param.array
+    grad = param.grad
+    if not isinstance(data, (numpy.ndarray, cuda.ndarray)):
+        return None
+    if type(grad) is not type(data):
+        return None
+    if grad.shape != data.shape or grad.dtype != data.dtype:
+        return None
+    if rule._use_fp32_update and data.dtype == numpy.float16:
+        return None
+
+    rule._prepare(param)
+    for value in six.itervalues(rule.state):
+        if (type(value) is not type(data) or value.shape != data.shape
+                or value.dtype != data.dtype):
+            return None
+    device = cuda.get_device_from_array(data).id
+    return (type(rule), data.dtype, device, rule.t, param._loss_scale,
+            _hyperparam_key(rule.hyperparam), tuple(sorted(rule.state)),
+            param._arena)
+
+
+class _FusedUpdateGroup(object):
+
+    """Parameters updated by a single invocation of their update rule.
+
+    The data, gradient and state arrays of the parameters are views into flat
+    buffers. The update rule of the first parameter is copied to make a rule
+    whose state consists of the flat state buffers; this rule updates the flat
+    data buffer using the flat gradient buffer. If the parameters form a
+    :class:`~chainer.link.ParameterArena`, the buffers of the arena are used.
+
+    """
+
+    def __init__(self, params, key):
+        arena = params[0]._arena
+        if arena is not None:
+            arena.sync()
+            params = arena.params
+        self.params = params
+        self.rules = [param.update_rule for param in params]
+        self.key = key
+        self.loss_scale = params[0]._loss_scale
+
+        data = params[0].array
+        xp = backend.get_array_module(data)
+        with cuda.get_device_from_array(data):
+            if arena is not None:
+                self.data, self.data_views = arena._data, arena._data_views
+                self.grad, self.grad_views = arena._grad, arena._grad_views
+            else:
+                self.data, self.data_views = self._pack(
+                    xp, [param.array for param in params])
+                self.grad, self.grad_views = self._pack(
+                    xp, [param.grad for param in params])
+                for param, data_view, grad_view in six.moves.zip(
+                        params, self.data_views, self.grad_views):
+                    param.array = data_view
+                    param.grad = grad_view
+
+            state = {}
+            self.state_views = {}
+            for name in self.rules[0].state:
+                state[name], views = self._pack(
+                    xp, [rule.state[name] for rule in self.rules])
+                for rule, view in six.moves.zip(self.rules, views):
+                    rule.state[name] = view
+                self.state_views[name] = views
+
+        self.rule = copy.copy(self.rules[0])
+        self.rule._state = state
+        self.variable = variable.Variable(self.data, grad=self.grad)
+
+    @staticmethod
+    def _pack(xp, arrays):
+        size = sum(array.size for array in arrays)
+        flat = xp.empty(size, dtype=arrays[0].dtype)
+        views = []
+        offset = 0
+        for array in arrays:
+            view = flat[offset:offset + array.size].reshape(array.shape)
+            view[...] = array
+            views.append(view)
+            offset += array.size
+        return flat, views
+
+    def is_valid(self):
+        t = self.rules[0].t
+        for param, rule, data_view in six.moves.zip(
+                self.params, self.rules, self.data_views):
+            if (param.array is not data_view or param.update_rule is not rule
+                    or not rule.enabled or rule.t != t
+                    or rule._pre_update_hooks or rule._post_update_hooks
+                    or param._loss_scale != self.loss_scale
+                    or rule.state is None):
+                return False
+        for name, views in six.iteritems(self.state_views):
+            for rule, view in six.moves.zip(self.rules, views):
+                if rule.state.get(name) is not view:
+                    return False
+        return all(_hyperparam_key(rule.hyperparam) == self.key[5]
+                   for rule in self.rules)
+
+    def gather_grads(self):
+        for param, grad_view in six.moves.zip(self.params, self.grad_views):
+            grad = param.grad
+            if grad is not grad_view:
+                grad_view[...] = grad
+                param.grad = grad_view
+
+    def update(self):
+        for rule in self.rules:
+            rule.t += 1
+        rule = self.rule
+        rule.t = self.rules[0].t
+        rule.hyperparam = self.rules[0].hyperparam
+        if self.loss_scale is not None:
+            self.grad /= self.loss_scale
+        rule.update_core(self.variable)
+
+
+class _FusedUpdateGroups(object):
+
+    """Partition of the parameters of a link for the fused update."""
+
+    def __init__(self, params):
+        self.param_ids = [id(param) for param in params]
+        self.unfused = []
+        self.excluded_ids = set()
+        grouped = collections.OrderedDict()
+        for param in params:
+            key = _get_fused_key(param)
+            if key is None:
+                self.unfused.append(param)
+            else:
+                grouped.setdefault(key, []).append(param)
+        self.groups = []
+        for key, group_params in six.iteritems(grouped):
+            arena = group_params[0]._arena
+            if arena is not None and len(group_params) != len(arena.params):
+                # Parameters in an arena can only be fused as a whole, since
+                # their arrays must stay as views into the arena.
+                self.unfused.extend(group_params)
+                self.excluded_ids.update(id(param) for param in group_params)
+            else:
+                self.groups.append(_FusedUpdateGroup(group_params, key))
+
+    def is_valid(self, params):
+        if len(params) != len(self.param_ids):
+            return False
+        for param, param_id in six.moves.zip(params, self.param_ids):
+            if id(param) != param_id:
+                return False
+        for param in self.unfused:
+            # An unfused parameter may become fusable, e.g. after its hooks
+            # are removed or its data is initialized.
+            if (id(param) not in self.excluded_ids
+                    and _get_fused_key(param) is not None):
+                return False
+        return all(group.is_valid() for group in self.groups)
+
+    def gather_grads(self):
+        for group in self.groups:
+            group.gather_grads()
+
+    def update(self):
+        for param in self.unfused:
+            param.update()
+        for group in self.groups:
+            group.update()
+
 
 class HyperparameterProxy(object):
 
@@ -50,7 +50,9 @@ class GradientClipping(object):
         self.threshold = threshold
 
     def __call__(self, opt):
-        sqnorm = _sum_sqnorm([p.grad for p in opt.target.params(False)])
+        # Parameters sharing flat buffers are processed at once
+        grads = [chunk.grad for chunk in opt.get_param_chunks()]
+        sqnorm = _sum_sqnorm(grads)
         with cuda.get_device_from_array(sqnorm) as dev:
             norm = backend.get_array_module(sqnorm).sqrt(sqnorm)
             rate = self.threshold / norm
@@ -61,7 +63,6 @@ class GradientClipping(object):
                     return
             else:
                 rate = rate.clip(None, 1)
-        for param in opt.target.params(False):
-            grad = param.grad
+        for grad in grads:
             with cuda.get_device_from_array(grad):
                 grad *= rate
@@ -46,6 +46,13 @@ class GradientHardClipping(object):
         grad = param.grad
         if grad is None:
             return
+        self._clip(grad)
+
+    def call_for_chunks(self, opt, chunks):
+        for chunk in chunks:
+            self._clip(chunk.grad)
+
+    def _clip(self, grad):
         xp = backend.get_array_module(grad)
         with cuda.get_device_from_array(grad):
             xp.clip(grad, self.lower_bound, self.upper_bound, out=grad)
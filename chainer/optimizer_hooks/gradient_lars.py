@@ -1,3 +1,5 @@
+import numpy
+
 from chainer import backend
 from chainer import cuda
 
@@ -79,12 +81,62 @@ class GradientLARS(object):
         self.threshold = threshold
         self.weight_decay = weight_decay
         self.eps = eps
+        self._segments = {}
 
     def __call__(self, rule, param):
         p, g = param.data, param.grad
         if p is None or g is None:
             return
+        self._scale(p, g)
+
+    def call_for_chunks(self, opt, chunks):
+        for chunk in chunks:
+            if len(chunk.params) == 1:
+                self._scale(chunk.data, chunk.grad)
+            else:
+                self._scale_segments(chunk)
+
+    def _get_segments(self, xp, dev, sizes):
+        # Array of the index of the parameter of each element in a chunk. It
+        # is cached per chunk layout and device since the layout of chunks
+        # rarely changes.
+        key = tuple(sizes), int(dev)
+        segments = self._segments.get(key)
+        if segments is None:
+            segments = numpy.repeat(
+                numpy.arange(len(sizes), dtype=numpy.int32), sizes)
+            segments = xp.asarray(segments)
+            self._segments[key] = segments
+        return segments
+
+    def _scale_segments(self, chunk):
+        # Computes the norms of all parameters in the chunk by segmented
+        # reductions and scales the flat gradient at once.
+        p, g = chunk.data, chunk.grad
+        xp = backend.get_array_module(p)
+        sizes = chunk.sizes
+        with cuda.get_device_from_array(p) as dev:
+            segments = self._get_segments(xp, dev, sizes)
+            p_norm = xp.sqrt(xp.bincount(
+                segments, weights=p * p, minlength=len(sizes)))
+            g_norm = xp.sqrt(xp.bincount(
+                segments, weights=g * g, minlength=len(sizes)))
+            local_rate = p_norm / (
+                self.eps + g_norm + self.weight_decay * p_norm)
+            rate = xp.where(
+                p_norm > self.threshold, local_rate, 1.0).astype(g.dtype)
+            if int(dev) == -1:
+                g += self.weight_decay * p
+                g *= rate[segments]
+            else:
+                kernel = cuda.elementwise(
+                    'T p, int32 segment, raw T rate, T weight_decay',
+                    'T g',
+                    'g += weight_decay * p; g *= rate[segment];',
+                    'lars_segments')
+                kernel(p, segments, rate, self.weight_decay, g)
 
+    def _scale(self, p, g):
         xp = backend.get_array_module(p)
 
         # weight norm
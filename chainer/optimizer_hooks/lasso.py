@@ -39,6 +39,13 @@ class Lasso(object):
         p, g = param.data, param.grad
         if p is None or g is None:
             return
+        self._decay(p, g)
+
+    def call_for_chunks(self, opt, chunks):
+        for chunk in chunks:
+            self._decay(chunk.data, chunk.grad)
+
+    def _decay(self, p, g):
         xp = backend.get_array_module(p)
         with cuda.get_device_from_array(p) as dev:
             sign = xp.sign(p)
@@ -40,6 +40,13 @@ class WeightDecay(object):
         p, g = param.data, param.grad
         if p is None or g is None:
             return
+        self._decay(p, g)
+
+    def call_for_chunks(self, opt, chunks):
+        for chunk in chunks:
+            self._decay(chunk.data, chunk.grad)
+
+    def _decay(self, p, g):
         with cuda.get_device_from_array(p) as dev:
             if int(dev) == -1:
                 g += self.rate * p
@@ -62,6 +62,7 @@ class AdamRule(optimizer.UpdateRule):
 
     """
     _kernel = None
+    fusable = True
     _amsgrad_kernel = None
 
     def __init__(self, parent_hyperparam=None,
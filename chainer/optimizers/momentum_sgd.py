@@ -24,6 +24,7 @@ class MomentumSGDRule(optimizer.UpdateRule):
 
     """
     _kernel = None
+    fusable = True
 
     def __init__(self, parent_hyperparam=None, lr=None, momentum=None):
         super(MomentumSGDRule, self).__init__(
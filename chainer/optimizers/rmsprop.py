@@ -35,6 +35,7 @@ class RMSpropRule(optimizer.UpdateRule):
             details.
 
     """
+    fusable = True
 
     def __init__(self, parent_hyperparam=None, lr=None, alpha=None, eps=None,
                  eps_inside_sqrt=None):
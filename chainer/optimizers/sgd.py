@@ -21,6 +21,7 @@ class SGDRule(optimizer.UpdateRule):
 
     """
     _kernel = None
+    fusable = True
 
     def __init__(self, parent_hyperparam=None, lr=None):
         super(SGDRule, self).__init__(
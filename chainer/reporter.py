@@ -252,6 +252,16 @@ def _get_device(x):
         return cuda.get_device_from_array(x)
 
 
+def _to_device(x, device):
+    # Copies an array to the device of _ArraySummary if it is not there.
+    # Python scalars are converted by _ArraySummary.
+    if numpy.isscalar(x) and not isinstance(x, numpy.generic):
+        return x
+    if isinstance(x, cuda.ndarray) and x.device == device:
+        return x
+    return cuda.to_gpu(x, device)
+
+
 class Summary(object):
 
     """Online summarization of a sequence of scalars.
@@ -311,6 +321,93 @@ class Summary(object):
             warnings.warn('The previous statistics are not saved.')
 
 
+class _ArraySummary(object):
+
+    # Online summarization of the scalars of many keys on a device. The
+    # statistics are held in arrays of one element per key, so that the
+    # scalars added at once are accumulated by a constant number of array
+    # operations.
+
+    def __init__(self, device):
+        self.device = device
+        self._xp = numpy if device is cuda.DummyDevice else cuda.cupy
+        self._keys = ()
+        self._index = {}
+        self._indices = {}  # keys added at once -> their indices
+        self._x = None
+        self._x2 = None
+        self._n = None
+
+    def add(self, keys, values, weights=None):
+        xp = self._xp
+        dtypes = [getattr(v, 'dtype', v) for v in values + (weights or ())]
+        dtype = numpy.result_type(*dtypes)
+        with self.device:
+            x = xp.stack([xp.asarray(v, dtype) for v in values])
+            if weights is None:
+                w = 1
+            else:
+                w = xp.stack([xp.asarray(w, dtype) for w in weights])
+            wx = w * x
+            self._extend(xp, keys, dtype)
+            if keys == self._keys:
+                self._x += wx
+                self._x2 += wx * x
+                self._n += w
+            else:
+                index = self._indices.get(keys)
+                if index is None:
+                    index = xp.asarray([self._index[k] for k in keys],
+                                       numpy.intp)
+                    self._indices[keys] = index
+                self._x[index] += wx
+                self._x2[index] += wx * x
+                self._n[index] += w
+
+    def _extend(self, xp, keys, dtype):
+        new_keys = [k for k in keys if k not in self._index]
+        if self._x is not None:
+            dtype = numpy.result_type(self._x.dtype, dtype)
+            if not new_keys and dtype == self._x.dtype:
+                return
+        for k in new_keys:
+            self._index[k] = len(self._keys)
+            self._keys += (k,)
+        zeros = xp.zeros(len(new_keys), dtype)
+        if self._x is None:
+            self._x, self._x2, self._n = zeros, zeros.copy(), zeros.copy()
+        else:
+            self._x, self._x2, self._n = [
+                xp.concatenate((a.astype(dtype), zeros))
+                for a in (self._x, self._x2, self._n)]
+
+    def compute_mean(self):
+        with self.device:
+            mean = self._x / self._n
+            return {k: mean[i] for k, i in six.iteritems(self._index)}
+
+    def make_statistics(self):
+        xp = self._xp
+        with self.device:
+            mean = self._x / self._n
+            std = xp.sqrt(self._x2 / self._n - mean * mean)
+            stats = {}
+            for k, i in six.iteritems(self._index):
+                stats[k] = mean[i]
+                stats[k + '.std'] = std[i]
+            return stats
+
+    def get_summary(self, key):
+        # Returns the statistics of a key as a Summary.
+        i = self._index[key]
+        summary = Summary()
+        with self.device:
+            summary._x = self._x[i]
+            summary._x2 = self._x2[i]
+            summary._n = self._n[i]
+        return summary
+
+
 class DictSummary(object):
 
     """Online summarization of a sequence of dictionaries.
@@ -319,10 +416,19 @@ class DictSummary(object):
     It only computes the statistics for scalar values and variables of scalar
     values in the dictionaries.
 
+    The statistics of the entries first added as arrays on a GPU are kept in
+    arrays on the device, one element per entry. The values of such entries
+    added at once are accumulated by a constant number of operations, which
+    does not grow with the number of entries, and are not transferred to the
+    host until the statistics are computed.
+
     """
 
     def __init__(self):
         self._summaries = collections.defaultdict(Summary)
+        # Summaries of the entries on GPUs, for each entry and each device.
+        self._array_summaries = {}
+        self._devices = {}
 
     def add(self, d):
         """Adds a dictionary of scalars.
@@ -335,8 +441,9 @@ class DictSummary(object):
 
         """
         summaries = self._summaries
+        arrays = collections.defaultdict(list)
         for k, v in six.iteritems(d):
-            w = 1
+            w = None
             if isinstance(v, tuple):
                 w = v[1]
                 v = v[0]
@@ -347,8 +454,38 @@ class DictSummary(object):
                         'Given weight to {} was not scalar.'.format(k))
             if isinstance(v, variable.Variable):
                 v = v.array
-            if numpy.isscalar(v) or getattr(v, 'ndim', -1) == 0:
-                summaries[k].add(v, weight=w)
+            if not numpy.isscalar(v) and not getattr(v, 'ndim', -1) == 0:
+                continue
+            array_summary = self._get_array_summary(k, v)
+            if array_summary is None:
+                summaries[k].add(v, weight=1 if w is None else w)
+            else:
+                arrays[array_summary].append((k, v, w))
+
+        for array_summary, entries in six.iteritems(arrays):
+            device = array_summary.device
+            keys, values, weights = zip(*entries)
+            values = tuple(_to_device(v, device) for v in values)
+            if all(w is None for w in weights):
+                weights = None
+            else:
+                weights = tuple(_to_device(1 if w is None else w, device)
+                                for w in weights)
+            array_summary.add(keys, values, weights)
+
+    def _get_array_summary(self, key, value):
+        array_summary = self._array_summaries.get(key)
+        if array_summary is not None or key in self._summaries:
+            return array_summary
+        if not isinstance(value, cuda.ndarray):
+            return None
+        device_id = value.device.id
+        array_summary = self._devices.get(device_id)
+        if array_summary is None:
+            array_summary = _ArraySummary(cuda.Device(device_id))
+            self._devices[device_id] = array_summary
+        self._array_summaries[key] = array_summary
+        return array_summary
 
     def compute_mean(self):
         """Creates a dictionary of mean values.
@@ -360,8 +497,11 @@ class DictSummary(object):
             dict: Dictionary of mean values.
 
         """
-        return {name: summary.compute_mean()
-                for name, summary in six.iteritems(self._summaries)}
+        means = {name: summary.compute_mean()
+                 for name, summary in six.iteritems(self._summaries)}
+        for array_summary in six.itervalues(self._devices):
+            means.update(array_summary.compute_mean())
+        return means
 
     def make_statistics(self):
         """Creates a dictionary of statistics.
@@ -380,18 +520,26 @@ class DictSummary(object):
             mean, std = summary.make_statistics()
             stats[name] = mean
             stats[name + '.std'] = std
+        for array_summary in six.itervalues(self._devices):
+            stats.update(array_summary.make_statistics())
 
         return stats
 
     def serialize(self, serializer):
         if isinstance(serializer, serializer_module.Serializer):
             names = list(self._summaries.keys())
+            names += list(self._array_summaries.keys())
             serializer('_names', json.dumps(names))
             for index, name in enumerate(names):
-                self._summaries[name].serialize(
-                    serializer['_summaries'][str(index)])
+                if name in self._summaries:
+                    summary = self._summaries[name]
+                else:
+                    summary = self._array_summaries[name].get_summary(name)
+                summary.serialize(serializer['_summaries'][str(index)])
         else:
             self._summaries.clear()
+            self._array_summaries.clear()
+            self._devices.clear()
             try:
                 names = json.loads(serializer('_names', ''))
             except KeyError:
@@ -0,0 +1,227 @@
+import copy
+import json
+import struct
+
+import numpy
+import six
+
+from chainer.backends import cuda
+from chainer.backends import intel64
+from chainer import serializer
+from chainer.serializers import npz
+
+
+_MAGIC = b'CHNRMMAP'
+_VERSION = 1
+# Offset of the arrays in the file are aligned to the size of pages, so that
+# each array is mapped to memory by its own pages.
+_ALIGNMENT = 4096
+
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def save_mmap(file, obj):
+    """Saves an object to the file in a format that can be mapped to memory.
+
+    This function serializes an object in the same way as
+    :func:`~chainer.serializers.save_npz`, and writes the arrays without
+    compression to a single file, each array at an offset aligned to the
+    size of pages. The file can be loaded by :func:`load_mmap`, which maps
+    the arrays to memory instead of reading them.
+
+    Args:
+        file (str or file-like): Target file to write to.
+        obj: Object to be serialized. It must support serialization protocol.
+
+    .. seealso::
+        :func:`chainer.serializers.load_mmap`
+
+    """
+    if isinstance(file, six.string_types):
+        with open(file, 'wb') as f:
+            save_mmap(f, obj)
+        return
+
+    s = npz.DictionarySerializer()
+    s.save(obj)
+
+    arrays = []
+    entries = {}
+    offset = 0
+    for key, array in six.iteritems(s.target):
+        if array.dtype.hasobject:
+            if array.ndim != 0 or array[()] is not None:
+                raise ValueError(
+                    'objects cannot be saved: {}'.format(key))
+            entries[key] = None
+            continue
+        array = numpy.ascontiguousarray(array)
+        offset = _align(offset)
+        entries[key] = {
+            'dtype': array.dtype.str,
+            'shape': list(array.shape),
+            'offset': offset,
+        }
+        arrays.append((offset, array))
+        offset += array.nbytes
+
+    header = json.dumps({'version': _VERSION, 'arrays': entries})
+    header = header.encode('utf-8')
+    f = file
+    f.write(_MAGIC)
+    f.write(struct.pack('<Q', len(header)))
+    f.write(header)
+    start = _align(len(_MAGIC) + 8 + len(header))
+    position = len(_MAGIC) + 8 + len(header)
+    for offset, array in arrays:
+        f.write(b'\0' * (start + offset - position))
+        if array.nbytes:
+            f.write(array.data)
+        position = start + offset + array.nbytes
+
+
+def _map_arrays(file, mmap_mode):
+    # Returns a dictionary of the arrays in a file mapped to memory.
+    with open(file, 'rb') as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError('not a file written by save_mmap: {}'.format(
+                file))
+        header_size, = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_size).decode('utf-8'))
+    if header['version'] != _VERSION:
+        raise ValueError('unsupported version of the file: {}'.format(
+            header['version']))
+
+    start = _align(len(_MAGIC) + 8 + header_size)
+    data = numpy.memmap(file, numpy.uint8, mmap_mode)
+    arrays = {}
+    for key, entry in six.iteritems(header['arrays']):
+        if entry is None:
+            arrays[key] = None
+            continue
+        dtype = numpy.dtype(entry['dtype'])
+        shape = tuple(entry['shape'])
+        begin = start + entry['offset']
+        end = begin + dtype.itemsize * int(numpy.prod(shape))
+        # Plain views of the memmap keep it open.
+        arrays[key] = numpy.asarray(data[begin:end]).view(dtype).reshape(
+            shape)
+    return arrays
+
+
+class MmapDeserializer(serializer.Deserializer):
+
+    """Deserializer for the files written by :func:`save_mmap`.
+
+    The arrays in the file are mapped to memory. If ``mmap_mode`` is given,
+    the CPU arrays of the deserialized object are replaced with the mapped
+    arrays, which are read-only (``'r'``) or copy-on-write (``'c'``), so
+    that the processes loading the same file share the memory of the arrays
+    through the page cache of the OS. This applies to the values for which
+    the object stores what the deserializer returns, e.g., the initialized
+    parameters and the persistent values of links. The arrays whose dtype
+    or shape differ from those in the file, and the arrays on GPUs, are
+    copied as :class:`~chainer.serializers.NpzDeserializer` does. If
+    ``mmap_mode`` is ``None``, all arrays are copied.
+
+    Args:
+        file (str): Name of the file to be loaded.
+        path (str): The base path that the deserialization starts from.
+        strict (bool): If ``True``, the deserializer raises an error when an
+            expected value is not found in the given file. Otherwise,
+            it ignores the value and skip deserialization.
+        ignore_names (string, callable or list of them):
+            If callable, it is a function that takes a name of a parameter
+            and a persistent and returns ``True`` when it needs to be skipped.
+            If string, this is a name of a parameter or persistent that are
+            going to be skipped.
+            This can also be a list of callables and strings that behave as
+            described above.
+        mmap_mode (str): ``'r'``, ``'c'`` or ``None``.
+
+    """
+
+    def __init__(self, file, path='', strict=True, ignore_names=None,
+                 mmap_mode='r'):
+        if mmap_mode not in ('r', 'c', None):
+            raise ValueError('invalid mmap_mode: {}'.format(mmap_mode))
+        self.arrays = _map_arrays(file, mmap_mode or 'r')
+        self.path = path
+        self.strict = strict
+        if ignore_names is None:
+            ignore_names = []
+        self.ignore_names = ignore_names
+        self.mmap_mode = mmap_mode
+
+    def __getitem__(self, key):
+        key = key.strip('/')
+        child = copy.copy(self)
+        child.path = self.path + key + '/'
+        return child
+
+    def __call__(self, key, value):
+        key = self.path + key.lstrip('/')
+        if not self.strict and key not in self.arrays:
+            return value
+        if npz._is_ignored(key, self.ignore_names):
+            return value
+
+        array = self.arrays[key]
+        if array is None:
+            return None
+
+        if value is None:
+            return array if self.mmap_mode else array.copy()
+        elif isinstance(value, numpy.ndarray):
+            if self.mmap_mode and value.dtype == array.dtype and \
+                    value.shape == array.shape:
+                return array
+            numpy.copyto(value, array)
+        elif isinstance(value, cuda.ndarray):
+            value.set(numpy.asarray(array, dtype=value.dtype))
+        elif isinstance(value, intel64.mdarray):
+            intel64.ideep.basic_copyto(value, array)
+        else:
+            value = type(value)(array)
+        return value
+
+
+def load_mmap(file, obj, path='', strict=True, ignore_names=None,
+              mmap_mode='r'):
+    """Loads an object from the file written by :func:`save_mmap`.
+
+    The CPU arrays of the object are replaced with the arrays mapped to
+    memory as described in :class:`MmapDeserializer`. This is meant for
+    loading models for inference, where many processes can share the
+    parameters. Pass ``mmap_mode=None`` to copy the arrays instead, e.g.,
+    to load objects for training, or objects that expect the arrays to be
+    copied in place, such as iterators.
+
+    Args:
+        file (str): Name of the file to be loaded.
+        obj: Object to be deserialized. It must support serialization protocol.
+        path (str): The path in the hierarchy of the serialized data under
+            which the data is to be loaded. The default behavior (blank) will
+            load all data under the root path.
+        strict (bool): If ``True``, the deserializer raises an error when an
+            expected value is not found in the given file. Otherwise,
+            it ignores the value and skip deserialization.
+        ignore_names (string, callable or list of them):
+            If callable, it is a function that takes a name of a parameter
+            and a persistent and returns ``True`` when it needs to be skipped.
+            If string, this is a name of a parameter or persistent that are
+            going to be skipped.
+            This can also be a list of callables and strings that behave as
+            described above.
+        mmap_mode (str): ``'r'`` to map the arrays read-only, ``'c'`` to map
+            them copy-on-write, or ``None`` to copy them.
+
+    .. seealso::
+        :func:`chainer.serializers.save_mmap`
+
+    """
+    d = MmapDeserializer(file, path=path, strict=strict,
+                         ignore_names=ignore_names, mmap_mode=mmap_mode)
+    d.load(obj)
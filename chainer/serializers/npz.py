@@ -1,3 +1,10 @@
+import json
+import multiprocessing
+from multiprocessing import pool
+import os
+import shutil
+import tempfile
+
 import numpy
 import six
 
@@ -124,21 +131,8 @@ class NpzDeserializer(serializer.Deserializer):
         if not self.strict and key not in self.npz:
             return value
 
-        if isinstance(self.ignore_names, (tuple, list)):
-            ignore_names = self.ignore_names
-        else:
-            ignore_names = (self.ignore_names,)
-        for ignore_name in ignore_names:
-            if isinstance(ignore_name, str):
-                if key == ignore_name:
-                    return value
-            elif callable(ignore_name):
-                if ignore_name(key):
-                    return value
-            else:
-                raise ValueError(
-                    'ignore_names needs to be a callable, string or '
-                    'list of them.')
+        if _is_ignored(key, self.ignore_names):
+            return value
 
         dataset = self.npz[key]
         if dataset[()] is None:
@@ -157,6 +151,23 @@ class NpzDeserializer(serializer.Deserializer):
         return value
 
 
+def _is_ignored(key, ignore_names):
+    if not isinstance(ignore_names, (tuple, list)):
+        ignore_names = (ignore_names,)
+    for ignore_name in ignore_names:
+        if isinstance(ignore_name, str):
+            if key == ignore_name:
+                return True
+        elif callable(ignore_name):
+            if ignore_name(key):
+                return True
+        else:
+            raise ValueError(
+                'ignore_names needs to be a callable, string or '
+                'list of them.')
+    return False
+
+
 def load_npz(file, obj, path='', strict=True, ignore_names=None):
     """Loads an object from the file in NPZ format.
 
@@ -188,3 +199,177 @@ def load_npz(file, obj, path='', strict=True, ignore_names=None):
         d = NpzDeserializer(
             f, path=path, strict=strict, ignore_names=ignore_names)
         d.load(obj)
+
+
+_MANIFEST_FILE = 'manifest.json'
+_SHARDED_VERSION = 1
+
+
+def _shard_path(directory, i):
+    return os.path.join(directory, 'shard{:05d}.npz'.format(i))
+
+
+def _run_in_threads(func, args, n_threads):
+    if n_threads is None:
+        n_threads = multiprocessing.cpu_count()
+    n_threads = min(n_threads, len(args))
+    if n_threads <= 1:
+        return [func(*a) for a in args]
+    thread_pool = pool.ThreadPool(n_threads)
+    try:
+        return thread_pool.map(lambda a: func(*a), args)
+    finally:
+        thread_pool.close()
+        thread_pool.join()
+
+
+def _save_shard(path, arrays, compression):
+    with open(path, 'wb') as f:
+        if compression:
+            numpy.savez_compressed(f, **arrays)
+        else:
+            numpy.savez(f, **arrays)
+
+
+def _load_shard(path, keys):
+    with numpy.load(path) as f:
+        return {key: f[key] for key in keys}
+
+
+def save_npz_sharded(directory, obj, compression=True, shard_size=1 << 28,
+                     n_threads=None):
+    """Saves an object to a directory of NPZ files.
+
+    This function saves an object in the same way as :func:`save_npz`, but
+    the arrays are split into NPZ files, or shards, of about ``shard_size``
+    bytes each, which are compressed and written by a pool of threads, with
+    a manifest file that maps each array to the shard holding it. The files
+    are written to a temporary directory, which then replaces the given
+    directory, so that an incomplete checkpoint cannot be loaded.
+
+    Args:
+        directory (str): Directory to write to. If it exists, it must be
+            empty or another checkpoint written by this function, which is
+            replaced.
+        obj: Object to be serialized. It must support serialization protocol.
+        compression (bool): If ``True``, compression in the resulting zip
+            files is enabled.
+        shard_size (int): Size in bytes of the arrays written to each shard.
+            An array larger than this size is written to a shard of its own.
+        n_threads (int): Number of threads writing the shards. If ``None``,
+            the number of CPUs is used.
+
+    .. seealso::
+        :func:`chainer.serializers.load_npz_sharded`
+
+    """
+    s = DictionarySerializer()
+    s.save(obj)
+
+    shards = []
+    size = 0
+    for key, array in six.iteritems(s.target):
+        if not shards or size + array.nbytes > shard_size:
+            shards.append({})
+            size = 0
+        shards[-1][key] = array
+        size += array.nbytes
+
+    directory = os.path.normpath(directory)
+    if os.path.isdir(directory) and os.listdir(directory) and \
+            not os.path.exists(os.path.join(directory, _MANIFEST_FILE)):
+        raise ValueError(
+            'directory is not empty and not a sharded NPZ: {}'.format(
+                directory))
+    parent = os.path.dirname(directory)
+    if parent and not os.path.exists(parent):
+        os.makedirs(parent)
+
+    # The shards are written to a temporary directory, which replaces the
+    # directory when it is completed.
+    tmpdir = tempfile.mkdtemp(
+        prefix='tmp' + os.path.basename(directory), dir=parent or '.')
+    try:
+        _run_in_threads(
+            _save_shard,
+            [(_shard_path(tmpdir, i), arrays, compression)
+             for i, arrays in enumerate(shards)],
+            n_threads)
+
+        keys = {}
+        for i, arrays in enumerate(shards):
+            for key in arrays:
+                keys[key] = i
+        manifest = {
+            'version': _SHARDED_VERSION,
+            'n_shards': len(shards),
+            'keys': keys,
+        }
+        with open(os.path.join(tmpdir, _MANIFEST_FILE), 'w') as f:
+            json.dump(manifest, f)
+
+        if os.path.exists(directory):
+            old = tmpdir + '.old'
+            os.rename(directory, old)
+            os.rename(tmpdir, directory)
+            shutil.rmtree(old)
+        else:
+            os.rename(tmpdir, directory)
+    except Exception:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        raise
+
+
+def load_npz_sharded(directory, obj, path='', strict=True, ignore_names=None,
+                     n_threads=None):
+    """Loads an object from a directory written by :func:`save_npz_sharded`.
+
+    The shards holding the arrays under ``path`` are read and decompressed
+    by a pool of threads, and then the object is deserialized by
+    :class:`NpzDeserializer` in the same way as :func:`load_npz`. Note that
+    all the arrays to be loaded are held in memory at once.
+
+    Args:
+        directory (str): Directory to be loaded.
+        obj: Object to be deserialized. It must support serialization protocol.
+        path (str): The path in the hierarchy of the serialized data under
+            which the data is to be loaded. The default behavior (blank) will
+            load all data under the root path.
+        strict (bool): If ``True``, the deserializer raises an error when an
+            expected value is not found in the given files. Otherwise,
+            it ignores the value and skip deserialization.
+        ignore_names (string, callable or list of them):
+            If callable, it is a function that takes a name of a parameter
+            and a persistent and returns ``True`` when it needs to be skipped.
+            If string, this is a name of a parameter or persistent that are
+            going to be skipped.
+            This can also be a list of callables and strings that behave as
+            described above.
+        n_threads (int): Number of threads reading the shards. If ``None``,
+            the number of CPUs is used.
+
+    .. seealso::
+        :func:`chainer.serializers.save_npz_sharded`
+
+    """
+    with open(os.path.join(directory, _MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    if manifest['version'] != _SHARDED_VERSION:
+        raise ValueError('unsupported version of sharded NPZ: {}'.format(
+            manifest['version']))
+
+    shard_keys = [[] for _ in six.moves.range(manifest['n_shards'])]
+    for key, i in six.iteritems(manifest['keys']):
+        if key.startswith(path):
+            shard_keys[i].append(key)
+    arrays = {}
+    for shard in _run_in_threads(
+            _load_shard,
+            [(_shard_path(directory, i), keys)
+             for i, keys in enumerate(shard_keys) if keys],
+            n_threads):
+        arrays.update(shard)
+
+    d = NpzDeserializer(
+        arrays, path=path, strict=strict, ignore_names=ignore_names)
+    d.load(obj)
@@ -1,12 +1,22 @@
+import functools
 import os
 import shutil
+import sys
+import threading
+import time
 
+import numpy
+import six
+
+from chainer.backends import intel64
+from chainer import reporter
 from chainer.serializers import npz
 from chainer.training import extension
 from chainer import utils
 
 
-def snapshot_object(target, filename, savefun=npz.save_npz):
+def snapshot_object(target, filename, savefun=npz.save_npz,
+                    async_write=False, max_pending=1):
     """Returns a trainer extension to take snapshots of a given object.
 
     This extension serializes the given object and saves it to the output
@@ -20,6 +30,9 @@ def snapshot_object(target, filename, savefun=npz.save_npz):
     The default priority is -100, which is lower than that of most
     built-in extensions.
 
+    If ``async_write`` is ``True``, the file is written in a background
+    thread. See :func:`snapshot` for details.
+
     Args:
         target: Object to serialize.
         filename (str): Name of the file into which the object is serialized.
@@ -29,20 +42,30 @@ def snapshot_object(target, filename, savefun=npz.save_npz):
             ``'snapshot_10000'`` at the 10,000th iteration.
         savefun: Function to save the object. It takes two arguments: the
             output file path and the object to serialize.
+        async_write (bool): If ``True``, the file is written in a background
+            thread.
+        max_pending (int): Maximum number of snapshots waiting to be written
+            in the background.
 
     Returns:
         An extension function.
 
     """
-    @extension.make_extension(trigger=(1, 'epoch'), priority=-100)
+    writer = _AsyncWriter(max_pending) if async_write else None
+    finalizer = writer.finalize if async_write else None
+
+    @extension.make_extension(trigger=(1, 'epoch'), priority=-100,
+                              finalizer=finalizer)
     def snapshot_object(trainer):
-        _snapshot_object(trainer, target, filename.format(trainer), savefun)
+        _snapshot_object(trainer, target, filename.format(trainer), savefun,
+                         writer)
 
     return snapshot_object
 
 
 def snapshot(savefun=npz.save_npz,
-             filename='snapshot_iter_{.updater.iteration}'):
+             filename='snapshot_iter_{.updater.iteration}',
+             async_write=False, max_pending=1):
     """Returns a trainer extension to take snapshots of the trainer.
 
     This extension serializes the trainer object and saves it to the output
@@ -63,26 +86,153 @@ def snapshot(savefun=npz.save_npz,
        right before the renaming, the temporary file might be left in the
        output directory.
 
+    If ``async_write`` is ``True``, the training loop only waits for a copy
+    of the serialized arrays to be made in memory, and the file is written
+    in a background thread in the same way. The object passed to
+    ``savefun`` is then a copy of the state of the trainer that only
+    supports the :meth:`serialize` method. If ``max_pending`` snapshots are
+    already waiting to be written, the training loop waits for one of them.
+    The snapshots are written before the training loop exits. In this mode,
+    the extension reports the following values.
+
+    * ``snapshot/stall_time``: Time in seconds that the training loop waited
+      for the snapshot.
+    * ``snapshot/write_time``: Time in seconds to write the last snapshot
+      completed in the background.
+
+    Since the values are reported when the extension is called, the extension
+    has to be given a higher priority than
+    :class:`~chainer.training.extensions.LogReport` so that the values are
+    logged.
+
     Args:
         savefun: Function to save the trainer. It takes two arguments: the
             output file path and the trainer object.
         filename (str): Name of the file into which the trainer is serialized.
             It can be a format string, where the trainer object is passed to
             the :meth:`str.format` method.
+        async_write (bool): If ``True``, the file is written in a background
+            thread.
+        max_pending (int): Maximum number of snapshots waiting to be written
+            in the background.
 
     """
-    @extension.make_extension(trigger=(1, 'epoch'), priority=-100)
+    writer = _AsyncWriter(max_pending) if async_write else None
+    finalizer = writer.finalize if async_write else None
+
+    @extension.make_extension(trigger=(1, 'epoch'), priority=-100,
+                              finalizer=finalizer)
     def snapshot(trainer):
-        _snapshot_object(trainer, trainer, filename.format(trainer), savefun)
+        _snapshot_object(trainer, trainer, filename.format(trainer), savefun,
+                         writer)
 
     return snapshot
 
 
-def _snapshot_object(trainer, target, filename, savefun):
+def _snapshot_object(trainer, target, filename, savefun, writer=None):
     fn = filename.format(trainer)
+    if writer is None:
+        _save(trainer.out, fn, target, savefun)
+        return
+
+    start = time.time()
+    writer.submit(functools.partial(
+        _save, trainer.out, fn, _StateCopy(target), savefun))
+    observation = {'snapshot/stall_time': time.time() - start}
+    if writer.write_time is not None:
+        observation['snapshot/write_time'] = writer.write_time
+    reporter.report(observation)
+
+
+def _save(out, fn, target, savefun):
     prefix = 'tmp' + fn
 
-    with utils.tempdir(prefix=prefix, dir=trainer.out) as tmpdir:
+    with utils.tempdir(prefix=prefix, dir=out) as tmpdir:
         tmppath = os.path.join(tmpdir, fn)
         savefun(tmppath, target)
-        shutil.move(tmppath, os.path.join(trainer.out, fn))
+        path = os.path.join(out, fn)
+        if os.path.isdir(path):
+            # A directory written by savefun replaces the previous one
+            # instead of being moved into it.
+            os.rename(path, tmppath + '.old')
+        shutil.move(tmppath, path)
+
+
+class _CopySerializer(npz.DictionarySerializer):
+
+    # DictionarySerializer that copies the arrays, which may be updated in
+    # place before being written.
+
+    def __getitem__(self, key):
+        key = key.strip('/')
+        return _CopySerializer(self.target, self.path + key + '/')
+
+    def __call__(self, key, value):
+        if value is None:
+            # Kept as is for the serializers handling None by itself.
+            self.target[self.path + key.lstrip('/')] = None
+        elif isinstance(value, (numpy.ndarray, intel64.mdarray)):
+            super(_CopySerializer, self).__call__(
+                key, numpy.array(value, copy=True))
+        else:
+            super(_CopySerializer, self).__call__(key, value)
+        return value
+
+
+class _StateCopy(object):
+
+    # Copy of the serialized state of an object, which is serialized in the
+    # same way as the object.
+
+    def __init__(self, target):
+        self._state = {}
+        target.serialize(_CopySerializer(self._state))
+
+    def serialize(self, serializer):
+        for key, value in six.iteritems(self._state):
+            serializer(key, value)
+
+
+class _AsyncWriter(object):
+
+    # Runs the functions writing snapshots in a background thread.
+
+    def __init__(self, max_pending):
+        self._queue = six.moves.queue.Queue(max_pending)
+        self._thread = None
+        self._error = None
+        self.write_time = None
+
+    def submit(self, func):
+        self._raise_error()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+        self._queue.put(func)
+
+    def finalize(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            six.reraise(*error)
+
+    def _run(self):
+        while True:
+            func = self._queue.get()
+            if func is None:
+                return
+            start = time.time()
+            try:
+                func()
+            except Exception:
+                if self._error is None:
+                    self._error = sys.exc_info()
+            else:
+                self.write_time = time.time() - start
@@ -36,6 +36,22 @@ class LogReport(extension.Extension):
     - ``'elapsed_time'`` is the elapsed time in seconds since the training
       begins. The value is taken from :attr:`Trainer.elapsed_time`.
 
+    The log file is written in one of the following formats.
+
+    - ``'json'``: The list of the result dictionaries is written as a JSON
+      array. The whole file is rewritten every time a result is appended.
+    - ``'json-lines'``: Each result dictionary is appended to the file as a
+      line of JSON, so that the cost of writing a result does not grow with
+      the length of the log. When the training is resumed from a snapshot,
+      the lines appended after the snapshot was taken are removed.
+
+    The list of the result dictionaries is also held in memory as
+    :attr:`log`, which is used by other extensions such as
+    :class:`~chainer.training.extensions.PrintReport`, and saved in
+    snapshots. If ``max_log_length`` is given, only the latest results are
+    kept in the list, which makes the cost of snapshots and of the JSON
+    format bounded.
+
     Args:
         keys (iterable of strs): Keys of values to accumulate. If this is None,
             all the values are accumulated and output to the log file.
@@ -52,16 +68,43 @@ class LogReport(extension.Extension):
             formatting. For example, users can use '{iteration}' to separate
             the log files for different iterations. If the log name is None, it
             does not output the log to any file.
+        format (str): Format of the log file, either ``'json'`` or
+            ``'json-lines'``. If ``None``, ``'json-lines'`` is used if the log
+            name ends with ``'.jsonl'``, and ``'json'`` is used otherwise.
+        max_log_length (int): Maximum number of the result dictionaries held
+            in :attr:`log`. If ``None``, all results are held.
+        fsync_interval (int): Number of the results appended to the log file
+            of the ``'json-lines'`` format between calls of :func:`os.fsync`.
+            The file is also synchronized at the end of the training. If
+            ``None``, the file is not synchronized explicitly.
 
     """
 
     def __init__(self, keys=None, trigger=(1, 'epoch'), postprocess=None,
-                 log_name='log'):
+                 log_name='log', format=None, max_log_length=None,
+                 fsync_interval=None):
+        if format is None:
+            if log_name is not None and log_name.endswith('.jsonl'):
+                format = 'json-lines'
+            else:
+                format = 'json'
+        if format not in ('json', 'json-lines'):
+            raise ValueError('unsupported log format: {}'.format(format))
         self._keys = keys
         self._trigger = trigger_module.get_trigger(trigger)
         self._postprocess = postprocess
         self._log_name = log_name
+        self._format = format
+        self._max_log_length = max_log_length
+        self._fsync_interval = fsync_interval
         self._log = []
+        self._log_offset = 0
+        # Name and size of the log file last appended to in the json-lines
+        # format, and the number of results not synchronized.
+        self._log_file_name = ''
+        self._log_file_size = 0
+        self._log_file_path = None
+        self._n_unsynced = 0
 
         self._init_summary()
 
@@ -92,26 +135,68 @@ class LogReport(extension.Extension):
                 self._postprocess(stats_cpu)
 
             self._log.append(stats_cpu)
+            n_drop = len(self._log) - (self._max_log_length or len(self._log))
+            if n_drop > 0:
+                del self._log[:n_drop]
+                self._log_offset += n_drop
 
             # write to the log file
             if self._log_name is not None:
                 log_name = self._log_name.format(**stats_cpu)
-                with utils.tempdir(prefix=log_name, dir=trainer.out) as tempd:
-                    path = os.path.join(tempd, 'log.json')
-                    with open(path, 'w') as f:
-                        json.dump(self._log, f, indent=4)
-
-                    new_path = os.path.join(trainer.out, log_name)
-                    shutil.move(path, new_path)
+                if self._format == 'json-lines':
+                    self._append(trainer.out, log_name, stats_cpu)
+                else:
+                    self._write(trainer.out, log_name)
 
             # reset the summary for the next output
             self._init_summary()
 
+    def finalize(self):
+        if self._n_unsynced:
+            with open(self._log_file_path, 'a') as f:
+                os.fsync(f.fileno())
+            self._n_unsynced = 0
+
     @property
     def log(self):
         """The current list of observation dictionaries."""
         return self._log
 
+    @property
+    def log_offset(self):
+        """The number of observation dictionaries removed from the log."""
+        return self._log_offset
+
+    def _write(self, out, log_name):
+        with utils.tempdir(prefix=log_name, dir=out) as tempd:
+            path = os.path.join(tempd, 'log.json')
+            with open(path, 'w') as f:
+                json.dump(self._log, f, indent=4)
+
+            new_path = os.path.join(out, log_name)
+            shutil.move(path, new_path)
+
+    def _append(self, out, log_name, stats):
+        path = os.path.join(out, log_name)
+        if log_name != self._log_file_name:
+            # A file not written by this extension is started from scratch.
+            self._log_file_size = 0
+        with open(path, 'a') as f:
+            # Remove the lines appended after the snapshot being resumed.
+            f.seek(0, os.SEEK_END)
+            if f.tell() > self._log_file_size:
+                f.truncate(self._log_file_size)
+            f.write(json.dumps(stats) + '\n')
+            f.flush()
+            self._n_unsynced += 1
+            if self._fsync_interval and \
+                    self._n_unsynced >= self._fsync_interval:
+                os.fsync(f.fileno())
+                self._n_unsynced = 0
+        self._log_file_name = log_name
+        self._log_file_size = os.path.getsize(path)
+        self._log_file_path = path
+
     def serialize(self, serializer):
         if hasattr(self._trigger, 'serialize'):
             self._trigger.serialize(serializer['_trigger'])
@@ -126,9 +211,25 @@ class LogReport(extension.Extension):
         if isinstance(serializer, serializer_module.Serializer):
             log = json.dumps(self._log)
             serializer('_log', log)
+            state = json.dumps({
+                'log_offset': self._log_offset,
+                'log_file_name': self._log_file_name,
+                'log_file_size': self._log_file_size,
+            })
+            serializer('_state', state)
         else:
             log = serializer('_log', '')
             self._log = json.loads(log)
+            try:
+                state = serializer('_state', '')
+            except KeyError:
+                # snapshots of older versions
+                state = ''
+            if state:
+                state = json.loads(state)
+                self._log_offset = state['log_offset']
+                self._log_file_name = state['log_file_name']
+                self._log_file_size = state['log_file_size']
 
     def _init_summary(self):
         self._summary = reporter.DictSummary()
@@ -59,14 +59,16 @@ class PrintReport(extension.Extension):
                             type(log_report))
 
         log = log_report.log
-        log_len = self._log_len
-        while len(log) > log_len:
+        # the observations removed from the log are skipped
+        log_offset = getattr(log_report, 'log_offset', 0)
+        log_len = max(self._log_len, log_offset)
+        while len(log) + log_offset > log_len:
             # delete the printed contents from the current cursor
             if os.name == 'nt':
                 util.erase_console(0, 0)
             else:
                 out.write('\033[J')
-            self._print(log[log_len])
+            self._print(log[log_len - log_offset])
             log_len += 1
         self._log_len = log_len
 
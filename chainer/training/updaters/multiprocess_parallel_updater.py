@@ -329,7 +329,20 @@ def _memcpy_gather():
             ''')
 
 
+def _get_arena_buffer(link, target):
+    # Returns the flat buffer of the parameter arena of the link if it can be
+    # used in place of the gathered array.
+    arena = link.arena
+    if arena is None or arena.params[0].dtype != numpy.float32:
+        return None
+    return getattr(arena, target)
+
+
 def _gather(link, target):
+    array = _get_arena_buffer(link, target)
+    if array is not None:
+        return array
+
     size, num = size_num_grads(link)
 
     ptrs = numpy.empty(num, dtype=numpy.uint64)
@@ -361,6 +374,9 @@ def _gather(link, target):
 def gather_grads(link):
     """Put together all gradient arrays and make a single array
 
+    If a float32 :class:`~chainer.link.ParameterArena` is allocated on the
+    link, its flat gradient buffer is returned without copy.
+
     Args:
         link (chainer.link.Link): Target link object.
     Return:
@@ -422,6 +438,10 @@ def _memcpy_scatter():
 
 
 def _scatter(link, array, target):
+    if array is _get_arena_buffer(link, target):
+        # The array is the flat buffer of the arena; nothing to do.
+        return
+
     size, num = size_num_grads(link)
 
     ptrs = numpy.zeros(num, dtype=numpy.uint64)
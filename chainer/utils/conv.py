@@ -62,9 +62,17 @@ def get_deconv_outsize(size, k, s, p, cover_all=False, d=1):
         return s * (size - 1) + dk - 2 * p
 
 
+def _get_valid_range(offset, s, p, size, out_size):
+    # Returns the range [lo, hi) of the output positions o whose input
+    # position offset + s * o - p lies in [0, size).
+    lo = min(max(0, -((offset - p) // s)), out_size)
+    hi = min(max(lo, -((offset - p - size) // s)), out_size)
+    return lo, hi
+
+
 def im2col_cpu(
         img, kh, kw, sy, sx, ph, pw, pval=0, cover_all=False, dy=1, dx=1,
-        out_h=None, out_w=None):
+        out_h=None, out_w=None, out=None):
     n, c, h, w = img.shape
     if out_h is None:
         out_h = get_conv_outsize(h, kh, sy, ph, cover_all, dy)
@@ -73,18 +81,28 @@ def im2col_cpu(
         out_w = get_conv_outsize(w, kw, sx, pw, cover_all, dx)
     assert out_w > 0, 'Width in the output should be positive.'
 
-    img = numpy.pad(img,
-                    ((0, 0), (0, 0), (ph, ph + sy - 1), (pw, pw + sx - 1)),
-                    mode='constant', constant_values=(pval,))
-    col = numpy.ndarray((n, c, kh, kw, out_h, out_w), dtype=img.dtype)
+    if out is None:
+        col = numpy.ndarray((n, c, kh, kw, out_h, out_w), dtype=img.dtype)
+    else:
+        col = out
 
+    # Only the positions within the image are copied, so that the image does
+    # not have to be padded.
     for j in six.moves.range(kh):
         jdy = j * dy
-        j_lim = jdy + sy * out_h
+        y0, y1 = _get_valid_range(jdy, sy, ph, h, out_h)
         for i in six.moves.range(kw):
             idx = i * dx
-            i_lim = idx + sx * out_w
-            col[:, :, j, i, :, :] = img[:, :, jdy:j_lim:sy, idx:i_lim:sx]
+            x0, x1 = _get_valid_range(idx, sx, pw, w, out_w)
+            col_ji = col[:, :, j, i]
+            if (y0, y1, x0, x1) != (0, out_h, 0, out_w):
+                col_ji.fill(pval)
+            if y0 < y1 and x0 < x1:
+                in_y = jdy + sy * y0 - ph
+                in_x = idx + sx * x0 - pw
+                col_ji[:, :, y0:y1, x0:x1] = img[
+                    :, :, in_y:in_y + sy * (y1 - y0):sy,
+                    in_x:in_x + sx * (x1 - x0):sx]
 
     return col
 
@@ -124,18 +142,30 @@ def im2col_gpu(img, kh, kw, sy, sx, ph, pw, cover_all=False, dy=1, dx=1,
     return col
 
 
-def col2im_cpu(col, sy, sx, ph, pw, h, w, dy=1, dx=1):
+def col2im_cpu(col, sy, sx, ph, pw, h, w, dy=1, dx=1, out=None):
     n, c, kh, kw, out_h, out_w = col.shape
-    img = numpy.zeros((n, c, h + 2 * ph + sy - 1, w + 2 * pw + sx - 1),
-                      dtype=col.dtype)
+    if out is None:
+        img = numpy.zeros((n, c, h, w), dtype=col.dtype)
+    else:
+        img = out
+        img.fill(0)
+    # Only the positions within the image are accumulated, so that the
+    # padded image does not have to be allocated.
     for j in six.moves.range(kh):
         jdy = j * dy
-        j_lim = jdy + sy * out_h
+        y0, y1 = _get_valid_range(jdy, sy, ph, h, out_h)
+        if y0 == y1:
+            continue
+        in_y = jdy + sy * y0 - ph
         for i in six.moves.range(kw):
             idx = i * dx
-            i_lim = idx + sx * out_w
-            img[:, :, jdy:j_lim:sy, idx:i_lim:sx] += col[:, :, j, i]
-    return img[:, :, ph:h + ph, pw:w + pw]
+            x0, x1 = _get_valid_range(idx, sx, pw, w, out_w)
+            if x0 == x1:
+                continue
+            in_x = idx + sx * x0 - pw
+            img[:, :, in_y:in_y + sy * (y1 - y0):sy,
+                in_x:in_x + sx * (x1 - x0):sx] += col[:, :, j, i, y0:y1, x0:x1]
+    return img
 
 
 def col2im_gpu(col, sy, sx, ph, pw, h, w, dy=1, dx=1):
@@ -417,6 +417,30 @@ def _create_variable(data, name, grad, requires_grad):
         data, name=name, grad=grad, requires_grad=requires_grad)
 
 
+class _LazyVariableNode(object):
+
+    # Non-data descriptor that creates the node of a variable constructed
+    # without one (see _create_graph_free_variable) on its first access.
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        node = VariableNode(instance, None)
+        instance._node = node
+        return node
+
+
+def _create_graph_free_variable(data):
+    # Creates a variable that does not require grad without creating its
+    # variable node. Used by FunctionNode.apply in the graph-free mode.
+    v = Variable.__new__(Variable)
+    v._data = [data]
+    v._requires_grad = False
+    v._grad_var = None
+    v._loss_scale = None
+    return v
+
+
 class Variable(object):
 
     """__init__(data=None, *, name=None, grad=None, requires_grad=True)
@@ -493,6 +517,8 @@ Actual: {0}'''.format(type(data))
         self._grad_var = None if grad is None else Variable(grad)
         self._loss_scale = None
 
+    _node = _LazyVariableNode()
+
     def __copy__(self):
         return self._copy_to(Variable())
 
@@ -908,7 +934,7 @@ Actual: {0}'''.format(type(data))
         self._node.set_creator_node(fnode)
 
     def backward(self, retain_grad=False, enable_double_backprop=False,
-                 loss_scale=None):
+                 loss_scale=None, release_retained=False):
         """Runs error backpropagation (a.k.a.\\  backprop) from this variable.
 
         On backprop,
@@ -958,18 +984,30 @@ Actual: {0}'''.format(type(data))
                 computational graph along the backprop. The gradients of
                 parameters are divided by the factor just before the parameters
                 are to be updated.
+            release_retained (bool): If ``True``, the arrays retained by
+                function nodes and variable nodes for backprop (see
+                :meth:`FunctionNode.retain_inputs` and
+                :meth:`FunctionNode.retain_outputs`) are released as soon as
+                no function node remaining in this backprop needs them, which
+                reduces the peak memory consumption during backprop. The
+                computational graph cannot be backpropagated again after that.
+                This option is ignored if ``enable_double_backprop`` is
+                ``True``.
         """
+        release_retained = release_retained and not enable_double_backprop
         with chainer.using_config('enable_backprop', enable_double_backprop):
-            self._backward_main(retain_grad, loss_scale)
+            self._backward_main(retain_grad, loss_scale, release_retained)
 
-    def _backward_main(self, retain_grad, loss_scale):
+    def _backward_main(self, retain_grad, loss_scale, release_retained):
         self._node._check_old_style_gradient()
         if self.creator_node is None:
             return
 
         cand_funcs = []
         seen_set = set()
-        grads = _backprop_utils.GradTable(load_if_new=True)
+        grads = _backprop_utils.GradTable(
+            load_if_new=True,
+            accumulate_inplace=not chainer.config.enable_backprop)
 
         # Initialize error by 1, if this is a loss variable
         if self.data.size == 1 and self._grad_var is None:
@@ -999,9 +1037,13 @@ Actual: {0}'''.format(type(data))
 
         add_cand(self.creator_node)
         leaf_nodes = set()
+        if release_retained:
+            releaser = _backprop_utils.RetainedDataReleaser()
 
         while cand_funcs:
             _, _, func = heapq.heappop(cand_funcs)
+            if release_retained:
+                releaser.release(func.rank)
             inputs = func.inputs
             target_input_indexes = tuple([
                 i for i, x in enumerate(inputs) if x.requires_grad
@@ -1009,6 +1051,8 @@ Actual: {0}'''.format(type(data))
             outputs = [y() for y in func.outputs]  # access via weak ref
             out_grad = tuple([grads.pop(y) for y in outputs])
             if not target_input_indexes:
+                if release_retained:
+                    releaser.add(func)
                 continue
 
             in_data = tuple([x.data for x in inputs])
@@ -1037,11 +1081,15 @@ Actual: {0}'''.format(type(data))
                         x._set_grad_var_if_available(None)
 
                 _backprop_utils.backprop_step(
-                    func, target_input_indexes, out_grad, in_grad)
+                    func, target_input_indexes, out_grad, in_grad, grads)
 
                 for hook in hooks:
                     hook.backward_postprocess(func, in_data, out_grad_data)
 
+            if release_retained:
+                del in_data  # to reduce memory usage
+                releaser.add(func)
+
             for y, gy in six.moves.zip(outputs, out_grad):
                 if y is not None and y is not self.node:
                     y._set_grad_var_if_available(
@@ -1062,6 +1110,9 @@ Actual: {0}'''.format(type(data))
                     add_cand(x.creator_node)
             del gx, in_grad  # to reduce memory usage
 
+        if release_retained:
+            releaser.release()
+
         for x in leaf_nodes:
             x_var = x.get_variable_or_none()
             gx = grads.pop(x)
@@ -1221,6 +1272,7 @@ class Parameter(Variable):
     _grad_initializer = None
     _initial_backend = None
     _initial_device = None
+    _arena = None
 
     def __init__(self, initializer=None, shape=None, name=None):
         if initializer is None:
@@ -1251,19 +1303,25 @@ class Parameter(Variable):
         self.initializer = initializer
 
     def __copy__(self):
-        return self._copy_to(Parameter())
+        param = self._copy_to(Parameter())
+        param._arena = None
+        return param
 
     def __reduce__(self):
         return _recover_parameter, (self.data, self.name, self.grad,
                                     self.initializer, self.update_rule)
 
     def to_cpu(self):
+        if self._arena is not None:
+            self._arena.to_cpu()
         super(Parameter, self).to_cpu()
         if self.data is None:
             self._initial_backend = None
             self._initial_device = None
 
     def to_gpu(self, device=None):
+        if self._arena is not None:
+            self._arena.to_gpu(device)
         super(Parameter, self).to_gpu(device)
         if self.data is None:
             if device is None:
@@ -1272,6 +1330,9 @@ class Parameter(Variable):
             self._initial_device = device
 
     def to_intel64(self):
+        if self._arena is not None:
+            raise RuntimeError(
+                'parameters in an arena cannot be converted to iDeep arrays')
         super(Parameter, self).to_intel64()
         if self.data is None:
             self._initial_backend = 'intel64'
@@ -1288,6 +1349,12 @@ class Parameter(Variable):
             dtype = getattr(self.initializer, 'dtype', None)
             self._grad_initializer = initializers.Zero(dtype)
 
+    def addgrad(self, var):
+        super(Parameter, self).addgrad(var)
+        if self._arena is not None:
+            # Keep the gradient array as a view into the arena
+            self._arena._restore_param(self)
+
     def initialize(self, shape):
         """Initializes the uninitialized variable.
 
@@ -268,6 +268,118 @@ def get_xp(gpu):
         return numpy
 
 
+@testing.parameterize(
+    {'padding': None},
+    {'padding': 0},
+)
+class TestConcatWithBufferPool(unittest.TestCase):
+
+    def setUp(self):
+        self.converter = dataset.ConcatWithBufferPool(n_buffers=2)
+
+    def get_tuples_to_concat(self, xp):
+        return [(xp.random.rand(2, 3), xp.random.rand(3, 4).astype('f'),
+                 i) for i in range(5)]
+
+    def check_concat_tuples(self, tuples, device=None):
+        arrays = self.converter(tuples, device, self.padding)
+        expected = dataset.concat_examples(tuples, padding=self.padding)
+        self.assertEqual(len(arrays), len(expected))
+        for x, y in zip(arrays, expected):
+            self.assertEqual(x.shape, y.shape)
+            self.assertEqual(x.dtype, y.dtype)
+            if device is not None:
+                self.assertIsInstance(x, cuda.ndarray)
+                self.assertEqual(x.device.id, device)
+            numpy.testing.assert_array_equal(
+                cuda.to_cpu(x), cuda.to_cpu(y))
+
+    def test_concat_tuples_cpu(self):
+        self.check_concat_tuples(self.get_tuples_to_concat(numpy))
+
+    @attr.gpu
+    def test_concat_tuples_gpu(self):
+        self.check_concat_tuples(self.get_tuples_to_concat(cuda.cupy))
+
+    @attr.gpu
+    def test_concat_tuples_to_gpu(self):
+        self.check_concat_tuples(
+            self.get_tuples_to_concat(numpy), cuda.Device().id)
+
+    def test_concat_dicts_cpu(self):
+        dicts = [{'x': numpy.random.rand(2, 3), 'y': i} for i in range(5)]
+        arrays = self.converter(dicts, padding=self.padding)
+        expected = dataset.concat_examples(dicts, padding=self.padding)
+        self.assertEqual(sorted(arrays.keys()), ['x', 'y'])
+        for key in arrays:
+            numpy.testing.assert_array_equal(arrays[key], expected[key])
+
+    def test_reuse_buffers(self):
+        batches = [[numpy.random.rand(2, 3) for _ in range(5)]
+                   for _ in range(3)]
+        array0 = self.converter(batches[0], padding=self.padding)
+        array1 = self.converter(batches[1], padding=self.padding)
+        self.assertIsNot(array1, array0)
+        array2 = self.converter(batches[2], padding=self.padding)
+        self.assertIs(array2, array0)
+        numpy.testing.assert_array_equal(
+            array2, numpy.stack(batches[2]))
+
+    def test_reallocate_on_shape_change(self):
+        self.converter.n_buffers = 1
+        array0 = self.converter(
+            [numpy.zeros((2, 3))] * 5, padding=self.padding)
+        array1 = self.converter(
+            [numpy.zeros((2, 3))] * 4, padding=self.padding)
+        self.assertIsNot(array1, array0)
+        self.assertEqual(array1.shape, (4, 2, 3))
+
+    def test_empty_batch(self):
+        with self.assertRaises(ValueError):
+            self.converter([], padding=self.padding)
+
+
+class TestConcatWithBufferPoolPadding(unittest.TestCase):
+
+    def check_concat_arrays_padding(self, xp):
+        converter = dataset.ConcatWithBufferPool(n_buffers=1)
+        arrays = [xp.random.rand(3, 4),
+                  xp.random.rand(2, 5),
+                  xp.random.rand(4, 3)]
+        array = converter(arrays, padding=-1)
+        expected = dataset.concat_examples(arrays, padding=-1)
+        self.assertEqual(type(array), type(arrays[0]))
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(array), cuda.to_cpu(expected))
+
+        # The padding of the previous batch is overwritten.
+        arrays = [xp.random.rand(4, 5) for _ in range(3)]
+        array2 = converter(arrays, padding=-1)
+        self.assertIs(array2, array)
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(array2), cuda.to_cpu(xp.stack(arrays)))
+
+        arrays = [xp.random.rand(3, 5), xp.random.rand(4, 4),
+                  xp.random.rand(2, 2)]
+        array3 = converter(arrays, padding=-1)
+        self.assertIs(array3, array)
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(array3),
+            cuda.to_cpu(dataset.concat_examples(arrays, padding=-1)))
+
+    def test_concat_arrays_padding_cpu(self):
+        self.check_concat_arrays_padding(numpy)
+
+    @attr.gpu
+    def test_concat_arrays_padding_gpu(self):
+        self.check_concat_arrays_padding(cuda.cupy)
+
+    def test_shape_mismatch(self):
+        converter = dataset.ConcatWithBufferPool()
+        with self.assertRaises(ValueError):
+            converter([numpy.zeros((2, 3)), numpy.zeros((3, 2))])
+
+
 @testing.parameterize(
     {'device': None, 'src_gpu': False, 'dst_gpu': False},
     {'device': -1, 'src_gpu': False, 'dst_gpu': False},
@@ -79,4 +79,46 @@ class TestDatasetMixin(unittest.TestCase):
                              ds.values[i * 4096:(i + 1) * 4096])
 
 
+class BatchDataset(SimpleDataset):
+
+    def __init__(self, values):
+        super(BatchDataset, self).__init__(values)
+        self.calls = []
+
+    def get_examples(self, indices):
+        self.calls.append(list(indices))
+        return [self.values[i] * 10 for i in indices]
+
+
+class TestGetExamples(unittest.TestCase):
+
+    def test_default(self):
+        ds = SimpleDataset([1, 2, 3, 4, 5])
+        self.assertEqual(ds.get_examples([4, 0, -1]), [5, 1, 5])
+        self.assertEqual(ds.get_examples(numpy.array([1, 2])), [2, 3])
+        self.assertEqual(ds.get_examples([]), [])
+
+    def test_getitem(self):
+        ds = BatchDataset([1, 2, 3, 4, 5])
+        self.assertEqual(ds[1], 2)
+        self.assertEqual(ds[1:4:2], [20, 40])
+        self.assertEqual(ds[[4, 0]], [50, 10])
+        self.assertEqual(ds.calls, [[1, 3], [4, 0]])
+
+    def test_get_examples_from_dataset(self):
+        ds = BatchDataset([1, 2, 3])
+        self.assertEqual(dataset.get_examples(ds, [2, 1]), [30, 20])
+        self.assertEqual(ds.calls, [[2, 1]])
+        self.assertEqual(dataset.get_examples([1, 2, 3], [2, 1]), [3, 2])
+
+    def test_get_examples_from_array(self):
+        values = numpy.random.rand(4, 3)
+        examples = dataset.get_examples(values, [3, 1])
+        self.assertIsInstance(examples, list)
+        self.assertEqual(len(examples), 2)
+        numpy.testing.assert_array_equal(examples[0], values[3])
+        numpy.testing.assert_array_equal(examples[1], values[1])
+        self.assertEqual(dataset.get_examples(values, []), [])
+
+
 testing.run_module(__name__, __file__)
@@ -61,4 +61,20 @@ class TestConcatenatedDataset(unittest.TestCase):
             np.testing.assert_equal(concatenated, expected)
 
 
+class TestConcatenatedDatasetGetExamples(unittest.TestCase):
+
+    def test_get_examples(self):
+        dataset = ConcatenatedDataset([1, 2], [], np.array([3, 4, 5]), [6])
+        self.assertEqual(dataset.get_examples([5, 0, 3, 2, 0]),
+                         [6, 1, 4, 3, 1])
+        self.assertEqual(dataset.get_examples([]), [])
+
+    def test_get_examples_overrun(self):
+        dataset = ConcatenatedDataset([1, 2], [3])
+        with self.assertRaises(IndexError):
+            dataset.get_examples([0, 3])
+        with self.assertRaises(IndexError):
+            dataset.get_examples([-1])
+
+
 testing.run_module(__name__, __file__)
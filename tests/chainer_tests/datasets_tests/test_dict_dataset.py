@@ -57,4 +57,18 @@ class TestDictDataset(unittest.TestCase):
             dd[3]
 
 
+class TestDictDatasetGetExamples(unittest.TestCase):
+
+    def test_get_examples(self):
+        x = numpy.random.rand(3, 4)
+        y = [1, 2, 3]
+        dd = datasets.DictDataset(x=x, y=y)
+        examples = dd.get_examples(numpy.array([2, 0, 2]))
+        self.assertEqual(len(examples), 3)
+        for example, i in zip(examples, [2, 0, 2]):
+            self.assertEqual(set(example.keys()), {'x', 'y'})
+            numpy.testing.assert_array_equal(example['x'], x[i])
+            self.assertEqual(example['y'], y[i])
+
+
 testing.run_module(__name__, __file__)
@@ -0,0 +1,175 @@
+import os
+import pickle
+import sys
+import unittest
+
+import mock
+import numpy
+
+from chainer import datasets
+from chainer import iterators
+from chainer import testing
+from chainer import utils
+
+
+class MemmapDatasetTestBase(object):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        dirpath = self.tempdir.__enter__()
+        self.path = os.path.join(dirpath, 'dataset')
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def write(self, examples):
+        with datasets.MemmapDatasetWriter(self.path) as writer:
+            for example in examples:
+                writer.write(example)
+        return datasets.MemmapDataset(self.path)
+
+
+class TestMemmapDatasetTuple(MemmapDatasetTestBase, unittest.TestCase):
+
+    def setUp(self):
+        super(TestMemmapDatasetTuple, self).setUp()
+        self.examples = [
+            (numpy.random.rand(2, 3).astype(numpy.float32),
+             numpy.random.rand(numpy.random.randint(1, 5)), i)
+            for i in range(6)]
+        self.dataset = self.write(self.examples)
+
+    def check_example(self, actual, expected):
+        self.assertIsInstance(actual, tuple)
+        self.assertEqual(len(actual), 3)
+        for x, y in zip(actual, expected):
+            numpy.testing.assert_array_equal(x, y)
+        self.assertEqual(actual[0].dtype, numpy.float32)
+
+    def test_len(self):
+        self.assertEqual(len(self.dataset), 6)
+
+    def test_get_example(self):
+        for i, example in enumerate(self.examples):
+            self.check_example(self.dataset[i], example)
+        self.check_example(self.dataset[-1], self.examples[-1])
+
+    def test_index_out_of_bounds(self):
+        with self.assertRaises(IndexError):
+            self.dataset[6]
+        with self.assertRaises(IndexError):
+            self.dataset[[0, 6]]
+
+    def test_slice(self):
+        batch = self.dataset[1:5:2]
+        self.assertIsInstance(batch, list)
+        self.assertEqual(len(batch), 2)
+        self.check_example(batch[0], self.examples[1])
+        self.check_example(batch[1], self.examples[3])
+
+    def test_indices(self):
+        for indices in ([4, 0, -1], numpy.array([4, 0, -1])):
+            batch = self.dataset[indices]
+            self.assertEqual(len(batch), 3)
+            for actual, i in zip(batch, indices):
+                self.check_example(actual, self.examples[i])
+
+    def test_get_batch(self):
+        x, y, t = self.dataset.get_batch([4, 0, -1])
+        numpy.testing.assert_array_equal(
+            x, numpy.stack([self.examples[i][0] for i in (4, 0, -1)]))
+        numpy.testing.assert_array_equal(t, [4, 0, 5])
+        # The field of variable shapes is returned as a list.
+        self.assertEqual(len(y), 3)
+        for actual, i in zip(y, (4, 0, -1)):
+            numpy.testing.assert_array_equal(actual, self.examples[i][1])
+
+    def test_get_batch_slice(self):
+        x, _, t = self.dataset.get_batch(slice(1, 3))
+        self.assertEqual(x.shape, (2, 2, 3))
+        numpy.testing.assert_array_equal(t, [1, 2])
+
+    def test_serial_iterator(self):
+        it = iterators.SerialIterator(self.dataset, 4, shuffle=True)
+        with mock.patch.object(
+                self.dataset, 'get_example',
+                wraps=self.dataset.get_example) as get_example, \
+                mock.patch.object(
+                    self.dataset, '_get_fields',
+                    wraps=self.dataset._get_fields) as get_fields:
+            batch = it.next()
+
+        self.assertEqual(get_example.call_count, 0)
+        self.assertEqual(get_fields.call_count, 1)
+        self.assertEqual(len(batch), 4)
+        for actual, i in zip(batch, it._order):
+            self.check_example(actual, self.examples[i])
+
+    def test_read_only(self):
+        x, _, _ = self.dataset[0]
+        with self.assertRaises(ValueError):
+            x[0, 0] = 0
+
+    def test_pickle(self):
+        dataset = pickle.loads(pickle.dumps(self.dataset))
+        self.check_example(dataset[2], self.examples[2])
+
+
+class TestMemmapDatasetDict(MemmapDatasetTestBase, unittest.TestCase):
+
+    def test_dict(self):
+        examples = [{'x': numpy.full((2,), i, dtype=numpy.int32), 'y': i}
+                    for i in range(3)]
+        dataset = self.write(examples)
+        example = dataset[1]
+        self.assertEqual(sorted(example.keys()), ['x', 'y'])
+        numpy.testing.assert_array_equal(example['x'], [1, 1])
+        self.assertEqual(example['y'], 1)
+        batch = dataset.get_batch([2, 1])
+        numpy.testing.assert_array_equal(batch['x'], [[2, 2], [1, 1]])
+        numpy.testing.assert_array_equal(batch['y'], [2, 1])
+
+
+class TestMemmapDatasetArray(MemmapDatasetTestBase, unittest.TestCase):
+
+    def test_array(self):
+        examples = [numpy.arange(i, i + 3) for i in range(4)]
+        dataset = self.write(examples)
+        numpy.testing.assert_array_equal(dataset[3], [3, 4, 5])
+        numpy.testing.assert_array_equal(
+            dataset.get_batch([0, 1]), [[0, 1, 2], [1, 2, 3]])
+
+    def test_cast(self):
+        dataset = self.write([numpy.float32(1), 2.5])
+        self.assertEqual(dataset[1].dtype, numpy.float32)
+        self.assertEqual(dataset[1], 2.5)
+
+    def test_empty(self):
+        dataset = self.write([])
+        self.assertEqual(len(dataset), 0)
+        self.assertEqual(dataset[:], [])
+
+
+class TestMemmapDatasetWriterInvalid(MemmapDatasetTestBase, unittest.TestCase):
+
+    def test_structure_mismatch(self):
+        with datasets.MemmapDatasetWriter(self.path) as writer:
+            writer.write((1, 2))
+            with self.assertRaises(ValueError):
+                writer.write((1, 2, 3))
+            with self.assertRaises(ValueError):
+                writer.write({'a': 1, 'b': 2})
+
+    def test_object(self):
+        with datasets.MemmapDatasetWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.write(('a', object()))
+
+    def test_not_empty(self):
+        os.makedirs(self.path)
+        open(os.path.join(self.path, 'file'), 'w').close()
+        with self.assertRaises(ValueError):
+            datasets.MemmapDatasetWriter(self.path)
+
+
+testing.run_module(__name__, __file__)
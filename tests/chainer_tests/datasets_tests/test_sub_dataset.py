@@ -1,5 +1,7 @@
 import unittest
 
+import numpy
+
 from chainer import datasets
 from chainer import testing
 
@@ -231,4 +233,26 @@ class TestGetCrossValidationDatasets(unittest.TestCase):
             self.assertEqual(set(te_a), set(te_b))
 
 
+class TestSubDatasetGetExamples(unittest.TestCase):
+
+    def test_get_examples(self):
+        original = [1, 2, 3, 4, 5]
+        subset = datasets.SubDataset(original, 1, 4)
+        self.assertEqual(subset.get_examples([2, 0, -1, -3]), [4, 2, 4, 2])
+        self.assertEqual(subset.get_examples([]), [])
+
+    def test_get_examples_permuted(self):
+        original = numpy.array([1, 2, 3, 4, 5])
+        for order in ([2, 0, 3, 1, 4], numpy.array([2, 0, 3, 1, 4])):
+            subset = datasets.SubDataset(original, 1, 4, order)
+            self.assertEqual(subset.get_examples([2, 0, -1]), [2, 1, 2])
+
+    def test_get_examples_overrun(self):
+        subset = datasets.SubDataset([1, 2, 3, 4, 5], 1, 4)
+        with self.assertRaises(IndexError):
+            subset.get_examples([0, 3])
+        with self.assertRaises(IndexError):
+            subset.get_examples([-4])
+
+
 testing.run_module(__name__, __file__)
@@ -2,14 +2,18 @@
 
 from __future__ import unicode_literals
 
+import io
 import os
 import pickle
+import sys
 import unittest
 
+import numpy
 import six
 
 from chainer import datasets
 from chainer import testing
+from chainer import utils
 
 
 class TestTextDataset(unittest.TestCase):
@@ -148,4 +152,84 @@ class TestTextDataset(unittest.TestCase):
         assert ds2[1] == ('テスト2\n', 'テスト2\n')
 
 
+class TestTextDatasetIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = utils.tempdir()
+        self.dir = self.tempdir.__enter__()
+        self.index_dir = os.path.join(self.dir, 'index')
+
+    def tearDown(self):
+        self.tempdir.__exit__(*sys.exc_info())
+
+    def _write(self, name, data):
+        path = os.path.join(self.dir, name)
+        with io.open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_save_and_load(self):
+        path = self._write('a.txt', b'hello\nworld\n')
+        ds1 = datasets.TextDataset(path, index_dir=self.index_dir)
+        assert len(os.listdir(self.index_dir)) == 1
+        ds2 = datasets.TextDataset(path, index_dir=self.index_dir)
+        assert isinstance(ds2._bounds[0], numpy.memmap)
+        assert len(ds2) == 2
+        assert ds1[1] == ds2[1] == 'world\n'
+
+    def test_modified_file(self):
+        path = self._write('a.txt', b'hello\nworld\n')
+        ds = datasets.TextDataset(path, index_dir=self.index_dir)
+        assert len(ds) == 2
+        ds.close()
+        self._write('a.txt', b'hello\nworld\ntest\n')
+        ds = datasets.TextDataset(path, index_dir=self.index_dir)
+        assert len(ds) == 3
+        assert ds[2] == 'test\n'
+
+    def test_pickle_unpickle(self):
+        path = self._write('a.txt', b'hello\nworld\n')
+        ds1 = datasets.TextDataset(path, index_dir=self.index_dir)
+        state = pickle.dumps(ds1)
+        assert b'world' not in state
+        ds2 = pickle.loads(state)
+        assert isinstance(ds2._bounds[0], numpy.memmap)
+        assert ds2[1] == 'world\n'
+
+    def test_universal_newlines(self):
+        path = self._write('a.txt', b'a\r\nb\rc\nd')
+        ds = datasets.TextDataset(path, encoding='utf-8')
+        assert [ds[i] for i in range(len(ds))] == ['a\n', 'b\n', 'c\n', 'd']
+        ds = datasets.TextDataset(path, encoding='utf-8', newline='\n')
+        assert [ds[i] for i in range(len(ds))] == ['a\r\n', 'b\rc\n', 'd']
+
+    def test_not_scannable_encoding(self):
+        path = self._write('a.txt', 'hello\nworld\n'.encode('utf-16'))
+        ds = datasets.TextDataset(path, encoding='utf-16')
+        assert len(ds) == 2
+        assert ds[1] == 'world\n'
+
+    def test_bom(self):
+        path = self._write('a.txt', b'\xef\xbb\xbfhello\nworld')
+        ds = datasets.TextDataset(path, encoding='utf-8-sig')
+        assert [ds[i] for i in range(len(ds))] == ['hello\n', 'world']
+        with io.open(path, encoding='utf-8-sig') as f:
+            bounds = [0]
+            while f.readline():
+                bounds.append(f.tell())
+        assert list(ds._bounds[0]) == bounds
+
+    def test_bom_only(self):
+        path1 = self._write('a.txt', b'\xef\xbb\xbf')
+        path2 = self._write('b.txt', b'')
+        ds = datasets.TextDataset([path1, path2], encoding='utf-8-sig')
+        assert len(ds) == 0
+
+    def test_line_number_mismatch(self):
+        path1 = self._write('a.txt', b'hello\nworld\n')
+        path2 = self._write('b.txt', b'hello\n')
+        with self.assertRaises(ValueError):
+            datasets.TextDataset([path1, path2])
+
+
 testing.run_module(__name__, __file__)
@@ -45,4 +45,31 @@ class TestTransformDataset(unittest.TestCase):
             td[len(td) + 1]
 
 
+class TestTransformDatasetBatched(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = numpy.random.uniform(size=(5, 3))
+        self.calls = []
+
+        def transform(in_data):
+            self.calls.append(len(in_data))
+            return list(numpy.stack(in_data) * 3)
+        self.transform = transform
+
+    def test_get_examples(self):
+        td = datasets.TransformDataset(
+            self.dataset, self.transform, batched=True)
+        examples = td.get_examples([4, 1])
+        self.assertEqual(self.calls, [2])
+        numpy.testing.assert_array_equal(examples[0], self.dataset[4] * 3)
+        numpy.testing.assert_array_equal(examples[1], self.dataset[1] * 3)
+        numpy.testing.assert_array_equal(td[1:3], self.dataset[1:3] * 3)
+
+    def test_get_example(self):
+        td = datasets.TransformDataset(
+            self.dataset, self.transform, batched=True)
+        numpy.testing.assert_array_equal(td[2], self.dataset[2] * 3)
+        self.assertEqual(self.calls, [1])
+
+
 testing.run_module(__name__, __file__)
@@ -55,4 +55,19 @@ class TestTupleDataset(unittest.TestCase):
             td[3]
 
 
+class TestTupleDatasetGetExamples(unittest.TestCase):
+
+    def test_get_examples(self):
+        x0 = numpy.random.rand(3, 4)
+        x1 = [1, 2, 3]
+        td = datasets.TupleDataset(x0, x1)
+        examples = td.get_examples([2, 0, 2])
+        self.assertEqual(len(examples), 3)
+        for example, i in zip(examples, [2, 0, 2]):
+            self.assertIsInstance(example, tuple)
+            numpy.testing.assert_array_equal(example[0], x0[i])
+            self.assertEqual(example[1], x1[i])
+        self.assertEqual(td.get_examples([]), [])
+
+
 testing.run_module(__name__, __file__)
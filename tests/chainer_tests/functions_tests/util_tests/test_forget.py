@@ -6,6 +6,7 @@ import six
 import chainer
 from chainer import cuda
 from chainer import functions
+from chainer.functions.util import forget
 from chainer import gradient_check
 from chainer import links
 from chainer import testing
@@ -160,4 +161,122 @@ class TestForgetGrad(unittest.TestCase):
         assert isinstance(model.link.b.grad_var, variable.Variable)
 
 
+class TestForgetRandom(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (4, 5)).astype(numpy.float32)
+
+    def check_dropout(self, x_data):
+        x = variable.Variable(x_data)
+        y = functions.forget(functions.dropout, x)
+        y.grad = y.xp.ones_like(y.array)
+        y.backward()
+        # The gradient is computed with the same mask as the forward
+        testing.assert_allclose(x.grad * x_data, y.array)
+
+    def test_dropout_cpu(self):
+        x1 = variable.Variable(self.x)
+        x2 = variable.Variable(self.x)
+        numpy.random.seed(0)
+        y1 = functions.dropout(x1)
+        numpy.random.seed(0)
+        y2 = functions.forget(functions.dropout, x2)
+        state = numpy.random.get_state()
+        y1.grad = numpy.ones_like(y1.array)
+        y1.backward()
+        y2.grad = numpy.ones_like(y2.array)
+        y2.backward()
+
+        testing.assert_allclose(y1.array, y2.array)
+        testing.assert_allclose(x1.grad, x2.grad)
+        # The recomputation does not affect the random number generator
+        numpy.testing.assert_array_equal(
+            numpy.random.get_state()[1], state[1])
+        assert numpy.random.get_state()[2] == state[2]
+        self.check_dropout(self.x)
+
+    @attr.gpu
+    def test_dropout_gpu(self):
+        self.check_dropout(cuda.to_gpu(self.x))
+
+    def test_train(self):
+        x = variable.Variable(self.x)
+        with chainer.using_config('train', False):
+            y = functions.forget(functions.dropout, x)
+        y.grad = numpy.ones_like(y.array)
+        y.backward()
+        testing.assert_allclose(x.grad, numpy.ones_like(self.x))
+
+
+class _RecordingRandomState(object):
+
+    # Minimal stand-in of cupy.random.RandomState counting the draws.
+
+    def __init__(self, seed=0):
+        self._random = numpy.random.RandomState(seed)
+        self.draws = 0
+
+    def randint(self, high):
+        self.draws += 1
+        return self._random.randint(high)
+
+    def rand(self, *shape):
+        self.draws += 1
+        return self._random.rand(*shape)
+
+
+class _FakeRandomModule(object):
+
+    RandomState = _RecordingRandomState
+
+    def __init__(self):
+        self.state = _RecordingRandomState()
+
+    def get_random_state(self):
+        return self.state
+
+    def set_random_state(self, state):
+        self.state = state
+
+
+class _FakeArrayModule(object):
+
+    def __init__(self):
+        self.random = _FakeRandomModule()
+
+
+class TestForgetRandomStateDevice(unittest.TestCase):
+
+    def setUp(self):
+        self.xp = _FakeArrayModule()
+        self.user_state = self.xp.random.state
+
+    def test_no_random_numbers(self):
+        numpy_state = numpy.random.get_state()
+        random_state = forget._RandomState(self.xp)
+        with random_state.record():
+            pass
+        with random_state.replay():
+            pass
+        self.assertIsNone(random_state.seed)
+        self.assertEqual(self.user_state.draws, 0)
+        self.assertIs(self.xp.random.state, self.user_state)
+        numpy.testing.assert_array_equal(
+            numpy.random.get_state()[1], numpy_state[1])
+
+    def test_replay(self):
+        random_state = forget._RandomState(self.xp)
+        with random_state.record():
+            expected = self.xp.random.get_random_state().rand(3)
+        self.assertIs(self.xp.random.state, self.user_state)
+        # Only the seed of the private generator is drawn
+        self.assertEqual(self.user_state.draws, 1)
+
+        with random_state.replay():
+            actual = self.xp.random.get_random_state().rand(3)
+        self.assertIs(self.xp.random.state, self.user_state)
+        self.assertEqual(self.user_state.draws, 1)
+        numpy.testing.assert_array_equal(actual, expected)
+
+
 testing.run_module(__name__, __file__)
@@ -347,6 +347,243 @@ class TestMultiLayerChain(unittest.TestCase):
         assert x_var_static.grad is not None
         chainer.testing.assert_allclose(x_var_dyn.grad, x_var_static.grad)
 
+    def test_schedule_reuses_buffers_cpu(self):
+        # After the first iteration, the forward and backward schedules
+        # should write every result into a preallocated array.
+        x_var = chainer.Variable(self.x)
+        unique_array_ids = None
+        for _ in range(3):
+            y = self.static_chain(x_var)
+            y.grad = self.gy
+            y.backward()
+            schedules = (self.static_chain.static_schedule,
+                         self.static_chain.static_schedule.
+                         backward_schedule_func)
+            for sched in schedules:
+                for sched_info in sched.schedule_info_list:
+                    assert not sched_info.return_hooks
+            ids = [id(ar) for ar in schedules[0].unique_arrays]
+            if unique_array_ids is not None:
+                assert ids == unique_array_ids
+            unique_array_ids = ids
+
+
+class FanOutMLP(chainer.Chain):
+
+    def __init__(self, in_size, n_out):
+        super(FanOutMLP, self).__init__()
+        with self.init_scope():
+            self.l1 = links.Linear(in_size, n_out)
+
+    def __call__(self, x):
+        # The gradients w.r.t. h from both branches must be accumulated.
+        h = self.l1(x)
+        return F.relu(h) + F.tanh(h)
+
+
+class StaticFanOutMLP(FanOutMLP):
+
+    @static_graph
+    def __call__(self, x):
+        h = self.l1(x)
+        return F.relu(h) + F.tanh(h)
+
+
+class TestFanOutChain(unittest.TestCase):
+
+    def setUp(self):
+        self.dynamic_chain = FanOutMLP(3, 4)
+        self.static_chain = StaticFanOutMLP(3, 4)
+        self.static_chain.l1.W.data[...] = self.dynamic_chain.l1.W.data
+        self.static_chain.l1.b.data[...] = self.dynamic_chain.l1.b.data
+
+    def test_backward_cpu(self):
+        for _ in range(3):
+            x = numpy.random.uniform(-1, 1, (2, 3)).astype(numpy.float32)
+            gy = numpy.random.uniform(-1, 1, (2, 4)).astype(numpy.float32)
+            grads = []
+            for chain in (self.dynamic_chain, self.static_chain):
+                x_var = chainer.Variable(x.copy())
+                chain.cleargrads()
+                y = chain(x_var)
+                y.grad = gy.copy()
+                y.backward()
+                grads.append((x_var.grad, chain.l1.W.grad))
+            chainer.testing.assert_allclose(grads[0][0], grads[1][0])
+            chainer.testing.assert_allclose(grads[0][1], grads[1][1])
+
+
+class DeepStaticMLP(chainer.Chain):
+
+    def __init__(self, n_units, n_out, share_buffers):
+        super(DeepStaticMLP, self).__init__()
+        with self.init_scope():
+            self.l1 = L.Linear(None, n_units)
+            self.l2 = L.Linear(None, n_units)
+            self.l3 = L.Linear(None, n_units)
+            self.l4 = L.Linear(None, n_out)
+        self.share_buffers = share_buffers
+
+    def __call__(self, x):
+        if self.share_buffers:
+            return self.shared_call(x)
+        else:
+            return self.unshared_call(x)
+
+    def forward(self, x):
+        h = F.relu(self.l1(x))
+        h = F.relu(self.l2(h))
+        h = F.relu(self.l3(h))
+        return self.l4(h)
+
+    @static_graph
+    def shared_call(self, x):
+        return self.forward(x)
+
+    @static_graph(share_buffers=False)
+    def unshared_call(self, x):
+        return self.forward(x)
+
+
+class TestBufferSharing(unittest.TestCase):
+
+    def setUp(self):
+        self.shared_chain = DeepStaticMLP(5, 6, True)
+        self.unshared_chain = DeepStaticMLP(5, 6, False)
+        x = numpy.random.uniform(size=(4, 3)).astype(numpy.float32)
+        for chain in (self.shared_chain, self.unshared_chain):
+            # Initialize the parameters without a backward pass.
+            chain(x)
+            chain.schedule_manager.end_forward()
+        self.unshared_chain.copyparams(self.shared_chain)
+
+    def run_iteration(self, chain, x, gy):
+        x_var = chainer.Variable(x.copy())
+        chain.cleargrads()
+        y = chain(x_var)
+        y.grad = gy.copy()
+        y.backward()
+        return y.data, x_var.grad, chain.l1.W.grad, chain.l4.b.grad
+
+    def test_same_results_cpu(self):
+        for _ in range(3):
+            x = numpy.random.uniform(size=(4, 3)).astype(numpy.float32)
+            gy = numpy.random.uniform(size=(4, 6)).astype(numpy.float32)
+            expected = self.run_iteration(self.unshared_chain, x, gy)
+            actual = self.run_iteration(self.shared_chain, x, gy)
+            for e, a in zip(expected, actual):
+                chainer.testing.assert_allclose(e, a)
+
+    def test_buffer_stats(self):
+        x = numpy.random.uniform(size=(4, 3)).astype(numpy.float32)
+        gy = numpy.random.uniform(size=(4, 6)).astype(numpy.float32)
+        self.run_iteration(self.shared_chain, x, gy)
+        self.run_iteration(self.unshared_chain, x, gy)
+
+        stats = self.shared_chain.schedule_manager.buffer_stats
+        assert stats['num_buffers'] < stats['num_arrays']
+        assert stats['peak_memory'] < stats['peak_memory_unshared']
+
+        stats = self.unshared_chain.schedule_manager.buffer_stats
+        assert stats['num_arrays'] == 0
+        assert stats['num_buffers'] == 0
+
+
+class ReshapeStaticMLP(DeepStaticMLP):
+
+    def forward(self, x):
+        # The reshaped array is a view of the output of l2, which must not
+        # be overwritten by the output of l3 while the view is in use.
+        h = F.relu(self.l1(x))
+        v = F.reshape(self.l2(h), (len(x), 1, -1))
+        h = self.l3(h)
+        return self.l4(F.reshape(v, (len(x), -1)) + h)
+
+
+class TestBufferSharingWithViews(TestBufferSharing):
+
+    def setUp(self):
+        self.shared_chain = ReshapeStaticMLP(5, 6, True)
+        self.unshared_chain = ReshapeStaticMLP(5, 6, False)
+        x = numpy.random.uniform(size=(4, 3)).astype(numpy.float32)
+        for chain in (self.shared_chain, self.unshared_chain):
+            chain(x)
+            chain.schedule_manager.end_forward()
+        self.unshared_chain.copyparams(self.shared_chain)
+
+
+class StaticCNN(chainer.Chain):
+
+    def __init__(self, share_buffers):
+        super(StaticCNN, self).__init__()
+        with self.init_scope():
+            self.conv1 = L.Convolution2D(None, 4, 3, pad=1)
+            self.bn1 = L.BatchNormalization(4)
+            self.conv2 = L.Convolution2D(None, 4, 3, pad=1)
+            self.bn2 = L.BatchNormalization(4)
+            self.fc = L.Linear(None, 3)
+        self.share_buffers = share_buffers
+
+    def __call__(self, x):
+        if self.share_buffers:
+            return self.shared_call(x)
+        else:
+            return self.unshared_call(x)
+
+    def forward(self, x):
+        h = F.relu(self.bn1(self.conv1(x)))
+        h = F.max_pooling_2d(h, 2)
+        h = F.relu(self.bn2(self.conv2(h)))
+        h = F.max_pooling_2d(h, 2)
+        h = F.reshape(h, (len(x), -1))
+        return self.fc(h)
+
+    @static_graph
+    def shared_call(self, x):
+        return self.forward(x)
+
+    @static_graph(share_buffers=False)
+    def unshared_call(self, x):
+        return self.forward(x)
+
+
+class TestBufferSharingCNN(unittest.TestCase):
+
+    def setUp(self):
+        self.shared_chain = StaticCNN(True)
+        self.unshared_chain = StaticCNN(False)
+        self.x_shape = (2, 3, 8, 8)
+        x = numpy.random.uniform(size=self.x_shape).astype(numpy.float32)
+        for chain in (self.shared_chain, self.unshared_chain):
+            chain(x)
+            chain.schedule_manager.end_forward()
+        self.unshared_chain.copyparams(self.shared_chain)
+
+    def run_iteration(self, chain, x, gy):
+        x_var = chainer.Variable(x.copy())
+        chain.cleargrads()
+        y = chain(x_var)
+        y.grad = gy.copy()
+        y.backward()
+        return (y.data, x_var.grad, chain.conv1.W.grad, chain.bn1.gamma.grad,
+                chain.bn2.avg_mean.copy(), chain.fc.W.grad)
+
+    def test_same_results_cpu(self):
+        for _ in range(3):
+            x = numpy.random.uniform(size=self.x_shape).astype(numpy.float32)
+            gy = numpy.random.uniform(size=(2, 3)).astype(numpy.float32)
+            expected = self.run_iteration(self.unshared_chain, x, gy)
+            actual = self.run_iteration(self.shared_chain, x, gy)
+            for e, a in zip(expected, actual):
+                chainer.testing.assert_allclose(e, a, atol=1e-4, rtol=1e-4)
+
+    def test_schedule_reuses_buffers_cpu(self):
+        x = numpy.random.uniform(size=self.x_shape).astype(numpy.float32)
+        gy = numpy.random.uniform(size=(2, 3)).astype(numpy.float32)
+        self.run_iteration(self.shared_chain, x, gy)
+        stats = self.shared_chain.schedule_manager.buffer_stats
+        assert stats['num_buffers'] < stats['num_arrays']
+
 
 testing.run_module(__name__, __file__)
 
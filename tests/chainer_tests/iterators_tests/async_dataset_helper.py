@@ -0,0 +1,34 @@
+import asyncio
+
+from chainer import testing
+
+
+class AsyncDataset(object):
+
+    """Dataset whose examples are read by a coroutine.
+
+    It records the maximum number of examples read concurrently.
+
+    """
+
+    def __init__(self, values, delay=0.001):
+        self.values = values
+        self.delay = delay
+        self.n_reading = 0
+        self.max_reading = 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        raise RuntimeError('__getitem__ must not be called')
+
+    async def get_example(self, index):
+        self.n_reading += 1
+        self.max_reading = max(self.max_reading, self.n_reading)
+        await asyncio.sleep(self.delay)
+        self.n_reading -= 1
+        return self.values[index]
+
+
+testing.run_module(__name__, __file__)
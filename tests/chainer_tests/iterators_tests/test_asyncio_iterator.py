@@ -0,0 +1,167 @@
+from __future__ import division
+import sys
+import unittest
+
+import numpy
+
+from chainer import iterators
+from chainer import serializer
+from chainer import testing
+
+if sys.version_info >= (3, 5):
+    from chainer_tests.iterators_tests import async_dataset_helper
+
+
+class DummySerializer(serializer.Serializer):
+
+    def __init__(self, target):
+        super(DummySerializer, self).__init__()
+        self.target = target
+
+    def __getitem__(self, key):
+        raise NotImplementedError
+
+    def __call__(self, key, value):
+        self.target[key] = value
+        return self.target[key]
+
+
+class DummyDeserializer(serializer.Deserializer):
+
+    def __init__(self, target):
+        super(DummyDeserializer, self).__init__()
+        self.target = target
+
+    def __getitem__(self, key):
+        raise NotImplementedError
+
+    def __call__(self, key, value):
+        if value is None:
+            value = self.target[key]
+        elif isinstance(value, numpy.ndarray):
+            numpy.copyto(value, self.target[key])
+        else:
+            value = type(value)(numpy.asarray(self.target[key]))
+        return value
+
+
+def _reverse_order_sampler(order, current_position):
+    return order[::-1].copy()
+
+
+@testing.parameterize(*testing.product({
+    'n_in_flight': [None, 1, 5],
+    'options': [
+        {'shuffle': False},
+        {'order_sampler': _reverse_order_sampler},
+    ],
+}))
+@unittest.skipUnless(sys.version_info >= (3, 4), 'requires asyncio')
+class TestAsyncioIterator(unittest.TestCase):
+
+    def check_same_as_serial(self, dataset, batch_size, repeat, n):
+        it = iterators.AsyncioIterator(
+            dataset, batch_size, repeat=repeat, n_in_flight=self.n_in_flight,
+            **self.options)
+        expected = iterators.SerialIterator(
+            dataset, batch_size, repeat=repeat, **self.options)
+        for _ in range(n):
+            self.assertEqual(it.next(), expected.next())
+            self.assertEqual(it.epoch, expected.epoch)
+            self.assertEqual(it.is_new_epoch, expected.is_new_epoch)
+            self.assertAlmostEqual(it.epoch_detail, expected.epoch_detail)
+            self.assertEqual(it.previous_epoch_detail,
+                             expected.previous_epoch_detail)
+        if not repeat:
+            self.assertRaises(StopIteration, it.next)
+        it.finalize()
+
+    def test_iterator_repeat(self):
+        self.check_same_as_serial(list(range(6)), 2, True, 10)
+
+    def test_iterator_repeat_not_even(self):
+        self.check_same_as_serial(list(range(7)), 3, True, 10)
+
+    def test_iterator_not_repeat(self):
+        self.check_same_as_serial(list(range(6)), 2, False, 3)
+
+    def test_iterator_not_repeat_not_even(self):
+        self.check_same_as_serial(list(range(7)), 3, False, 3)
+
+    def test_iterator_serialize(self):
+        dataset = list(range(10))
+        it = iterators.AsyncioIterator(
+            dataset, 3, n_in_flight=self.n_in_flight, **self.options)
+        for _ in range(4):
+            it.next()
+        target = {}
+        it.serialize(DummySerializer(target))
+        expected = [it.next() for _ in range(5)]
+        it.finalize()
+
+        it = iterators.AsyncioIterator(
+            dataset, 3, n_in_flight=self.n_in_flight, **self.options)
+        it.next()  # read the examples in advance
+        it.serialize(DummyDeserializer(target))
+        self.assertEqual(it.epoch, 1)
+        self.assertAlmostEqual(it.epoch_detail, 1.2)
+        self.assertAlmostEqual(it.previous_epoch_detail, 0.9)
+        self.assertEqual([it.next() for _ in range(5)], expected)
+        it.finalize()
+
+    def test_reset(self):
+        dataset = list(range(4))
+        it = iterators.AsyncioIterator(
+            dataset, 2, repeat=False, n_in_flight=self.n_in_flight,
+            **self.options)
+        first = [it.next(), it.next()]
+        self.assertRaises(StopIteration, it.next)
+        for _ in range(3):
+            it.reset()
+            self.assertEqual(it.epoch_detail, 0)
+            self.assertEqual([it.next(), it.next()], first)
+            self.assertRaises(StopIteration, it.next)
+        it.finalize()
+
+
+class _FailingDataset(object):
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        if index == 2:
+            raise ValueError('failed to read')
+        return index
+
+
+@unittest.skipUnless(sys.version_info >= (3, 4), 'requires asyncio')
+class TestAsyncioIteratorError(unittest.TestCase):
+
+    def test_error_in_read(self):
+        it = iterators.AsyncioIterator(_FailingDataset(), 2, shuffle=False)
+        self.assertEqual(it.next(), [0, 1])
+        with self.assertRaises(ValueError):
+            it.next()
+        it.finalize()
+
+
+@testing.parameterize(*testing.product({
+    'n_in_flight': [1, 3, 8],
+}))
+@unittest.skipUnless(sys.version_info >= (3, 5), 'requires async def')
+class TestAsyncioIteratorCoroutine(unittest.TestCase):
+
+    def test_get_example(self):
+        dataset = async_dataset_helper.AsyncDataset(list(range(10)))
+        with iterators.AsyncioIterator(
+                dataset, 4, shuffle=False,
+                n_in_flight=self.n_in_flight) as it:
+            batches = [it.next() for _ in range(5)]
+        self.assertEqual(sum(batches, []), list(range(10)) * 2)
+        self.assertLessEqual(dataset.max_reading, self.n_in_flight)
+        if self.n_in_flight > 1:
+            self.assertGreater(dataset.max_reading, 1)
+
+
+testing.run_module(__name__, __file__)
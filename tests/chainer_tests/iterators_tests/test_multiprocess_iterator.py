@@ -545,6 +545,100 @@ class TestMultiprocessIteratorInvalidOrderSampler(unittest.TestCase):
             it.next()
 
 
+@testing.parameterize(*testing.product({
+    'n_prefetch': [1, 2],
+    'maxtasksperchild': [None, 1],
+}))
+class TestMultiprocessIteratorCollate(unittest.TestCase):
+
+    def setUp(self):
+        self.options = {'n_processes': 2,
+                        'n_prefetch': self.n_prefetch,
+                        'maxtasksperchild': self.maxtasksperchild,
+                        'collate': True}
+
+    def test_iterator_array_type(self):
+        dataset = [numpy.random.rand(3, 2).astype('f') for _ in range(6)]
+        it = iterators.MultiprocessIterator(
+            dataset, 2, shuffle=False, **self.options)
+        for i in range(3):
+            batch = it.next()
+            self.assertIsInstance(batch, numpy.ndarray)
+            self.assertEqual(batch.shape, (2, 3, 2))
+            self.assertEqual(batch.dtype, numpy.float32)
+            numpy.testing.assert_array_equal(
+                batch, numpy.stack(dataset[2 * i:2 * i + 2]))
+        it.finalize()
+
+    def test_iterator_tuple_type(self):
+        dataset = [(numpy.random.rand(3).astype('f'), i)
+                   for i in range(6)]
+        it = iterators.MultiprocessIterator(
+            dataset, 3, shuffle=False, **self.options)
+        for _ in range(2):
+            for i in range(2):
+                x, t = it.next()
+                numpy.testing.assert_array_equal(
+                    x, numpy.stack([d[0] for d in dataset[3 * i:3 * i + 3]]))
+                numpy.testing.assert_array_equal(
+                    t, numpy.arange(3 * i, 3 * i + 3))
+        it.finalize()
+
+    def test_iterator_dict_type(self):
+        dataset = [{'x': numpy.full((2,), i, 'f'), 'y': i * 2}
+                   for i in range(6)]
+        it = iterators.MultiprocessIterator(
+            dataset, 2, shuffle=False, **self.options)
+        for i in range(3):
+            batch = it.next()
+            self.assertEqual(sorted(batch.keys()), ['x', 'y'])
+            numpy.testing.assert_array_equal(
+                batch['x'][:, 0], [2 * i, 2 * i + 1])
+            numpy.testing.assert_array_equal(
+                batch['y'], [4 * i, 4 * i + 2])
+        it.finalize()
+
+    def test_iterator_shuffle(self):
+        dataset = list(range(10))
+        it = iterators.MultiprocessIterator(dataset, 5, **self.options)
+        for _ in range(3):
+            batches = [it.next().copy() for _ in range(2)]
+            self.assertEqual(
+                sorted(numpy.concatenate(batches).tolist()), dataset)
+        it.finalize()
+
+    def test_iterator_not_repeat_not_even(self):
+        dataset = numpy.arange(5, dtype='i')
+        it = iterators.MultiprocessIterator(
+            dataset, 2, repeat=False, shuffle=False, **self.options)
+        numpy.testing.assert_array_equal(it.next(), [0, 1])
+        numpy.testing.assert_array_equal(it.next(), [2, 3])
+        numpy.testing.assert_array_equal(it.next(), [4])
+        self.assertRaises(StopIteration, it.next)
+        it.finalize()
+
+    def test_reset(self):
+        dataset = numpy.arange(4, dtype='i')
+        it = iterators.MultiprocessIterator(
+            dataset, 2, repeat=False, shuffle=False, **self.options)
+        for _ in range(3):
+            numpy.testing.assert_array_equal(it.next(), [0, 1])
+            numpy.testing.assert_array_equal(it.next(), [2, 3])
+            self.assertRaises(StopIteration, it.next)
+            it.reset()
+        it.finalize()
+
+    def test_invalid_shape(self):
+        dataset = [numpy.zeros(2, 'f'), numpy.zeros(2, 'f'),
+                   numpy.zeros(3, 'f'), numpy.zeros(2, 'f')]
+        it = iterators.MultiprocessIterator(
+            dataset, 2, shuffle=False, **self.options)
+        it.next()
+        with self.assertRaises(ValueError):
+            it.next()
+        it.finalize()
+
+
 class TestMultiprocessIteratorConcurrency(unittest.TestCase):
 
     def test_finalize_not_deadlock(self):
@@ -562,6 +656,70 @@ class TestMultiprocessIteratorConcurrency(unittest.TestCase):
         self.assertFalse(deadlock)
 
 
+@testing.parameterize(*testing.product({
+    'shared_mem': [None, 16],
+    'maxtasksperchild': [None, 1],
+}))
+class TestMultiprocessIteratorVariableSize(unittest.TestCase):
+
+    def test_iterator_grows_shared_memory(self):
+        dataset = [(numpy.full(10 ** (i % 4), i, 'f'),
+                    {'x': numpy.arange(i, dtype='i')})
+                   for i in range(12)]
+        it = iterators.MultiprocessIterator(
+            dataset, 4, shuffle=False, n_processes=2,
+            shared_mem=self.shared_mem,
+            maxtasksperchild=self.maxtasksperchild)
+        for _ in range(2):
+            for i in range(3):
+                batch = it.next()
+                for (a, b), (c, d) in zip(batch, dataset[4 * i:4 * i + 4]):
+                    numpy.testing.assert_array_equal(a, c)
+                    numpy.testing.assert_array_equal(b['x'], d['x'])
+        shared_memory = it._prefetch_loop.shared_memory
+        path = shared_memory.path
+        self.assertTrue(os.path.isdir(path))
+        it.finalize()
+        self.assertFalse(os.path.exists(path))
+
+
+class SlowDataset(object):
+
+    def __len__(self):
+        return 20
+
+    def __getitem__(self, i):
+        time.sleep(0.01)
+        return i
+
+
+@testing.parameterize(*testing.product({
+    'n_prefetch': [1, 3],
+    'collate': [False, True],
+}))
+class TestMultiprocessIteratorPrefetchStats(unittest.TestCase):
+
+    def test_prefetch_stats(self):
+        it = iterators.MultiprocessIterator(
+            SlowDataset(), 4, shuffle=False, n_processes=2,
+            n_prefetch=self.n_prefetch, collate=self.collate)
+        stats = it.prefetch_stats
+        self.assertEqual(stats['n_batches'], 0)
+        self.assertEqual(stats['queue_occupancy'], 0)
+
+        for i in range(12):
+            start = i % 5 * 4
+            self.assertEqual(list(it.next()), list(range(start, start + 4)))
+        stats = it.prefetch_stats
+        it.finalize()
+        self.assertEqual(stats['n_batches'], 12)
+        self.assertGreater(stats['n_waits'], 0)
+        self.assertLessEqual(stats['n_waits'], 12)
+        self.assertGreater(stats['wait_time'], 0)
+        self.assertGreaterEqual(stats['queue_occupancy'], 0)
+        self.assertLessEqual(stats['queue_occupancy'], self.n_prefetch)
+
+
 class TestMultiprocessIteratorDeterminancy(unittest.TestCase):
 
     def setUp(self):
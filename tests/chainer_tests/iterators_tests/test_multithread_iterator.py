@@ -5,6 +5,7 @@ import unittest
 import numpy
 import six
 
+from chainer import dataset
 from chainer import iterators
 from chainer import serializer
 from chainer import testing
@@ -422,4 +423,30 @@ class TestMultithreadIteratorInvalidOrderSampler(unittest.TestCase):
             it.next()
 
 
+class BatchDataset(dataset.DatasetMixin):
+
+    def __init__(self, n):
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def get_example(self, i):
+        raise AssertionError('get_example must not be called')
+
+    def get_examples(self, indices):
+        return [(i, len(indices)) for i in indices]
+
+
+class TestMultithreadIteratorGetExamples(unittest.TestCase):
+
+    def test_get_examples(self):
+        it = iterators.MultithreadIterator(
+            BatchDataset(10), 5, n_threads=2, shuffle=False)
+        batch = it.next()
+        it.finalize()
+        # Each thread reads a chunk of the batch.
+        self.assertEqual(batch, [(0, 3), (1, 3), (2, 3), (3, 2), (4, 2)])
+
+
 testing.run_module(__name__, __file__)
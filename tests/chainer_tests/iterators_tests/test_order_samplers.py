@@ -0,0 +1,114 @@
+from __future__ import division
+import unittest
+
+import numpy
+
+from chainer import iterators
+from chainer import serializers
+from chainer import testing
+
+
+@testing.parameterize(*testing.product({
+    'n': [10, 16],
+    'batch_size': [1, 3, 4],
+    'batches_per_bucket': [1, 2],
+}))
+class TestBucketOrderSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.lengths = numpy.random.randint(1, 10, size=self.n)
+        self.sampler = iterators.BucketOrderSampler(
+            self.batch_size, self.lengths,
+            batches_per_bucket=self.batches_per_bucket)
+
+    def test_permutation(self):
+        order = self.sampler(numpy.arange(self.n), 0)
+        self.assertEqual(sorted(order), list(range(self.n)))
+
+    def test_iterate(self):
+        it = iterators.SerialIterator(
+            list(range(self.n)), self.batch_size,
+            order_sampler=self.sampler)
+        for epoch in range(3):
+            padding_ratio = self.sampler.padding_ratio
+            batches = []
+            while True:
+                batches.append(it.next())
+                if it.is_new_epoch:
+                    break
+            if epoch == 0:
+                # Examples in the first epoch are all distinct.
+                seen = sum(batches, [])[:self.n]
+                self.assertEqual(sorted(seen), list(range(self.n)))
+            if it.current_position > 0:
+                # The last batch is filled with the examples of the next
+                # epoch.
+                batches = batches[:-1]
+
+            # The batches sampled in an epoch are aligned to the ones
+            # the iterator returns.
+            lengths = self.lengths[numpy.array(batches)]
+            padded = lengths.max(axis=1).sum() * self.batch_size
+            self.assertAlmostEqual(
+                padding_ratio, 1 - lengths.sum() / padded)
+
+
+class TestBucketOrderSamplerPaddingRatio(unittest.TestCase):
+
+    def test_padding_ratio(self):
+        sampler = iterators.BucketOrderSampler(
+            2, [1, 2, 3, 4], batches_per_bucket=1)
+        order = sampler(numpy.arange(4), 0)
+        batches = [sorted(order[:2]), sorted(order[2:])]
+        self.assertIn(batches, ([[0, 1], [2, 3]], [[2, 3], [0, 1]]))
+        self.assertAlmostEqual(sampler.padding_ratio, 1 - 10 / 12)
+
+    def test_length_function(self):
+        dataset = [numpy.zeros(i) for i in (3, 1, 2, 1)]
+        sampler = iterators.BucketOrderSampler(
+            2, dataset=dataset, length_function=len, batches_per_bucket=1)
+        order = sampler(numpy.arange(4), 0)
+        batches = [sorted(order[:2]), sorted(order[2:])]
+        self.assertIn(batches, ([[1, 3], [0, 2]], [[0, 2], [1, 3]]))
+        self.assertAlmostEqual(sampler.padding_ratio, 1 / 8)
+
+
+class TestBucketOrderSamplerSerialize(unittest.TestCase):
+
+    def test_resume(self):
+        n, batch_size = 10, 3
+        lengths = numpy.arange(n) // batch_size
+        dataset = list(range(n))
+
+        it = iterators.SerialIterator(
+            dataset, batch_size,
+            order_sampler=iterators.BucketOrderSampler(batch_size, lengths))
+        it.next()
+        target = {}
+        it.serialize(serializers.DictionarySerializer(target))
+        expected = [it.next() for _ in range(2)]
+
+        it = iterators.SerialIterator(
+            dataset, batch_size,
+            order_sampler=iterators.BucketOrderSampler(batch_size, lengths))
+        it.serialize(serializers.NpzDeserializer(target))
+        self.assertEqual([it.next() for _ in range(2)], expected)
+
+
+class TestBucketOrderSamplerInvalid(unittest.TestCase):
+
+    def test_no_lengths(self):
+        with self.assertRaises(ValueError):
+            iterators.BucketOrderSampler(2)
+
+    def test_invalid_lengths(self):
+        with self.assertRaises(ValueError):
+            iterators.BucketOrderSampler(2, numpy.zeros((2, 2)))
+
+    def test_size_mismatch(self):
+        sampler = iterators.BucketOrderSampler(2, [1, 2, 3])
+        with self.assertRaises(ValueError):
+            sampler(numpy.arange(4), 0)
+
+
+testing.run_module(__name__, __file__)
@@ -3,6 +3,7 @@ import unittest
 
 import numpy
 
+from chainer import dataset
 from chainer import iterators
 from chainer import serializer
 from chainer import testing
@@ -418,4 +419,33 @@ class TestSerialIteratorInvalidOrderSampler(unittest.TestCase):
             it.next()
 
 
+class BatchDataset(dataset.DatasetMixin):
+
+    def __init__(self, n):
+        self.n = n
+        self.calls = []
+
+    def __len__(self):
+        return self.n
+
+    def get_example(self, i):
+        raise AssertionError('get_example must not be called')
+
+    def get_examples(self, indices):
+        self.calls.append(list(indices))
+        return list(indices)
+
+
+class TestSerialIteratorGetExamples(unittest.TestCase):
+
+    def test_get_examples(self):
+        ds = BatchDataset(5)
+        it = iterators.SerialIterator(ds, 3)
+        batch1 = it.next()
+        batch2 = it.next()
+        self.assertEqual(sorted(batch1 + batch2[:2]), list(range(5)))
+        # The last batch is read from two epochs.
+        self.assertEqual(ds.calls, [batch1, batch2[:2], batch2[2:]])
+
+
 testing.run_module(__name__, __file__)
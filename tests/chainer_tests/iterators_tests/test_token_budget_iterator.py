@@ -0,0 +1,152 @@
+from __future__ import division
+import unittest
+
+import numpy
+
+from chainer import iterators
+from chainer import serializers
+from chainer import testing
+
+
+class TestTokenBudgetIterator(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = [numpy.zeros(n) for n in (2, 3, 1, 4, 2, 6, 1)]
+
+    def check_batches(self, it, expected):
+        batches = []
+        while True:
+            epoch = it.epoch
+            batches.append(it.next())
+            if it.is_new_epoch:
+                self.assertAlmostEqual(it.epoch_detail, epoch + 1)
+                break
+            self.assertAlmostEqual(
+                it.epoch_detail,
+                epoch + sum(len(batch) for batch in batches) / 7)
+        self.assertEqual([[len(x) for x in batch] for batch in batches],
+                         expected)
+
+    def test_padded(self):
+        it = iterators.TokenBudgetIterator(
+            self.dataset, 12, length_function=len, shuffle=False)
+        self.assertIsNone(it.previous_epoch_detail)
+        self.check_batches(it, [[2, 3, 1], [4, 2], [6, 1]])
+        self.assertEqual(it.epoch, 1)
+        self.assertAlmostEqual(it.epoch_detail, 1)
+        self.assertAlmostEqual(it.previous_epoch_detail, 5 / 7)
+        # The batches do not span two epochs.
+        self.check_batches(it, [[2, 3, 1], [4, 2], [6, 1]])
+        it = iterators.TokenBudgetIterator(
+            self.dataset, 8, length_function=len, shuffle=False)
+        self.check_batches(it, [[2, 3], [1, 4], [2], [6], [1]])
+
+    def test_sum(self):
+        it = iterators.TokenBudgetIterator(
+            self.dataset, 8, length_function=len, shuffle=False,
+            padded=False)
+        self.check_batches(it, [[2, 3, 1], [4, 2], [6, 1]])
+        it = iterators.TokenBudgetIterator(
+            self.dataset, 7, length_function=len, shuffle=False,
+            padded=False)
+        self.check_batches(it, [[2, 3, 1], [4, 2], [6, 1]])
+        it = iterators.TokenBudgetIterator(
+            self.dataset, 5, length_function=len, shuffle=False,
+            padded=False)
+        self.check_batches(it, [[2, 3], [1, 4], [2], [6], [1]])
+
+    def test_example_over_budget(self):
+        it = iterators.TokenBudgetIterator(
+            self.dataset, 3, length_function=len, shuffle=False)
+        self.check_batches(
+            it, [[2], [3], [1], [4], [2], [6], [1]])
+
+    def test_max_batch_size(self):
+        it = iterators.TokenBudgetIterator(
+            self.dataset, 100, length_function=len, shuffle=False,
+            max_batch_size=3)
+        self.check_batches(it, [[2, 3, 1], [4, 2, 6], [1]])
+
+    def test_lengths(self):
+        it = iterators.TokenBudgetIterator(
+            list(range(7)), 12, lengths=[2, 3, 1, 4, 2, 6, 1], shuffle=False)
+        self.assertEqual(it.next(), [0, 1, 2])
+
+    def test_large_batch(self):
+        it = iterators.TokenBudgetIterator(
+            list(range(1000)), 300, lengths=numpy.ones(1000), padded=False)
+        batch = it.next()
+        self.assertEqual(len(batch), 300)
+        self.assertAlmostEqual(it.epoch_detail, 0.3)
+
+    def test_no_repeat(self):
+        it = iterators.TokenBudgetIterator(
+            self.dataset, 8, length_function=len, repeat=False)
+        n = 0
+        for batch in it:
+            n += len(batch)
+        self.assertEqual(n, 7)
+        self.assertRaises(StopIteration, it.next)
+        it.reset()
+        self.assertEqual(sum(len(batch) for batch in it), 7)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            iterators.TokenBudgetIterator(self.dataset, 8)
+        with self.assertRaises(ValueError):
+            iterators.TokenBudgetIterator(self.dataset, 8, lengths=[1, 2])
+
+
+@testing.parameterize(*testing.product({
+    'padded': [True, False],
+    'order_sampler': [
+        None, iterators.BucketOrderSampler(4, numpy.arange(100) % 13 + 1)],
+}))
+class TestTokenBudgetIteratorRandom(unittest.TestCase):
+
+    def setUp(self):
+        self.lengths = numpy.arange(100) % 13 + 1
+        self.dataset = list(range(100))
+
+    def create_iterator(self):
+        return iterators.TokenBudgetIterator(
+            self.dataset, 20, self.lengths, padded=self.padded,
+            order_sampler=self.order_sampler)
+
+    def test_budget(self):
+        it = self.create_iterator()
+        for _ in range(3):
+            seen = []
+            while True:
+                batch = it.next()
+                lengths = self.lengths[batch]
+                if self.padded:
+                    cost = lengths.max() * len(lengths)
+                else:
+                    cost = lengths.sum()
+                self.assertLessEqual(cost, 20)
+                seen.extend(batch)
+                if it.is_new_epoch:
+                    break
+            self.assertEqual(sorted(seen), self.dataset)
+
+    def test_serialize(self):
+        it = self.create_iterator()
+        for _ in range(5):
+            it.next()
+        target = {}
+        it.serialize(serializers.DictionarySerializer(target))
+        expected = []
+        while not it.is_new_epoch:
+            expected.append(it.next())
+
+        it = self.create_iterator()
+        it.serialize(serializers.NpzDeserializer(target))
+        self.assertIsNotNone(it.previous_epoch_detail)
+        actual = []
+        while not it.is_new_epoch:
+            actual.append(it.next())
+        self.assertEqual(actual, expected)
+
+
+testing.run_module(__name__, __file__)
@@ -107,4 +107,39 @@ class TestGradientClipping(unittest.TestCase):
         self.check_clipping(2.0)
 
 
+@testing.parameterize(*testing.product({
+    'flat_buffer': ['arena', 'fused'],
+}))
+class TestGradientClippingFlatBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.target = chainer.ChainList(
+            SimpleLink(np.arange(6, dtype=np.float32).reshape(2, 3),
+                       np.arange(3, -3, -1, dtype=np.float32).reshape(2, 3)),
+            SimpleLink(np.arange(3, dtype=np.float32),
+                       np.arange(3, dtype=np.float32)))
+
+    def check_clipping(self):
+        ws = [np.copy(p.data) for p in self.target.params()]
+        gs = [np.copy(p.grad) for p in self.target.params()]
+        norm = np.sqrt(sum(np.vdot(g, g) for g in gs))
+        threshold = norm * 0.5
+
+        if self.flat_buffer == 'arena':
+            self.target.allocate_arena()
+        opt = optimizers.SGD(lr=1)
+        opt.setup(self.target)
+        if self.flat_buffer == 'fused':
+            opt.use_fused_update()
+        opt.add_hook(optimizer_hooks.GradientClipping(threshold))
+        opt.update()
+
+        self.assertEqual(len(opt.get_param_chunks()), 1)
+        for param, w, g in zip(self.target.params(), ws, gs):
+            testing.assert_allclose(w - g * 0.5, param.data)
+
+    def test_clipping_cpu(self):
+        self.check_clipping()
+
+
 testing.run_module(__name__, __file__)
@@ -21,6 +21,9 @@ class SimpleLink(chainer.Link):
         self.param.grad = g
 
 
+@testing.parameterize(*testing.product({
+    'flat_buffer': [None, 'arena', 'fused'],
+}))
 class TestGradientLARS(unittest.TestCase):
 
     def setUp(self):
@@ -47,15 +50,19 @@ class TestGradientLARS(unittest.TestCase):
         expect0 = w0 - clip_rate * (g0 + weight_decay * w0)
         expect1 = w1 - 1.0 * (g1 + weight_decay * w1)
 
+        if self.flat_buffer == 'arena':
+            self.target.allocate_arena()
         opt = optimizers.SGD(lr=1)
         opt.setup(self.target)
+        if self.flat_buffer == 'fused':
+            opt.use_fused_update()
         opt.add_hook(optimizer_hooks.GradientLARS(threshold=threshold,
                                                   weight_decay=weight_decay,
                                                   eps=eps))
         opt.update()
 
-        testing.assert_allclose(expect0, w0)
-        testing.assert_allclose(expect1, w1)
+        testing.assert_allclose(expect0, self.target[0].param.data)
+        testing.assert_allclose(expect1, self.target[1].param.data)
 
     def test_LARS_cpu(self):
         self.check_LARS()
@@ -66,4 +73,26 @@ class TestGradientLARS(unittest.TestCase):
         self.check_LARS()
 
 
+class TestGradientLARSSegments(unittest.TestCase):
+
+    def _make_chunk(self, sizes):
+        params = [chainer.Parameter(np.ones(size, np.float32))
+                  for size in sizes]
+        n = sum(sizes)
+        return chainer.optimizer.ParameterChunk(
+            np.ones(n, np.float32), np.ones(n, np.float32), params)
+
+    def test_segments_cached_per_layout(self):
+        hook = optimizer_hooks.GradientLARS()
+        chunks = [self._make_chunk([2, 3]), self._make_chunk([4, 1, 2])]
+        hook.call_for_chunks(None, chunks)
+        segments = dict(hook._segments)
+        self.assertEqual(len(segments), 2)
+
+        hook.call_for_chunks(None, chunks)
+        self.assertEqual(len(hook._segments), 2)
+        for key, value in segments.items():
+            self.assertIs(hook._segments[key], value)
+
+
 testing.run_module(__name__, __file__)
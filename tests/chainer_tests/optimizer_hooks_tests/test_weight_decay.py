@@ -50,4 +50,48 @@ class TestWeightDecay(unittest.TestCase):
         self.check_weight_decay()
 
 
+class TestWeightDecayArena(unittest.TestCase):
+
+    def setUp(self):
+        self.target = chainer.ChainList(
+            SimpleLink(np.arange(6, dtype=np.float32).reshape(2, 3),
+                       np.arange(3, -3, -1, dtype=np.float32).reshape(2, 3)),
+            SimpleLink(np.arange(3, dtype=np.float32),
+                       np.ones(3, dtype=np.float32)))
+
+    def test_weight_decay(self):
+        decay = 0.2
+        expects = [p.data - p.grad - decay * p.data
+                   for p in self.target.params()]
+
+        self.target.allocate_arena()
+        opt = optimizers.SGD(lr=1)
+        opt.setup(self.target)
+        opt.add_hook(optimizer_hooks.WeightDecay(decay))
+        opt.update()
+
+        for expect, param in zip(expects, self.target.params()):
+            testing.assert_allclose(expect, param.data)
+
+    def test_override_call(self):
+        class WeightDecayExceptBias(optimizer_hooks.WeightDecay):
+
+            def __call__(self, rule, param):
+                if param.ndim > 1:
+                    super(WeightDecayExceptBias, self).__call__(rule, param)
+
+        decay = 0.2
+        expects = [p.data - p.grad - (decay * p.data if p.ndim > 1 else 0)
+                   for p in self.target.params()]
+
+        self.target.allocate_arena()
+        opt = optimizers.SGD(lr=1)
+        opt.setup(self.target)
+        opt.add_hook(WeightDecayExceptBias(decay))
+        opt.update()
+
+        for expect, param in zip(expects, self.target.params()):
+            testing.assert_allclose(expect, param.data)
+
+
 testing.run_module(__name__, __file__)
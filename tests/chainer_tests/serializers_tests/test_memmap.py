@@ -0,0 +1,180 @@
+import os
+import tempfile
+import unittest
+
+import numpy
+import six
+
+from chainer.backends import cuda
+from chainer import link
+from chainer import links
+from chainer import optimizers
+from chainer.serializers import memmap
+from chainer import testing
+from chainer.testing import attr
+
+
+def _make_model():
+    model = link.Chain()
+    with model.init_scope():
+        model.linear = links.Linear(3, 2)
+        model.bn = links.BatchNormalization(2)
+    return model
+
+
+class TestSaveLoadMmap(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.file = tempfile.mkstemp()
+        os.close(fd)
+
+        self.source = _make_model()
+        self.source.bn.avg_mean[:] = numpy.arange(2)
+        memmap.save_mmap(self.file, self.source)
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def check_equal(self, model):
+        numpy.testing.assert_array_equal(
+            model.linear.W.array, self.source.linear.W.array)
+        numpy.testing.assert_array_equal(
+            model.linear.b.array, self.source.linear.b.array)
+        numpy.testing.assert_array_equal(
+            model.bn.avg_mean, self.source.bn.avg_mean)
+        self.assertEqual(model.bn.N, self.source.bn.N)
+
+    def test_aligned(self):
+        d = memmap.MmapDeserializer(self.file)
+        for key, array in six.iteritems(d.arrays):
+            if array is not None and array.size:
+                self.assertEqual(
+                    array.__array_interface__['data'][0] % 4096, 0)
+
+    def test_load_read_only(self):
+        model = _make_model()
+        memmap.load_mmap(self.file, model)
+
+        self.check_equal(model)
+        self.assertFalse(model.linear.W.array.flags.writeable)
+        self.assertFalse(model.bn.avg_mean.flags.writeable)
+
+    def test_load_copy_on_write(self):
+        model = _make_model()
+        memmap.load_mmap(self.file, model, mmap_mode='c')
+
+        self.check_equal(model)
+        model.linear.W.array[:] = 0
+        other = _make_model()
+        memmap.load_mmap(self.file, other)
+        numpy.testing.assert_array_equal(
+            other.linear.W.array, self.source.linear.W.array)
+
+    def test_load_copy(self):
+        model = _make_model()
+        W = model.linear.W.array
+        memmap.load_mmap(self.file, model, mmap_mode=None)
+
+        self.check_equal(model)
+        self.assertIs(model.linear.W.array, W)
+
+    def test_load_uninitialized(self):
+        model = link.Chain()
+        with model.init_scope():
+            model.linear = links.Linear(None, 2)
+            model.bn = links.BatchNormalization(2)
+        memmap.load_mmap(self.file, model)
+
+        self.check_equal(model)
+
+    def test_load_different_dtype(self):
+        model = _make_model()
+        model.linear.W.array = model.linear.W.array.astype(numpy.float64)
+        W = model.linear.W.array
+        memmap.load_mmap(self.file, model)
+
+        self.assertIs(model.linear.W.array, W)
+        numpy.testing.assert_array_equal(W, self.source.linear.W.array)
+
+    def test_load_with_path(self):
+        target = links.Linear(3, 2)
+        memmap.load_mmap(self.file, target, 'linear/')
+        numpy.testing.assert_array_equal(
+            target.W.array, self.source.linear.W.array)
+
+    def test_load_with_strict(self):
+        model = _make_model()
+        with model.init_scope():
+            model.other = links.Linear(3, 2)
+        with self.assertRaises(KeyError):
+            memmap.load_mmap(self.file, model)
+
+    def test_load_without_strict(self):
+        model = _make_model()
+        with model.init_scope():
+            model.other = links.Linear(3, 2)
+        memmap.load_mmap(self.file, model, strict=False)
+        self.check_equal(model)
+
+    def test_load_ignore_names(self):
+        model = _make_model()
+        b = model.linear.b.array.copy()
+        memmap.load_mmap(self.file, model, ignore_names='linear/b')
+        numpy.testing.assert_array_equal(model.linear.b.array, b)
+
+    @attr.gpu
+    def test_load_gpu(self):
+        model = _make_model()
+        model.to_gpu()
+        memmap.load_mmap(self.file, model)
+
+        self.assertIsInstance(model.linear.W.array, cuda.ndarray)
+        model.to_cpu()
+        self.check_equal(model)
+
+    def test_invalid_mmap_mode(self):
+        with self.assertRaises(ValueError):
+            memmap.load_mmap(self.file, _make_model(), mmap_mode='w+')
+
+    def test_invalid_file(self):
+        with open(self.file, 'wb') as f:
+            f.write(b'invalid file')
+        with self.assertRaises(ValueError):
+            memmap.load_mmap(self.file, _make_model())
+
+
+class TestSaveLoadMmapOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.file = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def test_optimizer(self):
+        model = _make_model()
+        optimizer = optimizers.Adam()
+        optimizer.setup(model)
+        model.cleargrads()
+        for param in model.params():
+            param.grad = numpy.ones_like(param.array)
+        optimizer.update()
+        memmap.save_mmap(self.file, optimizer)
+
+        target = optimizers.Adam()
+        target.setup(_make_model())
+        memmap.load_mmap(self.file, target, mmap_mode=None)
+        self.assertEqual(target.t, 1)
+        numpy.testing.assert_array_equal(
+            target.target.linear.W.update_rule.state['m'],
+            model.linear.W.update_rule.state['m'])
+
+    def test_objects(self):
+        obj = link.Link()
+        obj.add_persistent('x', {'a': 1})
+        with self.assertRaises(ValueError):
+            memmap.save_mmap(self.file, obj)
+
+
+testing.run_module(__name__, __file__)
@@ -1,4 +1,5 @@
 import os
+import shutil
 import tempfile
 import unittest
 
@@ -629,4 +630,103 @@ class TestGroupHierachy(unittest.TestCase):
         self.assertFalse(hasattr(self.parent.child.linear, 'b'))
 
 
+@testing.parameterize(*testing.product({
+    'compress': [False, True],
+    'n_threads': [1, 2],
+}))
+class TestNpzSharded(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.dir = os.path.join(self.root, 'checkpoint')
+        child = link.Chain()
+        with child.init_scope():
+            child.child_linear = links.Linear(2, 3)
+        parent = link.Chain()
+        with parent.init_scope():
+            parent.parent_linear = links.Linear(3, 2)
+            parent.child = child
+        # Each array is written to a shard of its own.
+        npz.save_npz_sharded(self.dir, parent, self.compress, shard_size=8,
+                             n_threads=self.n_threads)
+
+        self.source_child = child
+        self.source_parent = parent
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_shards(self):
+        files = sorted(os.listdir(self.dir))
+        self.assertEqual(files, [
+            'manifest.json', 'shard00000.npz', 'shard00001.npz',
+            'shard00002.npz', 'shard00003.npz'])
+
+    def test_load(self):
+        target = link.Chain()
+        with target.init_scope():
+            target.parent_linear = links.Linear(3, 2)
+            target.child = link.Chain()
+            with target.child.init_scope():
+                target.child.child_linear = links.Linear(2, 3)
+        npz.load_npz_sharded(self.dir, target, n_threads=self.n_threads)
+
+        for name, param in self.source_parent.namedparams():
+            numpy.testing.assert_array_equal(
+                param.array, dict(target.namedparams())[name].array)
+
+    def test_load_with_path(self):
+        target = link.Chain()
+        with target.init_scope():
+            target.child_linear = links.Linear(2, 3)
+        npz.load_npz_sharded(self.dir, target, 'child/',
+                             n_threads=self.n_threads)
+        numpy.testing.assert_array_equal(
+            self.source_child.child_linear.W.array,
+            target.child_linear.W.array)
+
+    def test_load_with_strict(self):
+        target = link.Chain()
+        with target.init_scope():
+            target.parent_linear = links.Linear(3, 2)
+            target.other_linear = links.Linear(2, 3)
+        with self.assertRaises(KeyError):
+            npz.load_npz_sharded(self.dir, target)
+
+    def test_load_without_strict(self):
+        target = link.Chain()
+        with target.init_scope():
+            target.parent_linear = links.Linear(3, 2)
+            target.other_linear = links.Linear(2, 3)
+        npz.load_npz_sharded(self.dir, target, strict=False)
+        numpy.testing.assert_array_equal(
+            self.source_parent.parent_linear.W.array,
+            target.parent_linear.W.array)
+
+    def test_overwrite(self):
+        for param in self.source_parent.params():
+            param.array[...] = 1
+        npz.save_npz_sharded(self.dir, self.source_parent, self.compress,
+                             n_threads=self.n_threads)
+
+        self.assertEqual(sorted(os.listdir(self.dir)),
+                         ['manifest.json', 'shard00000.npz'])
+        self.assertEqual(os.listdir(self.root), ['checkpoint'])
+        target = link.Chain()
+        with target.init_scope():
+            target.parent_linear = links.Linear(3, 2)
+        npz.load_npz_sharded(self.dir, target, strict=False)
+        numpy.testing.assert_array_equal(target.parent_linear.W.array, 1)
+
+    def test_overwrite_other_directory(self):
+        os.remove(os.path.join(self.dir, 'manifest.json'))
+        with self.assertRaises(ValueError):
+            npz.save_npz_sharded(self.dir, self.source_parent)
+
+    def test_load_without_manifest(self):
+        os.remove(os.path.join(self.dir, 'manifest.json'))
+        with self.assertRaises(IOError):
+            npz.load_npz_sharded(self.dir, link.Chain())
+
+
 testing.run_module(__name__, __file__)
@@ -202,4 +202,68 @@ class TestFunctionNode(unittest.TestCase):
         self.check_backprop_step((self.gx1_orig, self.gx2_orig))
 
 
+class TestGradTableAccumulateInplace(unittest.TestCase):
+
+    def setUp(self):
+        self.gs = [chainer.Variable(numpy.random.uniform(
+            -1, 1, (2, 3)).astype(numpy.float32)) for _ in range(4)]
+        self.originals = [g.array.copy() for g in self.gs]
+
+    def test_reduce(self):
+        table = _backprop_utils.GradTable(accumulate_inplace=True)
+        node = chainer.Variable(self.originals[0]).node
+        grads = table.get_as_list(node)
+        grads.append(self.gs[0])
+        buf = None
+        for i, g in enumerate(self.gs[1:]):
+            grads.append(g)
+            ret = table.reduce(grads)
+            assert len(grads) == 1 and grads[0] is ret
+            if buf is None:
+                buf = ret
+            # The buffer is allocated only once
+            assert ret is buf
+            numpy.testing.assert_allclose(
+                ret.array, sum(self.originals[:i + 2]), rtol=1e-6)
+        # The given gradients are not modified
+        for g, original in zip(self.gs, self.originals):
+            numpy.testing.assert_array_equal(g.array, original)
+        assert all(buf is not g for g in self.gs)
+
+        assert table.pop(node) is buf
+        # A popped buffer is not modified anymore
+        grads = table.get_as_list(node)
+        grads.extend([buf, self.gs[0]])
+        ret = table.reduce(grads)
+        assert ret is not buf
+        numpy.testing.assert_allclose(buf.array, sum(self.originals),
+                                      rtol=1e-6)
+
+    def test_not_inplace(self):
+        table = _backprop_utils.GradTable()
+        grads = [self.gs[0], self.gs[1]]
+        ret = table.reduce(grads)
+        assert ret.creator is not None
+
+    def test_backward(self):
+        x = chainer.Variable(self.originals[0])
+        ys = [x * i for i in range(1, 5)]
+        y = chainer.functions.sum(sum(ys[1:], ys[0]))
+        with mock.patch.object(_backprop_utils, '_reduce',
+                               side_effect=_backprop_utils._reduce) as m:
+            y.backward()
+        for args, _ in m.call_args_list:
+            assert len(args[0]) < 2
+        numpy.testing.assert_allclose(x.grad, numpy.full((2, 3), 10.))
+
+    def test_double_backprop(self):
+        x = chainer.Variable(self.originals[0])
+        y = chainer.functions.sum(x * x + x * x)
+        y.backward(enable_double_backprop=True)
+        gx = x.grad_var
+        assert gx.creator is not None
+        numpy.testing.assert_allclose(gx.array, 4 * self.originals[0],
+                                      rtol=1e-6)
+
+
 testing.run_module(__name__, __file__)
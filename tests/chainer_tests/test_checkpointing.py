@@ -0,0 +1,176 @@
+import unittest
+
+import numpy
+
+import chainer
+from chainer.backends import cuda
+import chainer.functions as F
+from chainer.functions.util import forget
+import chainer.links as L
+from chainer.links.model.vision import resnet
+from chainer import testing
+from chainer.testing import attr
+
+
+def _forward_backward(model, forward, x_data, seed=0):
+    model.cleargrads()
+    x = chainer.Variable(x_data)
+    numpy.random.seed(seed)
+    y = forward(x)
+    y.grad = y.xp.ones_like(y.array)
+    y.backward()
+    grads = {name: cuda.to_cpu(param.grad)
+             for name, param in model.namedparams()}
+    return cuda.to_cpu(y.array), cuda.to_cpu(x.grad), grads
+
+
+@testing.parameterize(*testing.product({
+    'segments': [1, 2, 3, 10],
+}))
+class TestCheckpointSequential(unittest.TestCase):
+
+    def setUp(self):
+        self.model = chainer.Sequential(
+            L.Linear(3, 4), F.relu, L.Linear(4, 4), F.dropout,
+            chainer.Sequential(L.Linear(4, 4), F.tanh), L.Linear(4, 2))
+        self.x = numpy.random.uniform(-1, 1, (5, 3)).astype(numpy.float32)
+
+    def check(self, x_data):
+        expected = _forward_backward(self.model, self.model, x_data)
+        actual = _forward_backward(
+            self.model, chainer.checkpoint(self.model, self.segments),
+            x_data)
+        testing.assert_allclose(actual[0], expected[0])
+        testing.assert_allclose(actual[1], expected[1])
+        for name, grad in expected[2].items():
+            testing.assert_allclose(actual[2][name], grad)
+
+    def test_cpu(self):
+        self.check(self.x)
+
+    def test_graph(self):
+        f = chainer.checkpoint(self.model, self.segments)
+        y = f(self.x)
+        n_forgets = 0
+        creator = y.creator
+        while creator is not None:
+            if isinstance(creator, forget.Forget):
+                n_forgets += 1
+            creator = creator.inputs[0].creator
+        # The nested Sequential is split into its layers
+        self.assertEqual(n_forgets, min(self.segments, 7) - 1)
+
+    def test_no_backprop_mode(self):
+        f = chainer.checkpoint(self.model, self.segments)
+        with chainer.no_backprop_mode():
+            y = f(self.x)
+        self.assertIsNone(y.creator)
+
+
+class TestCheckpointChainList(unittest.TestCase):
+
+    def test_chain_list(self):
+        model = chainer.ChainList(
+            L.Linear(3, 4), L.Linear(4, 4), L.Linear(4, 2))
+        x = numpy.random.uniform(-1, 1, (5, 3)).astype(numpy.float32)
+
+        def forward(x):
+            for l in model:
+                x = l(x)
+            return x
+
+        expected = _forward_backward(model, forward, x)
+        actual = _forward_backward(model, chainer.checkpoint(model, 2), x)
+        testing.assert_allclose(actual[0], expected[0])
+        testing.assert_allclose(actual[1], expected[1])
+        for name, grad in expected[2].items():
+            testing.assert_allclose(actual[2][name], grad)
+
+    def test_list_of_callables(self):
+        l1 = L.Linear(3, 2)
+        f = chainer.checkpoint([l1, F.relu, lambda x: (x, x), F.add], 3)
+        x = numpy.random.uniform(-1, 1, (5, 3)).astype(numpy.float32)
+        y = f(x)
+        testing.assert_allclose(y.array, 2 * F.relu(l1(x)).array)
+
+
+class TestCheckpointResNet(unittest.TestCase):
+
+    def test_building_block(self):
+        block = resnet.BuildingBlock(3, 4, 2, 4, 1)
+        self.assertEqual(list(block.functions), ['a', 'b1', 'b2'])
+        x = numpy.random.uniform(-1, 1, (2, 4, 5, 5)).astype(numpy.float32)
+
+        expected = _forward_backward(block, block, x)
+        actual = _forward_backward(block, chainer.checkpoint(block, 3), x)
+        testing.assert_allclose(actual[0], expected[0], atol=1e-4)
+        testing.assert_allclose(actual[1], expected[1], atol=1e-4)
+        for name, grad in expected[2].items():
+            testing.assert_allclose(actual[2][name], grad, atol=1e-4)
+
+    def test_building_block_statistics(self):
+        block = resnet.BuildingBlock(3, 4, 2, 4, 1)
+        checkpointed = block.copy(mode='copy')
+        x = numpy.random.uniform(-1, 1, (2, 4, 5, 5)).astype(numpy.float32)
+
+        _forward_backward(block, block, x)
+        _forward_backward(
+            checkpointed, chainer.checkpoint(checkpointed, 3), x)
+        bns = [(name, link) for name, link in block.namedlinks()
+               if isinstance(link, L.BatchNormalization)]
+        self.assertTrue(bns)
+        links = dict(checkpointed.namedlinks())
+        for name, bn in bns:
+            testing.assert_allclose(links[name].avg_mean, bn.avg_mean)
+            testing.assert_allclose(links[name].avg_var, bn.avg_var)
+
+    def test_batch_renormalization_statistics(self):
+        model = chainer.Sequential(
+            L.Linear(3, 4), L.BatchRenormalization(4), F.relu,
+            L.Linear(4, 2))
+        checkpointed = model.copy(mode='copy')
+        x = numpy.random.uniform(-1, 1, (5, 3)).astype(numpy.float32)
+
+        _forward_backward(model, model, x)
+        _forward_backward(
+            checkpointed, chainer.checkpoint(checkpointed, 2), x)
+        testing.assert_allclose(checkpointed[1].avg_mean, model[1].avg_mean)
+        testing.assert_allclose(checkpointed[1].avg_var, model[1].avg_var)
+
+    @attr.slow
+    def test_resnet50(self):
+        model = L.ResNet50Layers(pretrained_model=None)
+        x = numpy.random.uniform(
+            -1, 1, (2, 3, 32, 32)).astype(numpy.float32)
+
+        def forward(x):
+            return model(x, layers=['fc6'])['fc6']
+
+        layers = [f for name, funcs in model.functions.items()
+                  if name != 'prob' for f in funcs]
+        expected = _forward_backward(model, forward, x)
+        actual = _forward_backward(model, chainer.checkpoint(layers, 4), x)
+        testing.assert_allclose(actual[0], expected[0], atol=1e-4)
+        for name, grad in expected[2].items():
+            testing.assert_allclose(
+                actual[2][name], grad, atol=1e-3, rtol=1e-3)
+
+
+class TestCheckpointInvalid(unittest.TestCase):
+
+    def test_invalid_segments(self):
+        with self.assertRaises(ValueError):
+            chainer.checkpoint(chainer.Sequential(F.relu), 0)
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            chainer.checkpoint(chainer.Sequential(), 1)
+
+    def test_not_callable(self):
+        with self.assertRaises(TypeError):
+            chainer.checkpoint(1)
+        with self.assertRaises(TypeError):
+            chainer.checkpoint([F.relu, 1])
+
+
+testing.run_module(__name__, __file__)
@@ -556,6 +556,140 @@ class TestBackpropModeMultiThread(unittest.TestCase):
         self.assertTrue(t.creator_is_none)
 
 
+class TestFunctionNodeFastPath(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (2, 3)).astype(numpy.float32)
+        self.f = chainer.FunctionNode()
+        self.f.forward = mock.MagicMock(return_value=(self.x * 2,))
+        self.f._forward_fast = mock.MagicMock(
+            side_effect=self.f._forward_fast)
+
+    def apply(self):
+        y, = self.f.apply((chainer.Variable(self.x),))
+        numpy.testing.assert_array_equal(y.data, self.x * 2)
+        self.assertIs(y.creator_node, self.f)
+        return y
+
+    def test_fast_path(self):
+        with chainer.using_config('type_check', False):
+            self.apply()
+        self.assertEqual(self.f._forward_fast.call_count, 1)
+
+    def test_type_check(self):
+        with chainer.using_config('type_check', True):
+            self.apply()
+        self.assertEqual(self.f._forward_fast.call_count, 0)
+
+    def test_debug(self):
+        with chainer.using_config('type_check', False), \
+                chainer.using_config('debug', True):
+            self.apply()
+        self.assertEqual(self.f._forward_fast.call_count, 0)
+        self.assertIsNotNone(self.f.stack)
+
+    def test_reenable_after_config_change(self):
+        with chainer.using_config('type_check', False):
+            self.apply()
+            with chainer.using_config('debug', True):
+                self.apply()
+            self.apply()
+        self.assertEqual(self.f._forward_fast.call_count, 2)
+
+    def test_global_hook(self):
+        with chainer.using_config('type_check', False), \
+                chainer.function_hooks.TimerHook() as hook:
+            self.apply()
+        self.assertEqual(self.f._forward_fast.call_count, 0)
+        self.assertEqual(len(hook.call_history), 1)
+
+    def test_local_hook(self):
+        hook = chainer.function_hooks.TimerHook()
+        self.f.add_hook(hook)
+        with chainer.using_config('type_check', False):
+            self.apply()
+        self.assertEqual(self.f._forward_fast.call_count, 0)
+        self.assertEqual(len(hook.call_history), 1)
+
+    def test_invalid_output(self):
+        self.f.forward = mock.MagicMock(return_value=[self.x])
+        with chainer.using_config('type_check', False):
+            with self.assertRaises(TypeError):
+                self.f.apply((self.x,))
+
+    def test_multi_thread(self):
+        enabled = []
+
+        def run():
+            with chainer.using_config('debug', True):
+                enabled.append(chainer.function_node._get_apply_mode()[0])
+
+        with chainer.using_config('type_check', False):
+            self.assertTrue(chainer.function_node._get_apply_mode()[0])
+            t = threading.Thread(target=run)
+            t.start()
+            t.join()
+            self.assertTrue(chainer.function_node._get_apply_mode()[0])
+        self.assertEqual(enabled, [False])
+
+
+@testing.parameterize(*testing.product({
+    'type_check': [True, False],
+}))
+class TestFunctionNodeGraphFree(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (2, 3)).astype(numpy.float32)
+        self.v = chainer.Variable(self.x)
+
+    def apply(self, f, *inputs):
+        with chainer.using_config('graph_free', True), \
+                chainer.using_config('type_check', self.type_check):
+            return f.apply(inputs)
+
+    def test_apply(self):
+        f = chainer.FunctionNode()
+        f.forward = mock.MagicMock(return_value=(self.x * 2,))
+        y, = self.apply(f, self.v, self.x)
+
+        self.assertIsInstance(y, chainer.Variable)
+        numpy.testing.assert_array_equal(y.data, self.x * 2)
+        self.assertFalse(y.requires_grad)
+        self.assertNotIn('_node', y.__dict__)
+        self.assertIsNone(f.inputs)
+        self.assertIsNone(f.outputs)
+        self.assertEqual(f.rank, 0)
+        in_data, = f.forward.call_args[0]
+        self.assertIs(in_data[0], self.x)
+        self.assertIs(in_data[1], self.x)
+
+    def test_chain(self):
+        with chainer.using_config('graph_free', True):
+            y = chainer.functions.relu(self.v * 2 + 1)
+        numpy.testing.assert_array_equal(
+            y.data, numpy.maximum(self.x * 2 + 1, 0))
+        self.assertIsNone(y.creator)
+
+    def test_lazy_node(self):
+        f = chainer.FunctionNode()
+        f.forward = mock.MagicMock(return_value=(self.x,))
+        y, = self.apply(f, self.v)
+        node = y.node
+        self.assertIs(node.get_variable(), y)
+        self.assertIs(y.node, node)
+        self.assertIsNone(y.name)
+        self.assertEqual(node.shape, self.x.shape)
+        self.assertIsNone(node.creator_node)
+
+    def test_hook(self):
+        hook = chainer.function_hooks.TimerHook()
+        f = chainer.FunctionNode()
+        f.forward = mock.MagicMock(return_value=(self.x,))
+        with hook:
+            self.apply(f, self.v)
+        self.assertEqual(len(hook.call_history), 1)
+
+
 class FunctionNodeWithRetaining(chainer.FunctionNode):
 
     def forward(self, inputs):
@@ -1683,6 +1683,122 @@ class TestChainListRepeat(unittest.TestCase):
         self.assertEqual(ret[0][0].x.dtype, ret[1][0].x.dtype)
 
 
+class TestParameterArena(unittest.TestCase):
+
+    def setUp(self):
+        self.l1 = chainer.Link()
+        with self.l1.init_scope():
+            self.l1.x = chainer.Parameter(
+                numpy.arange(6, dtype='f').reshape(2, 3))
+        self.l2 = chainer.Link()
+        with self.l2.init_scope():
+            self.l2.x = chainer.Parameter(numpy.arange(3, dtype='f'))
+            self.l2.y = chainer.Parameter(numpy.ones((), dtype='f'))
+        self.c = chainer.Chain()
+        with self.c.init_scope():
+            self.c.l1 = self.l1
+            self.c.l2 = self.l2
+
+    def check_views(self, arena):
+        data, grad = arena._data, arena._grad
+        offset = 0
+        for param in arena.params:
+            self.assertIs(param.array.base, data.base or data)
+            self.assertIs(param.grad.base, grad.base or grad)
+            numpy.testing.assert_array_equal(
+                cuda.to_cpu(data[offset:offset + param.size]),
+                cuda.to_cpu(param.array).ravel())
+            offset += param.size
+        self.assertEqual(offset, data.size)
+
+    def test_allocate_arena(self):
+        arena = self.c.allocate_arena()
+        self.assertIs(self.c.arena, arena)
+        self.assertIs(self.c.allocate_arena(), arena)
+        self.assertIsNone(self.l1.arena)
+        self.assertEqual(
+            [p.name for p in arena.params], ['x', 'x', 'y'])
+        self.check_views(arena)
+        numpy.testing.assert_array_equal(
+            arena.data, [0, 1, 2, 3, 4, 5, 0, 1, 2, 1])
+        numpy.testing.assert_array_equal(arena.grad, numpy.zeros(10))
+
+    def test_sync_replaced_arrays(self):
+        arena = self.c.allocate_arena()
+        self.l1.x.grad = numpy.full((2, 3), 2, dtype='f')
+        self.l2.y.array = numpy.array(5, dtype='f')
+        self.l2.x.cleargrad()
+        numpy.testing.assert_array_equal(
+            arena.grad, [2, 2, 2, 2, 2, 2, 0, 0, 0, 0])
+        numpy.testing.assert_array_equal(
+            arena.data, [0, 1, 2, 3, 4, 5, 0, 1, 2, 5])
+        self.check_views(arena)
+
+    def test_backward(self):
+        arena = self.c.allocate_arena()
+        self.c.cleargrads()
+        loss = chainer.functions.sum(self.l2.x * 2)
+        loss.backward()
+        numpy.testing.assert_array_equal(
+            arena.grad, [0, 0, 0, 0, 0, 0, 2, 2, 2, 0])
+        self.check_views(arena)
+
+    def test_copyparams(self):
+        arena = self.c.allocate_arena()
+        c = self.c.copy(mode='copy')
+        self.assertIsNone(c.arena)
+        self.assertIsNone(c.l1.x._arena)
+        c.l1.x.array[...] = 7
+        self.c.copyparams(c)
+        numpy.testing.assert_array_equal(
+            arena.data, [7, 7, 7, 7, 7, 7, 0, 1, 2, 1])
+        self.check_views(arena)
+
+    def test_addgrads(self):
+        arena = self.c.allocate_arena()
+        c = self.c.copy(mode='copy')
+        for param in c.params():
+            param.grad = numpy.ones_like(param.array)
+        arena.grad[...] = 1
+        self.c.addgrads(c)
+        self.check_views(arena)
+        numpy.testing.assert_array_equal(arena.grad, numpy.full(10, 2))
+
+    def test_share_copy(self):
+        self.c.allocate_arena()
+        c = self.c.copy(mode='share')
+        self.assertIsNone(c.arena)
+        self.assertIsNone(c.l1.x._arena)
+        self.assertIs(c.l1.x.array, self.l1.x.array)
+
+    def test_mixed_dtypes(self):
+        with self.l2.init_scope():
+            self.l2.z = chainer.Parameter(numpy.zeros(2, dtype='d'))
+        with self.assertRaises(ValueError):
+            self.c.allocate_arena()
+
+    def test_uninitialized_param(self):
+        with self.l2.init_scope():
+            self.l2.z = chainer.Parameter()
+        with self.assertRaises(ValueError):
+            self.c.allocate_arena()
+
+    def test_nested_arena(self):
+        self.l1.allocate_arena()
+        with self.assertRaises(ValueError):
+            self.c.allocate_arena()
+
+    @attr.gpu
+    def test_to_gpu(self):
+        arena = self.c.allocate_arena()
+        self.c.to_gpu()
+        self.assertIsInstance(arena._data, cuda.ndarray)
+        self.check_views(arena)
+        self.c.to_cpu()
+        self.assertIsInstance(arena._data, numpy.ndarray)
+        self.check_views(arena)
+
+
 @attr.ideep
 class TestIntel64(unittest.TestCase):
 
@@ -370,6 +370,177 @@ class TestGradientMethodLossScale(unittest.TestCase):
         self.check_update()
 
 
+@testing.parameterize(*testing.product({
+    'impl': [optimizers.SGD, optimizers.MomentumSGD, optimizers.Adam,
+             optimizers.RMSprop],
+    'dtype': [np.float32, np.float64],
+}))
+class TestGradientMethodFusedUpdate(unittest.TestCase):
+
+    shapes = [(3, 2), (4,), (), (2, 2, 1)]
+
+    def setUp(self):
+        self.data = [np.random.uniform(-1, 1, shape).astype(self.dtype)
+                     for shape in self.shapes]
+        self.grads = [
+            [np.random.uniform(-1, 1, shape).astype(self.dtype)
+             for shape in self.shapes]
+            for _ in range(3)]
+
+    def create_target(self):
+        return chainer.ChainList(*[
+            SimpleLink(data.copy(), np.zeros_like(data))
+            for data in self.data])
+
+    def run_updates(self, target, fused):
+        opt = self.impl()
+        opt.setup(target)
+        if fused:
+            opt.use_fused_update()
+        for grads in self.grads:
+            for link, grad in zip(target, grads):
+                link.param.grad = grad.copy()
+            opt.update()
+        return opt
+
+    def check_fused_update(self, xp):
+        expected = self.create_target()
+        actual = self.create_target()
+        if xp is not np:
+            expected.to_gpu()
+            actual.to_gpu()
+        self.run_updates(expected, False)
+        opt = self.run_updates(actual, True)
+
+        groups = opt._fused_groups
+        self.assertEqual(len(groups.unfused), 0)
+        self.assertEqual(len(groups.groups), 1)
+        flat = groups.groups[0].data
+        for link_expected, link_actual in zip(expected, actual):
+            param = link_actual.param
+            self.assertIs(param.array.base, flat.base or flat)
+            self.assertEqual(param.update_rule.t, len(self.grads))
+            testing.assert_allclose(
+                param.array, link_expected.param.array)
+            for name, value in link_expected.param.update_rule.state.items():
+                testing.assert_allclose(param.update_rule.state[name], value)
+
+    def test_fused_update_cpu(self):
+        self.check_fused_update(np)
+
+    @attr.gpu
+    def test_fused_update_gpu(self):
+        self.check_fused_update(cuda.cupy)
+
+
+@testing.parameterize(*testing.product({
+    'release_retained': [None, False, True],
+}))
+class TestGradientMethodReleaseRetained(unittest.TestCase):
+
+    def setUp(self):
+        self.target = SimpleLink(np.arange(3).astype(np.float32),
+                                 np.zeros(3, dtype=np.float32))
+        self.optimizer = optimizers.SGD(lr=1)
+        self.optimizer.setup(self.target)
+        if self.release_retained is not None:
+            self.optimizer.use_release_retained(self.release_retained)
+
+    def test_update(self):
+        outputs = []
+
+        def lossfun():
+            y = chainer.functions.tanh(self.target.param)
+            outputs.append(y)
+            return chainer.functions.sum(y)
+
+        with mock.patch.object(
+                chainer.Variable, 'backward', autospec=True) as backward:
+            self.optimizer.update(lossfun)
+        self.assertEqual(backward.call_count, 1)
+        self.assertEqual(
+            backward.call_args[1]['release_retained'],
+            bool(self.release_retained))
+
+    def test_backward_again_by_default(self):
+        if self.release_retained:
+            return
+        outputs = []
+
+        def lossfun():
+            y = chainer.functions.tanh(self.target.param)
+            outputs.append(y)
+            return chainer.functions.sum(y)
+
+        self.optimizer.update(lossfun)
+        y, = outputs
+        y.grad = np.ones_like(y.array)
+        y.backward()
+        self.assertIsNotNone(self.target.param.grad)
+
+
+class TestGradientMethodFusedUpdateRegroup(unittest.TestCase):
+
+    def setUp(self):
+        self.target = chainer.ChainList(
+            SimpleLink(np.arange(3).astype(np.float32),
+                       np.ones(3, dtype=np.float32)),
+            SimpleLink(np.arange(2).astype(np.float32),
+                       np.ones(2, dtype=np.float32)))
+        self.optimizer = optimizers.SGD(lr=1)
+        self.optimizer.setup(self.target)
+        self.optimizer.use_fused_update()
+
+    def test_unfused_rule_with_hook(self):
+        rule = self.target[1].param.update_rule
+        rule.add_hook(lambda rule, param: None, name='hook')
+        self.optimizer.update()
+        groups = self.optimizer._fused_groups
+        self.assertEqual(groups.unfused, [self.target[1].param])
+        np.testing.assert_array_equal(
+            self.target[0].param.array, np.arange(3) - 1)
+        np.testing.assert_array_equal(
+            self.target[1].param.array, np.arange(2) - 1)
+
+        rule.remove_hook('hook')
+        self.optimizer.update()
+        self.assertIsNot(self.optimizer._fused_groups, groups)
+        self.assertEqual(self.optimizer._fused_groups.unfused, [])
+
+    def test_regroup_after_replacing_array(self):
+        self.optimizer.update()
+        groups = self.optimizer._fused_groups
+        self.target[0].param.array = np.zeros(3, dtype=np.float32)
+        self.optimizer.update()
+        self.assertIsNot(self.optimizer._fused_groups, groups)
+        np.testing.assert_array_equal(
+            self.target[0].param.array, -np.ones(3))
+        np.testing.assert_array_equal(
+            self.target[1].param.array, np.arange(2) - 2)
+
+    def test_arena(self):
+        arena = self.target.allocate_arena()
+        self.optimizer.update()
+        groups = self.optimizer._fused_groups.groups
+        self.assertEqual(len(groups), 1)
+        self.assertIs(groups[0].data, arena.data)
+        np.testing.assert_array_equal(arena.data, [-1, 0, 1, -1, 0])
+
+        self.target[1].param.update_rule.hyperparam.lr = 2
+        self.optimizer.update()
+        self.assertEqual(self.optimizer._fused_groups.groups, [])
+        np.testing.assert_array_equal(arena.data, [-2, -1, 0, -3, -2])
+
+    def test_different_hyperparams(self):
+        self.target[1].param.update_rule.hyperparam.lr = 2
+        self.optimizer.update()
+        self.assertEqual(len(self.optimizer._fused_groups.groups), 2)
+        np.testing.assert_array_equal(
+            self.target[0].param.array, np.arange(3) - 1)
+        np.testing.assert_array_equal(
+            self.target[1].param.array, np.arange(2) - 2)
+
+
 class TestCleargradHook(unittest.TestCase):
 
     def setUp(self):
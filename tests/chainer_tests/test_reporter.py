@@ -375,6 +375,50 @@ class TestDictSummary(unittest.TestCase):
 
         self.check(summary, {'cupy': (3., 1., 2., 3.)})
 
+    @attr.gpu
+    def test_cupy_sparse(self):
+        xp = cuda.cupy
+        self.summary.add({'a': xp.array(3, 'f'), 'b': xp.array(1, 'f')})
+        self.summary.add({'a': xp.array(1, 'f'), 'b': 5., 'c': 9.})
+        self.summary.add({'b': xp.array(6, 'f')})
+        self.summary.add({'a': 3., 'b': numpy.array(5, 'f'),
+                          'c': xp.array(8, 'f'), 'd': 2})
+
+        self.check(self.summary, {
+            'a': (3., 1., 3.),
+            'b': (1., 5., 6., 5.),
+            'c': (9., 8.),
+            'd': (2,),
+        })
+
+    @attr.gpu
+    def test_cupy_weight(self):
+        xp = cuda.cupy
+        self.summary.add({'a': (xp.array(1, 'f'), 0.5), 'b': xp.array(1, 'f')})
+        self.summary.add({'a': (xp.array(2, 'f'), xp.array(0.4, 'f'))})
+        self.summary.add({'a': (xp.array(3, 'f'), numpy.array(0.3, 'f'))})
+
+        mean = self.summary.compute_mean()
+        val = (1 * 0.5 + 2 * 0.4 + 3 * 0.3) / (0.5 + 0.4 + 0.3)
+        testing.assert_allclose(mean['a'], val)
+        testing.assert_allclose(mean['b'], 1.)
+
+    @attr.gpu
+    def test_serialize_cupy_sparse(self):
+        xp = cuda.cupy
+        self.summary.add({'a': xp.array(3, 'f'), 'b': 1.})
+        self.summary.add({'a': xp.array(1, 'f'), 'c': xp.array(9, 'f')})
+
+        summary = chainer.reporter.DictSummary()
+        testing.save_and_load_npz(self.summary, summary)
+        summary.add({'a': xp.array(3, 'f'), 'b': 5., 'c': xp.array(8, 'f')})
+
+        self.check(summary, {
+            'a': (3., 1., 3.),
+            'b': (1., 5.),
+            'c': (9., 8.),
+        })
+
     def test_serialize_names_with_slash(self):
         self.summary.add({'a/b': 3., '/a/b': 1., 'a/b/': 4.})
         self.summary.add({'a/b': 1., '/a/b': 5., 'a/b/': 9.})
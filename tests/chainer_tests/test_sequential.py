@@ -7,6 +7,7 @@ import mock
 import numpy
 import six
 
+import chainer
 from chainer import cuda
 from chainer import functions
 from chainer import links
@@ -372,6 +373,16 @@ class TestSequential(unittest.TestCase):
         y = self.s1(x)
         self.assertIs(y.creator.inputs[1].data, self.l2.W.data)
 
+    def test_call_graph_free(self):
+        x = numpy.arange(2).reshape(1, 2).astype('f')
+        expected = self.s2(x).data
+        with chainer.using_config('graph_free', True):
+            y = self.s2(x)
+        self.assertIsInstance(y, variable.Variable)
+        self.assertNotIn('_node', y.__dict__)
+        self.assertFalse(y.requires_grad)
+        numpy.testing.assert_array_equal(y.data, expected)
+
     def test_call_with_multiple_inputs(self):
         model = sequential.Sequential(
             lambda x, y: (x * 2, y * 3, x + y),
@@ -1836,6 +1836,59 @@ class TestAsVariable(unittest.TestCase):
         assert y.requires_grad
 
 
+class TestBackwardReleaseRetained(unittest.TestCase):
+
+    def setUp(self):
+        self.x = np.random.uniform(-1, 1, (3, 2)).astype(np.float32)
+
+    def forward(self):
+        x = chainer.Variable(self.x)
+        h = F.sin(x)  # retains the input
+        # h is consumed by functions with different ranks
+        y = F.exp(F.tanh(F.sin(h))) * F.cos(h)
+        loss = F.sum(y)
+        return x, h, y, loss
+
+    def test_gradients(self):
+        x1, _, _, loss1 = self.forward()
+        loss1.backward()
+        x2, _, _, loss2 = self.forward()
+        loss2.backward(release_retained=True)
+        testing.assert_allclose(x1.grad, x2.grad)
+
+    def test_release(self):
+        x, h, y, loss = self.forward()
+        h_node = h.node
+        exp = y.creator.inputs[0].creator
+        del h, y
+        assert h_node.data is not None
+        assert exp._retained_output_data is not None
+
+        loss.backward(release_retained=True)
+
+        assert h_node.data is None
+        assert h_node.shape == (3, 2)
+        assert h_node.dtype == np.float32
+        assert exp._retained_output_data is None
+        assert x.node.data is None
+        assert x.data is not None
+
+    def test_keep_by_default(self):
+        x, h, y, loss = self.forward()
+        loss.backward()
+        assert h.node.data is not None
+        assert x.node.data is not None
+
+    def test_double_backprop(self):
+        x, h, y, loss = self.forward()
+        loss.backward(enable_double_backprop=True, release_retained=True)
+        assert h.node.data is not None
+        gx = x.grad_var
+        x.cleargrad()
+        F.sum(gx).backward()
+        assert x.grad is not None
+
+
 @testing.parameterize(*testing.product({
     'in_shape': [(4, 3, 2)],
     'dtype': [np.float16, np.float32, np.float64],
@@ -0,0 +1,140 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from chainer.serializers import npz
+from chainer import testing
+from chainer.training import extensions
+
+
+class TestLogReport(unittest.TestCase):
+
+    def setUp(self):
+        self.trainer = testing.get_trainer_with_mock_updater()
+        self.trainer.out = tempfile.mkdtemp()
+        self.trainer._done = True
+
+    def tearDown(self):
+        shutil.rmtree(self.trainer.out)
+
+    def _update(self, log_report, n):
+        for _ in range(n):
+            self.trainer.updater.update()
+            log_report(self.trainer)
+
+    def _read_lines(self, name):
+        with open(os.path.join(self.trainer.out, name)) as f:
+            return [json.loads(line) for line in f]
+
+    def test_json(self):
+        log_report = extensions.LogReport(trigger=(1, 'iteration'))
+        self._update(log_report, 3)
+
+        with open(os.path.join(self.trainer.out, 'log')) as f:
+            log = json.load(f)
+        self.assertEqual([e['iteration'] for e in log], [1, 2, 3])
+        self.assertEqual(log_report.log, log)
+        self.assertEqual(log_report.log_offset, 0)
+
+    def test_max_log_length(self):
+        log_report = extensions.LogReport(
+            trigger=(1, 'iteration'), max_log_length=2)
+        self._update(log_report, 3)
+
+        with open(os.path.join(self.trainer.out, 'log')) as f:
+            log = json.load(f)
+        self.assertEqual([e['iteration'] for e in log], [2, 3])
+        self.assertEqual(log_report.log, log)
+        self.assertEqual(log_report.log_offset, 1)
+
+    def test_json_lines(self):
+        log_report = extensions.LogReport(
+            trigger=(1, 'iteration'), log_name='log.jsonl', max_log_length=1)
+        self._update(log_report, 3)
+
+        log = self._read_lines('log.jsonl')
+        self.assertEqual([e['iteration'] for e in log], [1, 2, 3])
+        self.assertEqual(log_report.log, log[-1:])
+
+    def test_json_lines_overwrite(self):
+        with open(os.path.join(self.trainer.out, 'log'), 'w') as f:
+            f.write('{"iteration": 0}\n')
+        log_report = extensions.LogReport(
+            trigger=(1, 'iteration'), format='json-lines')
+        self._update(log_report, 1)
+
+        log = self._read_lines('log')
+        self.assertEqual([e['iteration'] for e in log], [1])
+
+    def test_json_lines_resume(self):
+        log_report = extensions.LogReport(
+            trigger=(1, 'iteration'), log_name='log.jsonl')
+        self._update(log_report, 2)
+        target = {}
+        log_report.serialize(npz.DictionarySerializer(target))
+        self._update(log_report, 2)
+
+        log_report = extensions.LogReport(
+            trigger=(1, 'iteration'), log_name='log.jsonl')
+        log_report.serialize(npz.NpzDeserializer(target))
+        self.trainer.updater.iteration = 2
+        self._update(log_report, 1)
+
+        log = self._read_lines('log.jsonl')
+        self.assertEqual([e['iteration'] for e in log], [1, 2, 3])
+        self.assertEqual(log_report.log, log)
+
+    def test_deserialize_old_snapshot(self):
+        log_report = extensions.LogReport(trigger=(1, 'iteration'))
+        self._update(log_report, 2)
+        target = {}
+        log_report.serialize(npz.DictionarySerializer(target))
+        # snapshots of older versions do not have the state
+        del target['_state']
+
+        for strict in (True, False):
+            log_report = extensions.LogReport(trigger=(1, 'iteration'))
+            log_report.serialize(npz.NpzDeserializer(target, strict=strict))
+            self.assertEqual(
+                [e['iteration'] for e in log_report.log], [1, 2])
+            self.assertEqual(log_report.log_offset, 0)
+
+    def test_fsync_interval(self):
+        log_report = extensions.LogReport(
+            trigger=(1, 'iteration'), log_name='log.jsonl', fsync_interval=2)
+        with mock.patch('os.fsync') as fsync:
+            self._update(log_report, 3)
+            self.assertEqual(fsync.call_count, 1)
+            log_report.finalize()
+            self.assertEqual(fsync.call_count, 2)
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            extensions.LogReport(format='yaml')
+
+
+class TestLogReportPrintReport(unittest.TestCase):
+
+    def test_max_log_length(self):
+        trainer = testing.get_trainer_with_mock_updater()
+        trainer._done = True
+        log_report = extensions.LogReport(
+            trigger=(1, 'iteration'), log_name=None, max_log_length=1)
+        out = mock.MagicMock()
+        print_report = extensions.PrintReport(
+            ['iteration'], log_report=log_report, out=out)
+        for _ in range(2):
+            trainer.updater.update()
+            print_report(trainer)
+
+        lines = ''.join(c[0][0] for c in out.write.call_args_list)
+        self.assertEqual(lines.count('\n'), 3)
+        self.assertIn('1 ', lines)
+        self.assertIn('2 ', lines)
+
+
+testing.run_module(__name__, __file__)
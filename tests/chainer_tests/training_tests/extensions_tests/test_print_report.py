@@ -25,6 +25,7 @@ class TestPrintReport(unittest.TestCase):
         self.trainer.extend(self.logreport)
         self.trainer.extend(self.report)
         self.logreport.log = [{'epoch': 0}]
+        self.logreport.log_offset = 0
 
     def test_stream_with_flush_is_flushed(self):
         self._setup(delete_flush=False)
@@ -1,10 +1,16 @@
 import os
+import shutil
+import tempfile
 import unittest
 
 import mock
+import numpy
 
+import chainer
+from chainer import serializers
 from chainer import testing
 from chainer.training import extensions
+from chainer.training.extensions import _snapshot
 
 
 class TestSnapshotObject(unittest.TestCase):
@@ -48,4 +54,113 @@ class TestSnapshotSaveFile(unittest.TestCase):
         self.assertEqual(len(left_tmps), 0)
 
 
+class TestSnapshotDirectory(unittest.TestCase):
+
+    def setUp(self):
+        self.trainer = testing.get_trainer_with_mock_updater()
+        self.trainer.out = tempfile.mkdtemp()
+        self.trainer._done = True
+
+    def tearDown(self):
+        shutil.rmtree(self.trainer.out)
+
+    def test_overwrite(self):
+        target = chainer.Link()
+        with target.init_scope():
+            target.x = chainer.Parameter(numpy.zeros(3, dtype='f'))
+        snapshot = extensions.snapshot_object(
+            target, 'snap', savefun=serializers.save_npz_sharded)
+        snapshot(self.trainer)
+        target.x.array[:] = 1
+        snapshot(self.trainer)
+
+        path = os.path.join(self.trainer.out, 'snap')
+        self.assertEqual(os.listdir(self.trainer.out), ['snap'])
+        self.assertNotIn('snap', os.listdir(path))
+        target.x.array[:] = 0
+        serializers.load_npz_sharded(path, target)
+        numpy.testing.assert_array_equal(target.x.array, [1, 1, 1])
+
+
+class TestSnapshotAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.trainer = testing.get_trainer_with_mock_updater()
+        self.trainer.out = '.'
+        self.trainer._done = True
+        self.target = chainer.Link()
+        with self.target.init_scope():
+            self.target.x = chainer.Parameter(numpy.arange(3, dtype='f'))
+
+    def tearDown(self):
+        if os.path.exists('myfile.npz'):
+            os.remove('myfile.npz')
+
+    def test_save_file(self):
+        snapshot = extensions.snapshot_object(
+            self.target, 'myfile.npz', async_write=True)
+        observation = {}
+        with chainer.Reporter().scope(observation):
+            snapshot(self.trainer)
+        # The arrays are copied before being written.
+        self.target.x.array[:] = -1
+        snapshot.finalize()
+
+        self.assertIn('snapshot/stall_time', observation)
+        self.assertTrue(os.path.exists('myfile.npz'))
+        left_tmps = [fn for fn in os.listdir('.')
+                     if fn.startswith('tmpmyfile.npz')]
+        self.assertEqual(len(left_tmps), 0)
+        target = chainer.Link()
+        with target.init_scope():
+            target.x = chainer.Parameter(numpy.zeros(3, dtype='f'))
+        serializers.load_npz('myfile.npz', target)
+        numpy.testing.assert_array_equal(target.x.array, [0, 1, 2])
+
+    def test_savefun(self):
+        def save(path, target):
+            open(path, 'w').close()
+
+        savefun = mock.MagicMock(side_effect=save)
+        snapshot = extensions.snapshot_object(
+            self.target, 'myfile.npz', savefun=savefun, async_write=True)
+        with chainer.Reporter().scope({}):
+            snapshot(self.trainer)
+        snapshot.finalize()
+
+        self.assertEqual(savefun.call_count, 1)
+        serializer = mock.MagicMock()
+        savefun.call_args[0][1].serialize(serializer)
+        self.assertEqual(serializer.call_args[0][0], 'x')
+        numpy.testing.assert_array_equal(
+            serializer.call_args[0][1], [0, 1, 2])
+
+    def test_state_copy(self):
+        obj = mock.MagicMock()
+        x = numpy.arange(3, dtype='f')
+
+        def serialize(serializer):
+            serializer('none', None)
+            serializer['child']('x', x)
+        obj.serialize.side_effect = serialize
+        state = _snapshot._StateCopy(obj)
+        x[:] = -1
+
+        serializer = mock.MagicMock()
+        state.serialize(serializer)
+        values = {c[0][0]: c[0][1] for c in serializer.call_args_list}
+        self.assertEqual(sorted(values), ['child/x', 'none'])
+        self.assertIsNone(values['none'])
+        numpy.testing.assert_array_equal(values['child/x'], [0, 1, 2])
+
+    def test_error(self):
+        savefun = mock.MagicMock(side_effect=ValueError)
+        snapshot = extensions.snapshot_object(
+            self.target, 'myfile.npz', savefun=savefun, async_write=True)
+        with chainer.Reporter().scope({}):
+            snapshot(self.trainer)
+        with self.assertRaises(ValueError):
+            snapshot.finalize()
+
+
 testing.run_module(__name__, __file__)